@@ -124,6 +124,260 @@ class ReportingSettings(BaseModel):
     )
 
 
+class RateLimitBucketSettings(BaseModel):
+    """Token bucket size for one API action or action category."""
+
+    model_config = ConfigDict(
+        validate_default=True,
+        validate_assignment=True,
+        extra="forbid",
+    )
+
+    rate: float = Field(
+        gt=0,
+        description="Requests (tokens) refilled per second.",
+    )
+    burst: float = Field(
+        gt=0,
+        description="Bucket capacity, i.e. the largest burst of requests allowed at once.",
+    )
+
+
+class RateLimitSettings(BaseModel):
+    """Client-side API rate limiting.
+
+    Every AWS call waits for a token from a bucket keyed by account, region and API action.
+    """
+
+    model_config = ConfigDict(
+        validate_default=True,
+        validate_assignment=True,
+        extra="forbid",
+    )
+
+    enabled: bool = Field(
+        default=True,
+        description="Enable client-side rate limiting of AWS API calls.",
+    )
+    share: float = Field(
+        default=0.5,
+        gt=0,
+        le=1,
+        description="Fraction of the published AWS request-rate budget CostCutter may use (e.g., 0.5 leaves half for other workloads in the account).",
+    )
+    overrides: dict[str, RateLimitBucketSettings] = Field(
+        default_factory=dict,
+        description="Custom buckets keyed by 'service:Action' (e.g., 'ec2:DeleteSnapshot') or 'service:category' (e.g., 'ec2:mutating'). Not scaled by share.",
+    )
+
+
+class AdaptiveConcurrencySettings(BaseModel):
+    """Adaptive (AIMD) concurrency per region and service.
+
+    Handlers start at a low limit, add one in-flight call after each window of
+    successes and cut the limit when AWS throttles.
+    """
+
+    model_config = ConfigDict(
+        validate_default=True,
+        validate_assignment=True,
+        extra="forbid",
+    )
+
+    enabled: bool = Field(
+        default=True,
+        description="Adapt per-(region, service) concurrency to throttling feedback. When disabled, handlers use resource_max_workers as a fixed limit.",
+    )
+    initial: int = Field(
+        default=2,
+        ge=1,
+        le=100,
+        description="Starting in-flight limit for each (region, service).",
+    )
+    minimum: int = Field(
+        default=1,
+        ge=1,
+        le=100,
+        description="Lowest in-flight limit a (region, service) can be cut to.",
+    )
+    backoff_factor: float = Field(
+        default=0.5,
+        gt=0,
+        lt=1,
+        description="Multiplier applied to the limit on throttling (e.g., 0.5 halves it).",
+    )
+    cooldown: float = Field(
+        default=1.0,
+        ge=0,
+        le=60,
+        description="Seconds after a cut during which further throttling errors do not cut the limit again.",
+    )
+
+
+class ResourceRetrySettings(BaseModel):
+    """Retry queue for resources that failed with transient errors.
+
+    Only the failed resource IDs are re-attempted, after an exponential backoff,
+    until the deadline passes.
+    """
+
+    model_config = ConfigDict(
+        validate_default=True,
+        validate_assignment=True,
+        extra="forbid",
+    )
+
+    base_delay: float = Field(
+        default=2.0,
+        gt=0,
+        le=300,
+        description="Seconds to wait before the first retry; doubled for every further attempt.",
+    )
+    max_delay: float = Field(
+        default=30.0,
+        gt=0,
+        le=900,
+        description="Upper bound for the delay between two retries of the same resources.",
+    )
+    deadline: float = Field(
+        default=300.0,
+        ge=0,
+        le=86400,
+        description="Seconds after the run starts past which no further retries are scheduled (0 disables retries).",
+    )
+
+
+class ConvergenceSettings(BaseModel):
+    """Waiting for asynchronous deletions before dependents start.
+
+    Terminated instances, deleted volumes and terminated Elastic Beanstalk environments
+    are polled in batches until they are gone.
+    """
+
+    model_config = ConfigDict(
+        validate_default=True,
+        validate_assignment=True,
+        extra="forbid",
+    )
+
+    enabled: bool = Field(
+        default=True,
+        description="Hold back dependent tasks until asynchronously deleted resources are gone.",
+    )
+    interval: float = Field(
+        default=5.0,
+        gt=0,
+        le=300,
+        description="Seconds between two batched describe calls for the same region and resource kind.",
+    )
+    timeout: float = Field(
+        default=600.0,
+        gt=0,
+        le=7200,
+        description="Seconds to wait for a resource to disappear before unblocking its dependents anyway.",
+    )
+
+
+class S3Settings(BaseModel):
+    """S3 cleanup behaviour.
+
+    Bucket regions are resolved once per run into an index shared by every S3
+    region task; the index can be cached on disk between runs. Objects are
+    deleted by a per-bucket pipeline that overlaps listing with several
+    concurrent ``DeleteObjects`` calls; very large buckets can also be listed
+    in concurrent prefix shards, or handed to S3 lifecycle expiration when
+    their estimated size exceeds a threshold. Dry runs can estimate each
+    bucket's size and deletion time from a sample of its key space.
+    """
+
+    model_config = ConfigDict(
+        validate_default=True,
+        validate_assignment=True,
+        extra="forbid",
+    )
+
+    region_cache_enabled: bool = Field(
+        default=False,
+        description="Persist the bucket -> region index between runs (buckets created after it was written are missed until it expires).",
+    )
+    region_cache_path: str = Field(
+        default="~/.local/share/costcutter/cache/s3-bucket-regions.json",
+        description="JSON file holding the cached bucket -> region index, keyed by account.",
+    )
+    region_cache_ttl: float = Field(
+        default=86400.0,
+        gt=0,
+        description="Seconds a cached bucket -> region index stays valid.",
+    )
+    delete_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Concurrent DeleteObjects calls per bucket while listing continues (bounded by resource_max_workers).",
+    )
+    manifest_dir: str | None = Field(
+        default=None,
+        description="Directory of key manifests (<bucket>.csv or <bucket>.csv.gz, e.g. from S3 Inventory) deleted before a single verification listing.",
+    )
+    manifest_columns: list[str] | None = Field(
+        default=None,
+        description="Column names of headerless manifests, e.g. the fileSchema of an S3 Inventory report (Bucket, Key, VersionId, ...).",
+    )
+    object_lock_check: bool = Field(
+        default=True,
+        description="Check Object Lock settings and sample version retention/legal holds before emptying a bucket; skip buckets whose versions cannot be deleted.",
+    )
+    freeze_writes: bool = Field(
+        default=False,
+        description="Suspend versioning and deny s3:PutObject on a bucket before emptying it; restored if emptying is aborted.",
+    )
+    list_checkpoint_enabled: bool = Field(
+        default=False,
+        description="Save the listing position of buckets being emptied so an interrupted run resumes there (serial listing only).",
+    )
+    list_checkpoint_path: str = Field(
+        default="~/.local/share/costcutter/state/s3-list-checkpoints.json",
+        description="JSON file holding the listing checkpoints, keyed by bucket.",
+    )
+    list_shards: int = Field(
+        default=1,
+        ge=1,
+        le=256,
+        description="Key-space partitions listed concurrently per bucket (1 lists serially; partitions follow '/' prefixes).",
+    )
+    key_retry_attempts: int = Field(
+        default=5,
+        ge=1,
+        le=20,
+        description="DeleteObjects attempts per key before a throttled or failed key is reported as failed (1 disables retries).",
+    )
+    key_retry_base_delay: float = Field(
+        default=1.0,
+        gt=0,
+        le=30,
+        description="Seconds before a failed key is retried; doubled for every further attempt (at most 30s).",
+    )
+    object_events: bool = Field(
+        default=False,
+        description="Record a report event per deleted object instead of per-bucket counts (memory grows with the object count).",
+    )
+    expire_above_objects: int | None = Field(
+        default=None,
+        ge=0,
+        description="Estimated object count above which a bucket is emptied by lifecycle expiration instead of DeleteObjects calls, and deleted by a later run (None disables).",
+    )
+    dry_run_estimate: bool = Field(
+        default=False,
+        description="In dry runs, sample each bucket's key space to estimate its objects, versions, bytes and deletion time.",
+    )
+    estimate_probes: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Shards sampled, and positions sampled in each large shard, when estimating a bucket in a dry run.",
+    )
+
+
 class AWSSettings(BaseModel):
     """AWS configuration.
 
@@ -161,13 +415,61 @@ class AWSSettings(BaseModel):
         default=4,
         ge=1,
         le=100,
-        description="Maximum concurrent workers for stage-level parallelism (e.g., 4 means up to 4 tasks run in parallel per stage). Recommended: 2-10.",
+        description="Maximum concurrent (service, resource, region) tasks (e.g., 4 means up to 4 tasks run in parallel; each starts as soon as its own dependencies finish). Recommended: 2-10.",
     )
     resource_max_workers: int = Field(
         default=10,
         ge=1,
         le=100,
-        description="Maximum concurrent workers per resource handler (e.g., parallel EC2 instance deletions). Higher values = faster cleanup but may hit AWS rate limits. Recommended: 5-20.",
+        description="Size of the shared worker pool that all tasks and resource handlers draw from, i.e. the total number of in-flight AWS API calls across all regions. Higher values = faster cleanup but may hit AWS rate limits. Recommended: 5-20.",
+    )
+    connect_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        le=300,
+        description="Seconds to wait when opening a connection to an AWS endpoint.",
+    )
+    read_timeout: float = Field(
+        default=60.0,
+        gt=0,
+        le=900,
+        description="Seconds to wait for a response from an AWS endpoint.",
+    )
+    retry_mode: Literal["legacy", "standard", "adaptive"] = Field(
+        default="standard",
+        description="botocore retry mode applied to every client ('standard' retries throttling and transient errors with backoff).",
+    )
+    max_attempts: int = Field(
+        default=5,
+        ge=1,
+        le=20,
+        description="Maximum attempts per API call, including the initial request.",
+    )
+    page_size: int = Field(
+        default=500,
+        ge=5,
+        le=1000,
+        description="Items requested per page by paginated describe calls when cataloging resources (capped to each API's own maximum).",
+    )
+    rate_limit: RateLimitSettings = Field(
+        default_factory=RateLimitSettings,
+        description="Client-side rate limiting so cleanup bursts do not throttle other workloads in the account.",
+    )
+    resource_retry: ResourceRetrySettings = Field(
+        default_factory=ResourceRetrySettings,
+        description="Backoff and deadline for re-attempting resources that failed with transient errors (e.g., DependencyViolation).",
+    )
+    convergence: ConvergenceSettings = Field(
+        default_factory=ConvergenceSettings,
+        description="Batched polling of terminated instances, volumes and Elastic Beanstalk environments before their dependents run.",
+    )
+    s3: S3Settings = Field(
+        default_factory=S3Settings,
+        description="S3 cleanup behaviour (bucket region index, object deletion pipeline).",
+    )
+    adaptive_concurrency: AdaptiveConcurrencySettings = Field(
+        default_factory=AdaptiveConcurrencySettings,
+        description="Throttling-driven concurrency limits per region and service (capped by resource_max_workers).",
     )
     region: list[str] = Field(
         default_factory=lambda: ["us-east-1", "ap-south-1"],
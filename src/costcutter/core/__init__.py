@@ -1,3 +1,11 @@
+from costcutter.core.client_pool import get_client
+from costcutter.core.execution import ExecutionPool, configure_execution_pool, get_execution_pool
 from costcutter.core.session_helper import create_aws_session
 
-__all__ = ["create_aws_session"]
+__all__ = [
+    "ExecutionPool",
+    "configure_execution_pool",
+    "create_aws_session",
+    "get_client",
+    "get_execution_pool",
+]
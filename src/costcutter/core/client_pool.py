@@ -0,0 +1,124 @@
+"""Thread-safe cache of boto3 clients keyed by (service, region).
+
+Creating a client reloads the botocore service model, resolves an endpoint and
+opens a fresh connection pool, and ``boto3.Session.client`` is not thread-safe.
+Handlers therefore go through :func:`get_client`, which builds each client once
+per session under a lock and reuses it for every later call. botocore clients
+themselves are safe to share between threads. Clients are created lazily, on
+first use: creation is serialised by the lock, so creating them up front would
+only queue workers behind it.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from boto3.session import Session
+from botocore.config import Config as BotoConfig
+
+from costcutter.core.concurrency import ConcurrencyController
+from costcutter.core.rate_limiter import RateLimiter
+
+type ClientKey = tuple[str, str | None]
+
+
+class ClientPool:
+    """Cache of clients created from one session.
+
+    Args:
+        session: Session used to create clients.
+        client_config: Optional botocore config applied to every client.
+        rate_limiter: Optional limiter every created client is attached to.
+        concurrency: Optional adaptive concurrency controller fed by every created client.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        client_config: BotoConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency: ConcurrencyController | None = None,
+    ) -> None:
+        # Weak reference: pools are registered in a WeakKeyDictionary keyed by the session,
+        # and a strong reference here would keep every session (and its clients) alive.
+        try:
+            self._session_ref: Callable[[], Session | None] = weakref.ref(session)
+        except TypeError:
+            self._session_ref = lambda: session
+        self._client_config = client_config
+        self._rate_limiter = rate_limiter
+        self._concurrency = concurrency
+        self._clients: dict[ClientKey, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, service_name: str, region_name: str | None = None) -> Any:
+        """Return the cached client for ``(service_name, region_name)``, creating it once."""
+        key = (service_name, region_name)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                kwargs: dict[str, Any] = {}
+                if region_name:
+                    kwargs["region_name"] = region_name
+                if self._client_config is not None:
+                    kwargs["config"] = self._client_config
+                session = self._session_ref()
+                if session is None:
+                    raise RuntimeError("session backing this client pool no longer exists")
+                client = session.client(service_name, **kwargs)
+                if self._rate_limiter is not None:
+                    self._rate_limiter.attach(client)
+                if self._concurrency is not None:
+                    self._concurrency.attach(client)
+                self._clients[key] = client
+        return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+_pools: weakref.WeakKeyDictionary[Any, ClientPool] = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+def configure_client_pool(
+    session: Session,
+    client_config: BotoConfig | None = None,
+    rate_limiter: RateLimiter | None = None,
+    concurrency: ConcurrencyController | None = None,
+) -> ClientPool:
+    """Register a fresh client pool (with the given botocore config, limiter and controller) for ``session``."""
+    pool = ClientPool(session, client_config, rate_limiter, concurrency)
+    with _pools_lock:
+        _pools[session] = pool
+    return pool
+
+
+def get_client_pool(session: Session) -> ClientPool:
+    """Return the client pool bound to ``session``, creating a default one if needed."""
+    with _pools_lock:
+        pool = _pools.get(session)
+        if pool is None:
+            pool = ClientPool(session)
+            _pools[session] = pool
+        return pool
+
+
+def get_client(session: Session, service_name: str, region_name: str | None = None) -> Any:
+    """Return a shared client for ``service_name`` in ``region_name`` created from ``session``.
+
+    Sessions that cannot be weak-referenced are not cached; a new client is created per call.
+    """
+    try:
+        pool = get_client_pool(session)
+    except TypeError:
+        if region_name:
+            return session.client(service_name, region_name=region_name)
+        return session.client(service_name)
+    return pool.get(service_name, region_name)
@@ -0,0 +1,228 @@
+"""Adaptive (AIMD) concurrency limits driven by AWS throttling feedback.
+
+Each (region, service) pair gets an :class:`AdaptiveConcurrency` gate that the
+execution pool consults before dispatching work. The limit grows by one after a
+full window of successful calls (additive increase) and is cut by a factor when
+AWS answers with a throttling error (multiplicative decrease), so handlers settle
+near the real API ceiling of each account and region without hand tuning.
+
+Feedback comes from botocore events on every pooled client: ``needs-retry``
+fires once per attempt (including throttled attempts that botocore retries
+internally) and ``after-call`` once per completed call.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+THROTTLING_ERROR_CODES = frozenset({
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "SlowDown",
+})
+
+HISTORY_LIMIT = 200
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit for one (region, service) pair.
+
+    The execution pool reads :attr:`limit` and maintains :attr:`in_flight` under its
+    own lock; limit changes are guarded by this object's lock.
+
+    Args:
+        initial: Starting limit.
+        minimum: Lower bound for the limit.
+        maximum: Upper bound for the limit.
+        backoff_factor: Multiplier applied on throttling (e.g. 0.5 halves the limit).
+        cooldown: Seconds after a decrease during which further throttles are ignored,
+            so one burst of rejected in-flight calls only counts once.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 10,
+        backoff_factor: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= minimum <= maximum:
+            raise ValueError("expected 1 <= minimum <= maximum")
+        if not 0 < backoff_factor < 1:
+            raise ValueError("backoff_factor must be in (0, 1)")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff_factor = backoff_factor
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._clock = clock
+        self._started = clock()
+        self._limit = max(minimum, min(maximum, initial))
+        self._successes = 0
+        self._last_decrease: float | None = None
+        self._throttles = 0
+        self._lock = threading.Lock()
+        self._history: deque[dict[str, Any]] = deque(maxlen=HISTORY_LIMIT)
+        self._record("initial")
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def throttles(self) -> int:
+        return self._throttles
+
+    def _record(self, reason: str) -> None:
+        # Called with self._lock held (or from __init__)
+        self._history.append({"t": round(self._clock() - self._started, 3), "limit": self._limit, "reason": reason})
+
+    def on_success(self) -> None:
+        """Additive increase: +1 after ``limit`` consecutive successful calls."""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self._limit and self._limit < self.maximum:
+                self._limit += 1
+                self._successes = 0
+                self._record("increase")
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease on a throttling response (once per cooldown)."""
+        with self._lock:
+            self._throttles += 1
+            self._successes = 0
+            now = self._clock()
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+            new_limit = max(self.minimum, int(self._limit * self.backoff_factor))
+            self._last_decrease = now
+            if new_limit != self._limit:
+                self._limit = new_limit
+                self._record("throttled")
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": self._limit,
+                "minimum": self.minimum,
+                "maximum": self.maximum,
+                "throttles": self._throttles,
+                "history": list(self._history),
+            }
+
+
+def _error_code(parsed: Any) -> str:
+    if isinstance(parsed, dict):
+        return str(parsed.get("Error", {}).get("Code", "") or "")
+    return ""
+
+
+class ConcurrencyController:
+    """Registry of :class:`AdaptiveConcurrency` gates keyed by (region, service).
+
+    Args:
+        initial: Starting limit for every gate.
+        minimum: Lower bound for every gate.
+        maximum: Upper bound for every gate (usually the execution pool size).
+        backoff_factor: Multiplier applied on throttling.
+        cooldown: Seconds during which repeated throttles count as one.
+    """
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 10,
+        backoff_factor: float = 0.5,
+        cooldown: float = 1.0,
+    ) -> None:
+        self._params = {
+            "initial": initial,
+            "minimum": minimum,
+            "maximum": maximum,
+            "backoff_factor": backoff_factor,
+            "cooldown": cooldown,
+        }
+        self._gates: dict[tuple[str, str], AdaptiveConcurrency] = {}
+        self._lock = threading.Lock()
+
+    def gate(self, region: str, service: str) -> AdaptiveConcurrency:
+        """Return (creating if needed) the gate for ``(region, service)``."""
+        key = (region, service)
+        with self._lock:
+            gate = self._gates.get(key)
+            if gate is None:
+                gate = self._gates[key] = AdaptiveConcurrency(**self._params)
+            return gate
+
+    def attach(self, client: Any) -> None:
+        """Feed the gate of the client's (region, service) from its botocore events."""
+        meta = getattr(client, "meta", None)
+        events = getattr(meta, "events", None)
+        if events is None:
+            return
+        gate = self.gate(meta.region_name or "global", meta.service_model.service_name)
+        events.register("needs-retry", partial(self._on_attempt, gate))
+        events.register("after-call", partial(self._on_call, gate))
+
+    @staticmethod
+    def _on_attempt(gate: AdaptiveConcurrency, response: Any = None, **kwargs: Any) -> None:
+        if response is None:
+            return
+        _, parsed = response
+        if _error_code(parsed) in THROTTLING_ERROR_CODES:
+            gate.on_throttle()
+
+    @staticmethod
+    def _on_call(gate: AdaptiveConcurrency, http_response: Any = None, parsed: Any = None, **kwargs: Any) -> None:
+        status = getattr(http_response, "status_code", 200)
+        if status >= 300:
+            return
+        # S3 DeleteObjects reports per-key SlowDown inside a successful response
+        errors = parsed.get("Errors", []) if isinstance(parsed, dict) else []
+        if any(err.get("Code") in THROTTLING_ERROR_CODES for err in errors):
+            gate.on_throttle()
+        else:
+            gate.on_success()
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Current limit and change history per ``region/service``."""
+        with self._lock:
+            gates = dict(self._gates)
+        return {f"{region}/{service}": gate.summary() for (region, service), gate in sorted(gates.items())}
+
+
+_controller: ConcurrencyController | None = None
+
+
+def configure_concurrency_controller(controller: ConcurrencyController | None) -> None:
+    """Install (or clear) the process-wide concurrency controller."""
+    global _controller
+    _controller = controller
+
+
+def get_concurrency_controller() -> ConcurrencyController | None:
+    """Return the active concurrency controller, or None when adaptive limits are disabled."""
+    return _controller
+
+
+def concurrency_gate(region: str, service: str) -> AdaptiveConcurrency | None:
+    """Return the adaptive gate for ``(region, service)``, or None when disabled."""
+    controller = _controller
+    return controller.gate(region, service) if controller is not None else None
@@ -0,0 +1,254 @@
+"""Batched polling for resources whose deletion completes asynchronously.
+
+``TerminateInstances``, ``DeleteVolume`` and ``TerminateEnvironment`` return
+while the resource is still shutting down, so dependents (volumes and Elastic
+IPs after instances, applications and security groups after environments)
+would otherwise start too early and burn retries. Handlers register the IDs
+they deleted with the :class:`ConvergencePoller`; it checks every pending ID of
+a region and kind with one batched describe call per interval (chunked to the
+API's ID-list limit) and resolves waiters per ID as soon as each resource is
+gone.
+
+Polls run on the shared execution pool and wait between rounds on its timer
+heap (:class:`~costcutter.core.execution.RetryLater`), so no thread sleeps.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from boto3.session import Session
+
+from costcutter.core.client_pool import get_client
+from costcutter.core.execution import RetryLater, get_execution_pool
+
+logger = logging.getLogger(__name__)
+
+
+def _chunks(ids: list[str], size: int) -> Iterable[list[str]]:
+    for i in range(0, len(ids), size):
+        yield ids[i : i + size]
+
+
+def _pending_instances(client: Any, ids: list[str]) -> set[str]:
+    # Filters (unlike InstanceIds) do not fail on IDs that no longer exist
+    pending: set[str] = set()
+    paginator = client.get_paginator("describe_instances")
+    for page in paginator.paginate(Filters=[{"Name": "instance-id", "Values": ids}]):
+        for reservation in page.get("Reservations", []):
+            for instance in reservation.get("Instances", []):
+                if instance.get("State", {}).get("Name") != "terminated":
+                    pending.add(instance["InstanceId"])
+    return pending
+
+
+def _pending_volumes(client: Any, ids: list[str]) -> set[str]:
+    pending: set[str] = set()
+    paginator = client.get_paginator("describe_volumes")
+    for page in paginator.paginate(Filters=[{"Name": "volume-id", "Values": ids}]):
+        for volume in page.get("Volumes", []):
+            if volume.get("State") != "deleted":
+                pending.add(volume["VolumeId"])
+    return pending
+
+
+def _pending_environments(client: Any, names: list[str]) -> set[str]:
+    response = client.describe_environments(EnvironmentNames=names, IncludeDeleted=False)
+    return {env["EnvironmentName"] for env in response.get("Environments", []) if env.get("Status") != "Terminated"}
+
+
+@dataclass(frozen=True, slots=True)
+class _Probe:
+    service: str
+    batch_size: int
+    pending: Callable[[Any, list[str]], set[str]]
+
+
+# Resource kind -> batched describe call. Batch sizes follow the API limits
+# (200 values per EC2 filter, 100 names per DescribeEnvironments call).
+PROBES: dict[str, _Probe] = {
+    "instance": _Probe("ec2", 200, _pending_instances),
+    "volume": _Probe("ec2", 200, _pending_volumes),
+    "environment": _Probe("elasticbeanstalk", 100, _pending_environments),
+}
+
+
+@dataclass(slots=True)
+class _Waiter:
+    ids: set[str]
+    future: Future
+    timed_out: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Tracked:
+    # resource id -> deadline (monotonic)
+    pending: dict[str, float] = field(default_factory=dict)
+    waiters: list[_Waiter] = field(default_factory=list)
+    active: bool = False
+    next_poll: float = 0.0
+
+
+class ConvergencePoller:
+    """Tracks pending deletions per (region, kind) and polls them in batches.
+
+    Args:
+        session: Session used to create describe clients.
+        interval: Seconds between two polls of the same region and kind.
+        timeout: Seconds after which an ID that has not converged is given up on.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        interval: float = 5.0,
+        timeout: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._session = session
+        self.interval = interval
+        self.timeout = timeout
+        self._clock = clock
+        self._tracked: dict[tuple[str, str], _Tracked] = {}
+        self._lock = threading.Lock()
+        self._stats = {"polls": 0, "describe_calls": 0, "converged": 0, "timed_out": 0}
+
+    def track(self, region: str, kind: str, ids: Iterable[str]) -> Future:
+        """Start waiting for ``ids`` of ``kind`` in ``region`` to disappear.
+
+        Returns:
+            Future resolved once every ID converged, with the list of IDs given up on at timeout.
+        """
+        if kind not in PROBES:
+            raise ValueError(f"unknown resource kind: {kind}")
+        ids = {i for i in ids if i}
+        future: Future = Future()
+        if not ids:
+            future.set_result([])
+            return future
+        deadline = self._clock() + self.timeout
+        start_poll = False
+        with self._lock:
+            state = self._tracked.setdefault((region, kind), _Tracked())
+            for resource_id in ids:
+                state.pending.setdefault(resource_id, deadline)
+            state.waiters.append(_Waiter(set(ids), future))
+            if not state.active:
+                state.active = True
+                state.next_poll = self._clock() + self.interval
+                start_poll = True
+        if start_poll:
+            get_execution_pool().submit(region, self._poll, region, kind)
+        return future
+
+    def watch(self, region: str, kind: str) -> Future | None:
+        """Return a future for every ID currently pending in ``(region, kind)``, or None if nothing is pending."""
+        with self._lock:
+            state = self._tracked.get((region, kind))
+            if state is None or not state.pending:
+                return None
+            waiter = _Waiter(set(state.pending), Future())
+            state.waiters.append(waiter)
+            return waiter.future
+
+    def stats(self) -> dict[str, int]:
+        """Number of polls, describe calls, converged and timed-out IDs so far."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _poll(self, region: str, kind: str) -> None:
+        key = (region, kind)
+        with self._lock:
+            state = self._tracked[key]
+            wait = state.next_poll - self._clock()
+            ids = sorted(state.pending)
+        if wait > 0:
+            raise RetryLater(wait)
+
+        probe = PROBES[kind]
+        still_pending: set[str] = set()
+        calls = 0
+        try:
+            client = get_client(self._session, probe.service, region)
+            for chunk in _chunks(ids, probe.batch_size):
+                calls += 1
+                still_pending |= probe.pending(client, chunk)
+        except Exception as e:
+            # Keep every ID pending and try again next round
+            logger.warning("[%s][%s] convergence poll for %d %ss failed: %s", region, probe.service, len(ids), kind, e)
+            still_pending = set(ids)
+
+        now = self._clock()
+        with self._lock:
+            self._stats["polls"] += 1
+            self._stats["describe_calls"] += calls
+            converged = [i for i in ids if i not in still_pending]
+            expired = [i for i in ids if i in still_pending and state.pending.get(i, now) <= now]
+            for resource_id in converged:
+                state.pending.pop(resource_id, None)
+            for resource_id in expired:
+                state.pending.pop(resource_id, None)
+            self._stats["converged"] += len(converged)
+            self._stats["timed_out"] += len(expired)
+            finished = self._settle(state, converged, expired)
+            if state.pending:
+                state.next_poll = now + self.interval
+            else:
+                state.active = False
+            # Read under the lock: a track() after this point starts a poll of its own
+            active = state.active
+        if converged or expired:
+            logger.info(
+                "[%s][%s] %d %ss converged, %d timed out, %d pending",
+                region,
+                probe.service,
+                len(converged),
+                kind,
+                len(expired),
+                len(still_pending) - len(expired),
+            )
+        for waiter in finished:
+            waiter.future.set_result(waiter.timed_out)
+        if active:
+            raise RetryLater(self.interval)
+
+    @staticmethod
+    def _settle(state: _Tracked, converged: list[str], expired: list[str]) -> list[_Waiter]:
+        # Called with the lock held. Returns the waiters whose IDs are all resolved.
+        finished: list[_Waiter] = []
+        remaining: list[_Waiter] = []
+        expired_set = set(expired)
+        for waiter in state.waiters:
+            waiter.timed_out.extend(i for i in waiter.ids if i in expired_set)
+            waiter.ids.difference_update(converged)
+            waiter.ids.difference_update(expired_set)
+            (remaining if waiter.ids else finished).append(waiter)
+        state.waiters = remaining
+        return finished
+
+
+_poller: ConvergencePoller | None = None
+
+
+def configure_convergence_poller(poller: ConvergencePoller | None) -> None:
+    """Install (or clear) the process-wide convergence poller."""
+    global _poller
+    _poller = poller
+
+
+def get_convergence_poller() -> ConvergencePoller | None:
+    """Return the active convergence poller, or None when convergence waiting is disabled."""
+    return _poller
+
+
+def track_convergence(region: str, kind: str, ids: Iterable[str]) -> Future | None:
+    """Register deleted ``ids`` with the active poller; no-op (None) when none is configured."""
+    poller = _poller
+    return poller.track(region, kind, ids) if poller is not None else None
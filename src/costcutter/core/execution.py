@@ -0,0 +1,499 @@
+"""Shared worker pool that bounds every AWS API call made during a run.
+
+The orchestrator and all resource handlers submit work to one fixed-size pool
+instead of opening their own ``ThreadPoolExecutor``. Work is queued in lanes
+tagged with a region; idle workers pick lanes round-robin across regions so one
+region with thousands of pending deletions cannot starve the others.
+
+A worker that waits on work it submitted (e.g. an orchestrator task calling a
+handler that fans out deletions) runs its own queued items inline while it
+waits, so nested submission never deadlocks the pool.
+
+Lanes may also share a :class:`ConcurrencyGate` (see
+:mod:`costcutter.core.concurrency`): every lane bound to the same gate counts
+against one live, possibly changing, in-flight limit. An item waiting on nested
+work does not count against its gate while it waits, so nested work on the
+same gate can still be dispatched at a limit of 1.
+
+:meth:`ExecutionPool.imap` consumes its input lazily and keeps only a bounded
+window of submitted items, so producers (e.g. object listings) are throttled by
+the speed of the workers instead of buffering everything.
+:meth:`ExecutionPool.expand` does the same for work lists that grow while they
+are processed, such as concurrently listed pages of several listings.
+
+A work item that raises :class:`RetryLater` is parked on a timer heap and put
+back on its lane once the delay expires; its worker is free to run other items
+in the meantime and its future only resolves after the final attempt.
+:func:`run_later` parks a single call the same way from inside an item that
+waits for it, while a stand-in worker keeps the pool at full strength.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+
+_worker_state = threading.local()
+
+
+class RetryLater(BaseException):
+    """Raised by a work item to be re-run after ``delay`` seconds without holding a worker.
+
+    Derives from BaseException so ``except Exception`` blocks in handlers let it through.
+
+    Args:
+        delay: Seconds to wait before the item is dispatched again.
+    """
+
+    def __init__(self, delay: float) -> None:
+        super().__init__(delay)
+        self.delay = delay
+
+
+def in_worker() -> bool:
+    """Return True when the calling thread is running a work item of an execution pool."""
+    return getattr(_worker_state, "item", None) is not None
+
+
+def run_later(delay: float, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Run ``fn`` on the current pool once ``delay`` seconds have passed and return its result.
+
+    Only this call is parked on the timer heap, then dispatched on the calling item's
+    region and gate. The calling worker waits for it without counting toward the pool
+    size: a stand-in worker runs other items in the meantime.
+
+    Raises:
+        RuntimeError: If not called from a pool worker.
+    """
+    pool = getattr(_worker_state, "pool", None)
+    lane = getattr(_worker_state, "lane", None)
+    if pool is None or lane is None:
+        raise RuntimeError("run_later must be called from an execution pool worker")
+    return pool._run_later(lane, delay, fn, args, kwargs)
+
+
+def current_attempt() -> int:
+    """Return how many times the running work item was deferred with :class:`RetryLater` (0 outside the pool)."""
+    item = getattr(_worker_state, "item", None)
+    return item.attempt if item is not None else 0
+
+
+class ConcurrencyGate(Protocol):
+    """Shared in-flight limit consulted by the pool before dispatching an item.
+
+    The pool updates ``in_flight`` under its own lock; ``limit`` may change at any time.
+    """
+
+    in_flight: int
+
+    @property
+    def limit(self) -> int: ...
+
+
+@dataclass(slots=True)
+class _WorkItem:
+    future: Future
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    attempt: int = 0
+
+
+@dataclass(slots=True, eq=False)
+class _Lane:
+    region: str
+    max_in_flight: int | None
+    gate: ConcurrencyGate | None = None
+    items: deque[_WorkItem] = field(default_factory=deque)
+    in_flight: int = 0
+
+    def can_dispatch(self) -> bool:
+        if not self.items:
+            return False
+        if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+            return False
+        return self.gate is None or self.gate.in_flight < max(1, self.gate.limit)
+
+
+class ExecutionPool:
+    """Fixed-size, region-fair worker pool.
+
+    Args:
+        max_workers: Total number of worker threads (upper bound on concurrent work).
+        name: Thread name prefix used for worker threads.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_POOL_SIZE, name: str = "costcutter-worker") -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self._max_workers = max_workers
+        self._name = name
+        self._cond = threading.Condition()
+        # region -> lanes with queued work; _region_order holds the round-robin cursor
+        self._lanes: dict[str, deque[_Lane]] = {}
+        self._region_order: deque[str] = deque()
+        self._threads: list[threading.Thread] = []
+        self._shutdown = False
+        # Deferred items: (due, seq, lane, item), ordered by due time
+        self._timers: list[tuple[float, int, _Lane, _WorkItem]] = []
+        self._timer_seq = count()
+        # Workers waiting in run_later, each replaced by a stand-in worker meanwhile
+        self._blocked = 0
+        self._thread_seq = count()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def submit(self, region: str, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        """Queue a single call on the given region's lane.
+
+        Returns:
+            Future resolved with the call's result or exception.
+        """
+        lane = _Lane(region=region, max_in_flight=None)
+        future = self._enqueue(lane, [(fn, args, kwargs)])[0]
+        return future
+
+    def map(
+        self,
+        region: str,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_in_flight: int | None = None,
+        gate: ConcurrencyGate | None = None,
+    ) -> list[Any]:
+        """Run ``fn(item)`` for every item and wait for all of them.
+
+        Args:
+            region: Region the work belongs to (used for fair scheduling).
+            fn: Callable applied to each item.
+            items: Items to process.
+            max_in_flight: Optional cap on how many items of this call run at once.
+            gate: Optional shared limit counted across every lane bound to it.
+
+        Returns:
+            Results in the same order as ``items``.
+
+        Raises:
+            Exception: The first exception raised by ``fn`` (after all items finished).
+        """
+        calls = [(fn, (item,), {}) for item in items]
+        if not calls:
+            return []
+        lane = _Lane(region=region, max_in_flight=max_in_flight, gate=gate)
+        futures = self._enqueue(lane, calls)
+        self._wait(lane, futures)
+        return [f.result() for f in futures]
+
+    def imap(
+        self,
+        region: str,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_in_flight: int | None = None,
+        gate: ConcurrencyGate | None = None,
+        window: int | None = None,
+    ) -> Iterator[Any]:
+        """Lazily run ``fn(item)`` for every item, yielding results in order.
+
+        ``items`` is consumed on the calling thread only while fewer than ``window`` results
+        are pending, so a slow consumer (or slow workers) applies backpressure to the
+        producer and memory stays bounded however long ``items`` is. Producing the next
+        items overlaps with the queued calls.
+
+        Args:
+            region: Region the work belongs to (used for fair scheduling).
+            fn: Callable applied to each item.
+            items: Items to process, possibly an unbounded generator.
+            max_in_flight: Optional cap on how many items of this call run at once.
+            gate: Optional shared limit counted across every lane bound to it.
+            window: Maximum submitted but not yet yielded items (default: twice the in-flight cap).
+
+        Yields:
+            Results in the same order as ``items``.
+
+        Raises:
+            Exception: The exception raised by ``fn`` for the item whose result is being yielded.
+        """
+        lane = _Lane(region=region, max_in_flight=max_in_flight, gate=gate)
+        window = max(1, window or 2 * (max_in_flight or self._max_workers))
+        pending: deque[Future] = deque()
+        source = iter(items)
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.extend(self._enqueue(lane, [(fn, (item,), {})]))
+            if not pending:
+                return
+            head = pending.popleft()
+            self._wait(lane, [head])
+            yield head.result()
+
+    def expand(
+        self,
+        region: str,
+        fn: Callable[[Any], tuple[Iterable[Any], Iterable[Any]]],
+        seeds: Iterable[Any],
+        max_in_flight: int | None = None,
+        gate: ConcurrencyGate | None = None,
+    ) -> Iterator[Any]:
+        """Process a work list that grows as it is processed, yielding outputs as they complete.
+
+        ``fn(item)`` returns ``(outputs, follow_ups)``: outputs are yielded to the caller and
+        follow-up items are queued behind the current ones (e.g. the next page of a listing).
+        At most ``max_in_flight`` items are queued or running at once, so outputs are only
+        buffered for items that already finished.
+
+        Args:
+            region: Region the work belongs to (used for fair scheduling).
+            fn: Callable applied to each item.
+            seeds: Initial items.
+            max_in_flight: Optional cap on how many items run at once (default: pool size).
+            gate: Optional shared limit counted across every lane bound to it.
+
+        Yields:
+            Outputs of all items, in completion order.
+        """
+        limit = max_in_flight or self._max_workers
+        lane = _Lane(region=region, max_in_flight=limit, gate=gate)
+        backlog: deque[Any] = deque(seeds)
+        pending: list[Future] = []
+        while backlog or pending:
+            while backlog and len(pending) < limit:
+                pending.extend(self._enqueue(lane, [(fn, (backlog.popleft(),), {})]))
+            self._wait(lane, pending, any_done=True)
+            for future in [f for f in pending if f.done()]:
+                pending.remove(future)
+                outputs, follow_ups = future.result()
+                backlog.extend(follow_ups)
+                yield from outputs
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers once queued work has drained."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for t in threads:
+                if t is not threading.current_thread():
+                    t.join()
+
+    # Internal helpers -------------------------------------------------
+
+    def _enqueue(self, lane: _Lane, calls: list[tuple[Callable[..., Any], tuple, dict]]) -> list[Future]:
+        futures: list[Future] = []
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("cannot submit work after the execution pool was shut down")
+            for fn, args, kwargs in calls:
+                fut: Future = Future()
+                lane.items.append(_WorkItem(fut, fn, args, kwargs))
+                futures.append(fut)
+            lanes = self._lanes.get(lane.region)
+            if lanes is None:
+                lanes = self._lanes[lane.region] = deque()
+                self._region_order.append(lane.region)
+            if lane not in lanes:
+                lanes.append(lane)
+            self._ensure_workers()
+            self._cond.notify_all()
+        return futures
+
+    def _run_later(
+        self, parent: _Lane, delay: float, fn: Callable[..., Any], args: tuple, kwargs: dict[str, Any]
+    ) -> Any:
+        lane = _Lane(region=parent.region, max_in_flight=None, gate=parent.gate)
+        item = _WorkItem(Future(), fn, args, kwargs)
+        with self._cond:
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._timer_seq), lane, item))
+            # The waiting item makes no calls of its own: hand over its worker and gate slots
+            self._blocked += 1
+            if parent.gate is not None:
+                parent.gate.in_flight -= 1
+            self._ensure_workers()
+            self._cond.notify_all()
+        try:
+            return item.future.result()
+        finally:
+            with self._cond:
+                self._blocked -= 1
+                if parent.gate is not None:
+                    parent.gate.in_flight += 1
+                self._cond.notify_all()
+
+    def _ensure_workers(self) -> None:
+        # Called with self._cond held
+        while len(self._threads) - self._blocked < self._max_workers:
+            t = threading.Thread(
+                target=self._worker_loop,
+                name=f"{self._name}-{next(self._thread_seq)}",
+                daemon=True,
+            )
+            self._threads.append(t)
+            t.start()
+
+    def _timer_timeout(self) -> float | None:
+        # Called with self._cond held. Seconds until the next parked item is due.
+        if not self._timers:
+            return None
+        return max(0.0, self._timers[0][0] - time.monotonic())
+
+    def _promote_due(self) -> None:
+        # Called with self._cond held. Move parked items whose delay expired back onto their lanes.
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, lane, item = heapq.heappop(self._timers)
+            lane.items.append(item)
+            lanes = self._lanes.get(lane.region)
+            if lanes is None:
+                lanes = self._lanes[lane.region] = deque()
+                self._region_order.append(lane.region)
+            if lane not in lanes:
+                lanes.append(lane)
+
+    def _next_item(self) -> tuple[_Lane, _WorkItem] | None:
+        # Called with self._cond held. Round-robin over regions, FIFO over lanes within a region.
+        self._promote_due()
+        for _ in range(len(self._region_order)):
+            region = self._region_order[0]
+            self._region_order.rotate(-1)
+            lanes = self._lanes[region]
+            for lane in lanes:
+                if lane.can_dispatch():
+                    return lane, self._take(lane)
+        return None
+
+    def _take(self, lane: _Lane) -> _WorkItem:
+        # Called with self._cond held
+        item = lane.items.popleft()
+        lane.in_flight += 1
+        if lane.gate is not None:
+            lane.gate.in_flight += 1
+        if not lane.items:
+            lanes = self._lanes[lane.region]
+            lanes.remove(lane)
+            if not lanes:
+                del self._lanes[lane.region]
+                self._region_order.remove(lane.region)
+        return item
+
+    def _run(self, lane: _Lane, item: _WorkItem) -> None:
+        retry_delay: float | None = None
+        # Deferred items already moved their future to RUNNING on the first attempt
+        if item.attempt or item.future.set_running_or_notify_cancel():
+            outer = getattr(_worker_state, "item", None), getattr(_worker_state, "lane", None)
+            _worker_state.item, _worker_state.lane = item, lane
+            try:
+                result = item.fn(*item.args, **item.kwargs)
+            except RetryLater as retry:
+                retry_delay = max(0.0, retry.delay)
+            except BaseException as e:
+                item.future.set_exception(e)
+            else:
+                item.future.set_result(result)
+            finally:
+                _worker_state.item, _worker_state.lane = outer
+        with self._cond:
+            lane.in_flight -= 1
+            if lane.gate is not None:
+                lane.gate.in_flight -= 1
+            if retry_delay is not None:
+                item.attempt += 1
+                heapq.heappush(self._timers, (time.monotonic() + retry_delay, next(self._timer_seq), lane, item))
+            self._cond.notify_all()
+
+    def _worker_loop(self) -> None:
+        _worker_state.pool = self
+        while True:
+            with self._cond:
+                picked = None
+                while picked is None:
+                    if len(self._threads) - self._blocked > self._max_workers:
+                        # A waiting worker resumed: its stand-in is no longer needed
+                        self._threads.remove(threading.current_thread())
+                        return
+                    picked = self._next_item()
+                    if picked is None:
+                        if self._shutdown and not self._timers:
+                            return
+                        self._cond.wait(self._timer_timeout())
+            self._run(*picked)
+
+    def _wait(self, lane: _Lane, futures: list[Future], any_done: bool = False) -> None:
+        finished = any if any_done else all
+        if getattr(_worker_state, "pool", None) is not self:
+            if any_done:
+                wait_futures(futures, return_when=FIRST_COMPLETED)
+            else:
+                wait_futures(futures)
+            return
+        # Running on one of our own workers: help with our own lane instead of blocking a slot.
+        # The waiting item makes no calls of its own, so its gate slot is released meanwhile;
+        # otherwise nested work on the same gate could never be dispatched at a limit of 1.
+        parent = getattr(_worker_state, "lane", None)
+        held = parent.gate if parent is not None else None
+        if held is not None:
+            with self._cond:
+                held.in_flight -= 1
+                self._cond.notify_all()
+        try:
+            while True:
+                with self._cond:
+                    if any_done and finished(f.done() for f in futures):
+                        return
+                    while not lane.can_dispatch():
+                        if finished(f.done() for f in futures):
+                            return
+                        self._cond.wait(self._timer_timeout())
+                        self._promote_due()
+                    item = self._take(lane)
+                self._run(lane, item)
+        finally:
+            if held is not None:
+                with self._cond:
+                    held.in_flight += 1
+
+
+_pool: ExecutionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_execution_pool() -> ExecutionPool:
+    """Return the process-wide execution pool, creating a default-sized one if needed."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ExecutionPool(DEFAULT_POOL_SIZE)
+        return _pool
+
+
+def configure_execution_pool(max_workers: int) -> ExecutionPool:
+    """Replace the process-wide execution pool with one of the given size."""
+    global _pool
+    with _pool_lock:
+        previous = _pool
+        _pool = ExecutionPool(max_workers)
+    if previous is not None:
+        previous.shutdown(wait=False)
+    logger.info("Execution pool configured with %d workers", max_workers)
+    return _pool
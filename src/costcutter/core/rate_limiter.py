@@ -0,0 +1,230 @@
+"""Client-side token-bucket rate limiting for AWS API calls.
+
+CostCutter usually runs in the same accounts as production workloads, and AWS
+throttles API requests per account and region. Bursting through deletions can
+exhaust the shared request budget and throttle everyone else's calls. The
+:class:`RateLimiter` keeps token buckets keyed by account, region and API action,
+sized after the published EC2 request-token buckets and scaled down by a
+configurable share, and every pooled client waits for a token before each call.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from functools import partial
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+type BucketSpec = tuple[float, float]  # (refill rate per second, bucket capacity)
+
+# Published EC2 request-token buckets per action category (refill/s, capacity).
+# https://docs.aws.amazon.com/ec2/latest/devguide/ec2-api-throttling.html
+EC2_CATEGORY_BUCKETS: dict[str, BucketSpec] = {
+    "non_mutating": (20.0, 100.0),
+    "unfiltered_non_mutating": (10.0, 50.0),
+    "mutating": (5.0, 50.0),
+    "resource_intensive": (5.0, 50.0),
+}
+
+EC2_RESOURCE_INTENSIVE_ACTIONS = frozenset({
+    "AttachVolume",
+    "CreateVpcEndpoint",
+    "DetachVolume",
+    "ModifyVpcEndpoint",
+    "RunInstances",
+    "StartInstances",
+    "StopInstances",
+    "TerminateInstances",
+})
+
+# Buckets for other services. S3 limits are per prefix and counted per key
+# (3,500 writes/s, 5,500 reads/s); Elastic Beanstalk does not publish limits, so
+# its defaults are deliberately conservative.
+SERVICE_CATEGORY_BUCKETS: dict[str, dict[str, BucketSpec]] = {
+    "ec2": EC2_CATEGORY_BUCKETS,
+    "s3": {"non_mutating": (5500.0, 5500.0), "mutating": (3500.0, 3500.0)},
+    "elasticbeanstalk": {"non_mutating": (10.0, 20.0), "mutating": (2.0, 10.0)},
+}
+
+_NON_MUTATING_PREFIXES = ("Describe", "List", "Get", "Head", "Search")
+
+
+def classify_action(service: str, action: str, params: Mapping[str, Any] | None = None) -> str:
+    """Return the throttling category of an API action.
+
+    Args:
+        service: botocore service name (e.g. 'ec2').
+        action: Operation name (e.g. 'TerminateInstances').
+        params: Request parameters, used to detect unfiltered, unpaginated describes.
+    """
+    params = params or {}
+    if action.startswith(_NON_MUTATING_PREFIXES):
+        if service == "ec2" and action.startswith("Describe"):
+            narrowed = bool(params.get("Filters")) or "MaxResults" in params or "NextToken" in params
+            narrowed = narrowed or any(k.endswith(("Ids", "Names")) and params[k] for k in params)
+            if not narrowed:
+                return "unfiltered_non_mutating"
+        return "non_mutating"
+    if service == "ec2" and action in EC2_RESOURCE_INTENSIVE_ACTIONS:
+        return "resource_intensive"
+    return "mutating"
+
+
+def request_cost(service: str, action: str, params: Mapping[str, Any] | None = None) -> float:
+    """Return how many tokens a request consumes (S3 counts every key of a batch delete)."""
+    if service == "s3" and action == "DeleteObjects" and params:
+        return float(max(1, len(params.get("Delete", {}).get("Objects", []))))
+    return 1.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Callers reserve tokens up front (the balance may go negative) and then sleep
+    for the deficit outside the lock, so waiters are served in arrival order.
+
+    Args:
+        rate: Tokens refilled per second.
+        capacity: Maximum number of tokens (burst size).
+        clock: Monotonic clock, injectable for tests.
+        sleep: Sleep function, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be greater than 0")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from the bucket, blocking until they are available.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            deficit = -self._tokens
+        if deficit <= 0:
+            return 0.0
+        delay = deficit / self.rate
+        self._sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """Token buckets keyed by account, region and API action.
+
+    Args:
+        account_id: Account the buckets belong to.
+        share: Fraction of the published request budget CostCutter may use.
+        overrides: Per-action or per-category bucket specs keyed as
+            ``"service:Action"`` or ``"service:category"`` (exact action wins).
+        clock: Monotonic clock, injectable for tests.
+        sleep: Sleep function, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        account_id: str = "",
+        share: float = 1.0,
+        overrides: Mapping[str, BucketSpec] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if not 0 < share <= 1:
+            raise ValueError("share must be in (0, 1]")
+        self.account_id = account_id
+        self.share = share
+        self._overrides = dict(overrides or {})
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[tuple[str, ...], TokenBucket | None] = {}
+        self._waited: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _spec_for(self, service: str, action: str, category: str) -> BucketSpec | None:
+        spec = self._overrides.get(f"{service}:{action}") or self._overrides.get(f"{service}:{category}")
+        if spec is not None:
+            return spec
+        base = SERVICE_CATEGORY_BUCKETS.get(service, {}).get(category)
+        if base is None:
+            return None
+        rate, capacity = base
+        return rate * self.share, max(1.0, capacity * self.share)
+
+    def bucket(
+        self, region: str, service: str, action: str, params: Mapping[str, Any] | None = None
+    ) -> TokenBucket | None:
+        """Return the bucket for a call, or None when the action is not rate limited.
+
+        EC2 keeps a separate, smaller bucket for unfiltered describes, and S3 limits
+        apply per bucket, so both are part of the key alongside account, region and action.
+        """
+        category = classify_action(service, action, params)
+        scope = str((params or {}).get("Bucket", "")) if service == "s3" else ""
+        key = (self.account_id, region, service, action, category, scope)
+        with self._lock:
+            if key not in self._buckets:
+                spec = self._spec_for(service, action, category)
+                self._buckets[key] = (
+                    TokenBucket(spec[0], spec[1], clock=self._clock, sleep=self._sleep) if spec else None
+                )
+            return self._buckets[key]
+
+    def acquire(self, region: str, service: str, action: str, params: Mapping[str, Any] | None = None) -> float:
+        """Block until a call of ``action`` may be sent; returns seconds waited."""
+        bucket = self.bucket(region, service, action, params)
+        if bucket is None:
+            return 0.0
+        waited = bucket.acquire(request_cost(service, action, params))
+        if waited > 0:
+            label = f"{region}/{service}/{action}"
+            with self._lock:
+                self._waited[label] = self._waited.get(label, 0.0) + waited
+            logger.debug("[%s][%s] rate limiter delayed %s by %.2fs", region, service, action, waited)
+        return waited
+
+    def attach(self, client: Any) -> None:
+        """Make every call of ``client`` wait for a token.
+
+        Hooks botocore's ``before-parameter-build`` event, which fires once per API
+        call (not per retry attempt) with the caller's parameters.
+        """
+        meta = getattr(client, "meta", None)
+        events = getattr(meta, "events", None)
+        if events is None:
+            return
+        service = meta.service_model.service_name
+        region = meta.region_name or "global"
+        events.register("before-parameter-build", partial(self._before_parameter_build, service, region))
+
+    def _before_parameter_build(
+        self, service: str, region: str, model: Any = None, params: Any = None, **kwargs: Any
+    ) -> None:
+        if model is None:
+            return
+        self.acquire(region, service, model.name, params)
+
+    def stats(self) -> dict[str, float]:
+        """Total seconds spent waiting per ``region/service/action``."""
+        with self._lock:
+            return {k: round(v, 3) for k, v in self._waited.items()}
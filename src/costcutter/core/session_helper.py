@@ -3,6 +3,7 @@ import os
 
 import boto3
 from boto3.session import Session
+from botocore.config import Config as BotoConfig
 
 from costcutter.config import Config
 
@@ -44,3 +45,18 @@ def create_aws_session(config: Config) -> Session:
     logger.info("Using default boto3 session (env vars, ~/.aws/credentials, etc.)")
     session = boto3.Session()
     return session
+
+
+def build_client_config(config: Config) -> BotoConfig:
+    """Build the botocore client config shared by every pooled client.
+
+    Sizes the HTTP connection pool to the shared execution pool so no worker waits
+    for a connection, and applies the configured timeouts and retry mode.
+    """
+    aws_config = config.aws
+    return BotoConfig(
+        max_pool_connections=max(10, aws_config.resource_max_workers),
+        connect_timeout=aws_config.connect_timeout,
+        read_timeout=aws_config.read_timeout,
+        retries={"mode": aws_config.retry_mode, "max_attempts": aws_config.max_attempts},
+    )
@@ -57,6 +57,21 @@ RESOURCE_DEPENDENCIES: dict[ResourceKey, list[ResourceKey]] = {
     ("s3", "buckets"): [],  # Object deletion is internal to bucket cleanup
 }
 
+# Resources that are not bound to one region. They are scheduled as a single task
+# (region ``GLOBAL_REGION``) covering every selected region, so their work can be
+# balanced across regions instead of being split into one task per region.
+GLOBAL_REGION = "global"
+GLOBAL_RESOURCES: set[ResourceKey] = {("s3", "buckets")}
+
+# Resources whose deletion completes asynchronously, mapped to the convergence
+# poller kind that tracks them. Dependents are only unblocked once every deleted
+# resource of the task has actually disappeared (see costcutter.core.convergence).
+CONVERGENT_RESOURCES: dict[ResourceKey, str] = {
+    ("elasticbeanstalk", "environments"): "environment",
+    ("ec2", "instances"): "instance",
+    ("ec2", "volumes"): "volume",
+}
+
 
 def validate_dependency_graph() -> None:
     """Validate that the dependency graph is acyclic and all dependencies are valid resources.
@@ -1,18 +1,35 @@
+import heapq
 import logging
+import time
+from collections import deque
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from graphlib import TopologicalSorter
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from graphlib import CycleError, TopologicalSorter
+from itertools import count
 from typing import Any
 
 from boto3.session import Session
 from pydantic import BaseModel
 
-from costcutter.config import load_config
-from costcutter.core.session_helper import create_aws_session
-from costcutter.dependencies import RESOURCE_DEPENDENCIES, get_all_resources
+from costcutter.config import Config, ResourceRetrySettings, load_config
+from costcutter.core.client_pool import configure_client_pool
+from costcutter.core.concurrency import ConcurrencyController, configure_concurrency_controller
+from costcutter.core.convergence import ConvergencePoller, configure_convergence_poller, get_convergence_poller
+from costcutter.core.execution import configure_execution_pool, get_execution_pool
+from costcutter.core.rate_limiter import RateLimiter
+from costcutter.core.session_helper import build_client_config, create_aws_session
+from costcutter.dependencies import (
+    CONVERGENT_RESOURCES,
+    GLOBAL_REGION,
+    GLOBAL_RESOURCES,
+    RESOURCE_DEPENDENCIES,
+    get_all_resources,
+)
 from costcutter.reporter import get_reporter
+from costcutter.services.common import DEFAULT_PAGE_SIZE, _get_account_id, configure_page_size
 from costcutter.services.ec2 import cleanup_ec2
 from costcutter.services.ec2 import get_handler_for_resource as get_ec2_handler
+from costcutter.services.ec2.inventory import Ec2Inventory, configure_ec2_inventory
 from costcutter.services.elasticbeanstalk import (
     cleanup_elasticbeanstalk,
 )
@@ -21,6 +38,8 @@ from costcutter.services.elasticbeanstalk import (
 )
 from costcutter.services.s3 import cleanup_s3
 from costcutter.services.s3 import get_handler_for_resource as get_s3_handler
+from costcutter.services.s3.regions import BucketRegionIndex, configure_bucket_region_index
+from costcutter.services.s3.settings import configure_s3_settings
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +75,50 @@ def _service_supported_in_region(available_regions_map: dict[str, set[str]], ser
     return True if regions is None else region in regions
 
 
+def _build_rate_limiter(config: Any, session: Session) -> RateLimiter | None:
+    """Create the run's API rate limiter from ``aws.rate_limit``, or None when disabled."""
+    settings = getattr(getattr(config, "aws", None), "rate_limit", None)
+    if settings is None or not settings.enabled:
+        return None
+    overrides = {key: (bucket.rate, bucket.burst) for key, bucket in settings.overrides.items()}
+    return RateLimiter(account_id=_get_account_id(session), share=settings.share, overrides=overrides)
+
+
+def _build_concurrency_controller(config: Any, max_limit: int) -> ConcurrencyController | None:
+    """Create the run's adaptive concurrency controller from ``aws.adaptive_concurrency``, or None when disabled."""
+    settings = getattr(getattr(config, "aws", None), "adaptive_concurrency", None)
+    if settings is None or not settings.enabled:
+        return None
+    minimum = min(settings.minimum, max_limit)
+    return ConcurrencyController(
+        initial=settings.initial,
+        minimum=minimum,
+        maximum=max_limit,
+        backoff_factor=settings.backoff_factor,
+        cooldown=settings.cooldown,
+    )
+
+
+def _build_convergence_poller(config: Any, session: Session) -> ConvergencePoller | None:
+    """Create the run's convergence poller from ``aws.convergence``, or None when disabled."""
+    settings = getattr(getattr(config, "aws", None), "convergence", None)
+    if settings is None or not settings.enabled:
+        return None
+    return ConvergencePoller(session, interval=settings.interval, timeout=settings.timeout)
+
+
+def _build_bucket_region_index(config: Any, session: Session, resource_max_workers: int) -> BucketRegionIndex:
+    """Register the run's S3 bucket -> region index, with the on-disk cache from ``aws.s3`` when enabled."""
+    settings = getattr(getattr(config, "aws", None), "s3", None)
+    cache_enabled = settings is not None and settings.region_cache_enabled
+    return configure_bucket_region_index(
+        session,
+        cache_path=settings.region_cache_path if cache_enabled else None,
+        cache_ttl=settings.region_cache_ttl if settings is not None else 86400.0,
+        max_in_flight=resource_max_workers,
+    )
+
+
 def _get_resource_handler(service: str, resource_type: str) -> Callable | None:
     """Get the handler function for a specific service resource type.
 
@@ -79,6 +142,8 @@ def _process_single_resource(
     region: str,
     dry_run: bool,
     resource_max_workers: int = 10,
+    resource_ids: list[Any] | None = None,
+    regions: list[str] | None = None,
 ) -> dict[str, Any]:
     """Execute deletion for a single service/resource/region combination.
 
@@ -88,10 +153,12 @@ def _process_single_resource(
         resource_type: Resource type (e.g., 'instances')
         region: AWS region
         dry_run: Whether to perform dry run
-        resource_max_workers: Max concurrent workers for resource handler (e.g., parallel instance deletions)
+        resource_max_workers: Max in-flight deletions for this handler (drawn from the shared execution pool)
+        resource_ids: Resources to retry instead of cataloging the region (None = catalog everything)
+        regions: Regions covered by a global task (``region == GLOBAL_REGION``)
 
     Returns:
-        Dict with execution details (succeeded, failed, etc.)
+        Dict with execution details (status, error, and the resources to retry under 'retry')
     """
     handler = _get_resource_handler(service, resource_type)
     if handler is None:
@@ -99,12 +166,24 @@ def _process_single_resource(
         return {"status": "skipped", "reason": "no_handler"}
 
     task_id = f"{region}/{service}/{resource_type}"
-    logger.info("[%s] Starting deletion", task_id)
+    if resource_ids is None:
+        logger.info("[%s] Starting deletion", task_id)
+        kwargs: dict[str, Any] = {}
+    else:
+        logger.info("[%s] Retrying %d resources", task_id, len(resource_ids))
+        kwargs = {"resource_ids": resource_ids}
+    if regions is not None:
+        kwargs["regions"] = regions
 
     try:
-        handler(session=session, region=region, dry_run=dry_run, max_workers=resource_max_workers)
-        logger.info("[%s] Completed successfully", task_id)
-        return {"status": "succeeded"}
+        retry = list(
+            handler(session=session, region=region, dry_run=dry_run, max_workers=resource_max_workers, **kwargs) or []
+        )
+        if retry:
+            logger.warning("[%s] %d resources failed with transient errors", task_id, len(retry))
+        else:
+            logger.info("[%s] Completed successfully", task_id)
+        return {"status": "succeeded", "retry": retry}
     except Exception as e:
         logger.exception("[%s] Failed with error: %s", task_id, e)
         return {"status": "failed", "error": str(e), "exception_type": type(e).__name__}
@@ -120,22 +199,22 @@ def _build_dependency_graph(selected_resources: set[tuple[str, str]], regions: l
     Returns:
         Dict mapping task tuples to lists of task dependencies
     """
-    # Task representation: (service, resource_type, region)
+    # Task representation: (service, resource_type, region); global resources get a
+    # single task in GLOBAL_REGION instead of one per region
     task_dependencies: dict[tuple, list[tuple]] = {}
 
-    for service, resource_type in selected_resources:
-        for region in regions:
-            task = (service, resource_type, region)
-            deps = RESOURCE_DEPENDENCIES.get((service, resource_type), [])
-
-            # Convert resource dependencies to task dependencies (same resource, all regions)
-            task_deps: list[tuple] = []
-            for dep_service, dep_resource in deps:
-                # Dependency must complete in the same region before this task
-                dep_task = (dep_service, dep_resource, region)
-                task_deps.append(dep_task)
+    def task_for(resource: tuple[str, str], region: str) -> tuple:
+        return (*resource, GLOBAL_REGION if resource in GLOBAL_RESOURCES else region)
 
-            task_dependencies[task] = task_deps
+    for resource in selected_resources:
+        deps = RESOURCE_DEPENDENCIES.get(resource, [])
+        task_regions = [GLOBAL_REGION] if resource in GLOBAL_RESOURCES else regions
+        for region in task_regions:
+            # Dependencies must complete in the same region before this task; a global
+            # task waits for its dependencies in every region
+            dep_regions = regions if region == GLOBAL_REGION else [region]
+            task_deps = list(dict.fromkeys(task_for(dep, dep_region) for dep in deps for dep_region in dep_regions))
+            task_dependencies[task_for(resource, region)] = task_deps
 
     return task_dependencies
 
@@ -148,17 +227,27 @@ def _execute_with_topological_sort(
     dry_run: bool,
     max_workers: int,
     resource_max_workers: int = 10,
+    retry_settings: ResourceRetrySettings | None = None,
 ) -> dict[str, Any]:
     """Execute resource deletion using topological sort for dependency ordering.
 
+    Tasks are scheduled incrementally from ``TopologicalSorter.get_ready()``: each
+    ``(service, resource_type, region)`` task starts as soon as its own dependencies
+    complete, rather than waiting for a global stage barrier. Tasks whose deletions are
+    asynchronous (see ``CONVERGENT_RESOURCES``) only unblock their dependents once the
+    convergence poller saw every deleted resource disappear. Resources that fail with
+    transient errors are re-attempted individually from a backoff queue until the
+    retry deadline, without blocking unrelated tasks.
+
     Args:
         session: AWS session
         selected_resources: Set of (service, resource_type) tuples to delete
         regions: List of AWS regions
         available_regions_map: Map of service -> available regions
         dry_run: Whether to perform dry run
-        max_workers: Max concurrent tasks (stage-level parallelism)
-        resource_max_workers: Max concurrent workers per resource handler
+        max_workers: Max concurrent tasks
+        resource_max_workers: Max in-flight deletions per resource handler (within the shared pool)
+        retry_settings: Backoff and deadline for the retry queue (defaults to ResourceRetrySettings())
 
     Returns:
         Summary dict with execution statistics
@@ -168,155 +257,203 @@ def _execute_with_topological_sort(
     tasks = {
         task: deps
         for task, deps in task_dependencies.items()
-        if _service_supported_in_region(available_regions_map, task[0], task[2])
+        if task[2] == GLOBAL_REGION or _service_supported_in_region(available_regions_map, task[0], task[2])
     }
 
+    def scope(service: str, region: str) -> dict[str, Any]:
+        # Global tasks cover every selected region the service is available in
+        if region != GLOBAL_REGION:
+            return {}
+        return {"regions": [r for r in regions if _service_supported_in_region(available_regions_map, service, r)]}
+
     if not tasks:
         logger.warning("No valid tasks to execute after filtering by supported regions")
         return {"processed": 0, "skipped": 0, "failed": 0, "events": [], "stages": []}
 
-    # Compute topological order using graphlib
+    # Validate the graph up front; graphlib raises CycleError from prepare()
     sorter = TopologicalSorter(tasks)
     try:
-        sorted_tasks = tuple(sorter.static_order())
-    except Exception as e:
+        sorter.prepare()
+    except CycleError as e:
         logger.error("Failed to compute topological sort: %s", e)
         raise RuntimeError(f"Dependency graph has cycles or invalid structure: {e}") from e
 
     logger.info(
-        "Computed deletion order: %d tasks across %d resources and %d regions",
-        len(sorted_tasks),
+        "Scheduling %d tasks across %d resources and %d regions",
+        len(tasks),
         len(selected_resources),
         len(regions),
     )
 
-    # Group tasks into stages using TopologicalSorter's built-in stage detection
-    # This is O(n) compared to the manual O(n²) approach
-    sorter = TopologicalSorter(tasks)
-    sorter.prepare()
-
-    stages: list[list[tuple]] = []
-    while sorter.is_active():
-        # get_ready() returns all tasks whose dependencies are satisfied
-        ready_tasks = sorter.get_ready()
-        if ready_tasks:
-            stage = list(ready_tasks)
-            stages.append(stage)
-            # Mark all tasks in this stage as done
-            for task in stage:
-                sorter.done(task)
-
-    logger.info("Created %d execution stages (optimized grouping)", len(stages))
-
-    # Execute stages sequentially, with parallelism within each stage
+    # Stream tasks: each task is submitted as soon as its own dependencies are done,
+    # so a slow region never holds back unrelated regions.
+    retry_settings = retry_settings or ResourceRetrySettings()
     succeeded = 0
     failed = 0
-    deferred: list[tuple] = []
-    stage_results: list[dict] = []
-
-    for stage_num, stage_tasks in enumerate(stages, 1):
-        logger.info("[Stage %d/%d] Executing %d tasks", stage_num, len(stages), len(stage_tasks))
-        stage_summary: dict[str, Any] = {
-            "stage": stage_num,
-            "total": len(stage_tasks),
-            "succeeded": 0,
-            "failed": 0,
-            "tasks": [],
-        }
-
-        with ThreadPoolExecutor(max_workers=min(max_workers, len(stage_tasks))) as executor:
-            future_map: dict[Any, tuple] = {}
-            for task in stage_tasks:
-                service, resource_type, region = task
-                fut = executor.submit(
-                    _process_single_resource, session, service, resource_type, region, dry_run, resource_max_workers
-                )
-                future_map[fut] = task
-
-            for future in as_completed(future_map):
-                task = future_map[future]
-                service, resource_type, region = task
-
-                try:
-                    result = future.result()
-                    if result["status"] == "succeeded":
-                        succeeded += 1
-                        stage_summary["succeeded"] += 1
-                        stage_summary["tasks"].append({
-                            "task": f"{region}/{service}/{resource_type}",
-                            "status": "succeeded",
-                        })
-                    elif result["status"] == "failed":
-                        failed += 1
-                        stage_summary["failed"] += 1
-                        deferred.append(task)
-                        stage_summary["tasks"].append({
-                            "task": f"{region}/{service}/{resource_type}",
-                            "status": "failed",
-                            "reason": result.get("reason"),
-                        })
-                except Exception as e:
+    dag_summary: dict[str, Any] = {
+        "stage": "dag",
+        "total": len(tasks),
+        "succeeded": 0,
+        "failed": 0,
+        "tasks": [],
+    }
+    retry_summary: dict[str, Any] = {
+        "stage": "retry",
+        "total": 0,
+        "succeeded": 0,
+        "failed": 0,
+        "tasks": [],
+    }
+    run_started = time.monotonic()
+    retry_deadline = run_started + retry_settings.deadline
+
+    # Tasks run on the shared execution pool; max_workers caps how many tasks are in
+    # flight at once while their handlers draw deletions from the same pool.
+    pool = get_execution_pool()
+    task_limit = max(1, max_workers)
+    ready: deque[tuple] = deque()
+    in_flight: dict[Future, tuple[tuple, float, int]] = {}
+    # Resources that failed with transient errors wait here until their backoff expires:
+    # (due, seq, task, resource_ids, attempt)
+    retry_queue: list[tuple[float, int, tuple, list[Any], int]] = []
+    retry_seq = count()
+    # Finished tasks whose deletions are still converging (e.g. instances shutting down);
+    # their dependents are unblocked when the poller resolves the future.
+    converging: dict[Future, tuple[tuple, dict[str, Any], float]] = {}
+    poller = get_convergence_poller()
+
+    def schedule_retry(task: tuple, resource_ids: list[Any], attempt: int) -> bool:
+        delay = min(retry_settings.max_delay, retry_settings.base_delay * 2 ** (attempt - 1))
+        due = time.monotonic() + delay
+        if due > retry_deadline:
+            return False
+        heapq.heappush(retry_queue, (due, next(retry_seq), task, resource_ids, attempt))
+        return True
+
+    while sorter.is_active() or in_flight or retry_queue or converging:
+        if sorter.is_active():
+            for task in sorter.get_ready():
+                if task not in tasks:
+                    # Dependency on a resource/region that was not selected; nothing to run
+                    sorter.done(task)
+                    continue
+                ready.append(task)
+
+        while ready and len(in_flight) < task_limit:
+            task = ready.popleft()
+            service, resource_type, region = task
+            fut = pool.submit(
+                region,
+                _process_single_resource,
+                session,
+                service,
+                resource_type,
+                region,
+                dry_run,
+                resource_max_workers,
+                **scope(service, region),
+            )
+            in_flight[fut] = (task, time.monotonic(), 0)
+
+        while retry_queue and retry_queue[0][0] <= time.monotonic() and len(in_flight) < task_limit:
+            _, _, task, resource_ids, attempt = heapq.heappop(retry_queue)
+            service, resource_type, region = task
+            fut = pool.submit(
+                region,
+                _process_single_resource,
+                session,
+                service,
+                resource_type,
+                region,
+                dry_run,
+                resource_max_workers,
+                resource_ids=resource_ids,
+                **scope(service, region),
+            )
+            in_flight[fut] = (task, time.monotonic(), attempt)
+
+        timeout = max(0.0, retry_queue[0][0] - time.monotonic()) if retry_queue else None
+        if not in_flight and not converging:
+            if sorter.is_active():
+                # Skipped nodes may have unlocked new ready tasks; poll the sorter again
+                continue
+            # Only backed-off retries remain
+            time.sleep(timeout or 0.0)
+            continue
+
+        done, _ = wait([*in_flight, *converging], timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future in converging:
+                task, entry, since = converging.pop(future)
+                entry["converged_after"] = round(time.monotonic() - since, 3)
+                unconverged = future.result()
+                if unconverged:
+                    entry["unconverged"] = len(unconverged)
+                    logger.warning(
+                        "[%s] %d resources did not disappear before the timeout", entry["task"], len(unconverged)
+                    )
+                sorter.done(task)
+                continue
+
+            task, started, attempt = in_flight.pop(future)
+            service, resource_type, region = task
+            entry: dict[str, Any] = {
+                "task": f"{region}/{service}/{resource_type}",
+                "started": round(started - run_started, 3),
+                "duration": round(time.monotonic() - started, 3),
+            }
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"status": "failed", "reason": str(e)}
+
+            stage = dag_summary if attempt == 0 else retry_summary
+            if attempt:
+                entry["attempt"] = attempt
+                retry_summary["total"] += 1
+            retry_ids = list(result.get("retry") or [])
+
+            if result["status"] == "failed":
+                # Unexpected handler error; the handler already logged and reported it
+                stage["failed"] += 1
+                failed += 1
+                entry["status"] = "failed"
+                entry["reason"] = result.get("reason") or result.get("error")
+            elif result["status"] == "succeeded" and retry_ids:
+                # Only the resources that hit transient errors are re-attempted
+                entry["status"] = "retrying"
+                entry["retry_pending"] = len(retry_ids)
+                if schedule_retry(task, retry_ids, attempt + 1):
+                    entry["retry_scheduled"] = True
+                else:
+                    stage["failed"] += 1
                     failed += 1
-                    stage_summary["failed"] += 1
-                    deferred.append(task)
-                    stage_summary["tasks"].append({
-                        "task": f"{region}/{service}/{resource_type}",
-                        "status": "failed",
-                        "reason": str(e),
-                    })
-
-        stage_results.append(stage_summary)
-
-    # Attempt retry of deferred tasks once
-    if deferred:
-        logger.info("[Deferred Retry] Attempting %d previously failed tasks", len(deferred))
-        deferred_summary: dict[str, Any] = {
-            "stage": "deferred_retry",
-            "total": len(deferred),
-            "succeeded": 0,
-            "failed": 0,
-            "tasks": [],
-        }
-
-        with ThreadPoolExecutor(max_workers=min(max_workers, len(deferred))) as executor:
-            future_map = {}
-            for task in deferred:
-                service, resource_type, region = task
-                fut = executor.submit(
-                    _process_single_resource, session, service, resource_type, region, dry_run, resource_max_workers
-                )
-                future_map[fut] = task
-
-            for future in as_completed(future_map):
-                task = future_map[future]
-                service, resource_type, region = task
-
-                try:
-                    result = future.result()
-                    if result["status"] == "succeeded":
-                        succeeded += 1
-                        deferred_summary["succeeded"] += 1
-                        failed -= 1
-                        deferred_summary["tasks"].append({
-                            "task": f"{region}/{service}/{resource_type}",
-                            "status": "succeeded",
-                        })
-                    else:
-                        deferred_summary["failed"] += 1
-                        deferred_summary["tasks"].append({
-                            "task": f"{region}/{service}/{resource_type}",
-                            "status": "failed",
-                            "reason": result.get("reason"),
-                        })
-                except Exception as e:
-                    deferred_summary["failed"] += 1
-                    deferred_summary["tasks"].append({
-                        "task": f"{region}/{service}/{resource_type}",
-                        "status": "failed",
-                        "reason": str(e),
-                    })
-
-        stage_results.append(deferred_summary)
+                    entry["status"] = "failed"
+                    entry["reason"] = f"{len(retry_ids)} resources still failing at the retry deadline"
+            elif result["status"] == "succeeded":
+                succeeded += 1
+                stage["succeeded"] += 1
+                entry["status"] = "succeeded"
+            else:
+                entry["status"] = result["status"]
+                entry["reason"] = result.get("reason")
+            stage["tasks"].append(entry)
+
+            if attempt == 0:
+                # Unblock dependents of this task only (once its deletions converged);
+                # retries never block the DAG
+                kind = CONVERGENT_RESOURCES.get((service, resource_type))
+                waiter = poller.watch(region, kind) if poller is not None and kind is not None else None
+                if waiter is not None and not waiter.done():
+                    entry["converging"] = True
+                    converging[waiter] = (task, entry, time.monotonic())
+                else:
+                    sorter.done(task)
+
+    logger.info("Executed %d tasks in %.2fs (streaming DAG)", len(tasks), time.monotonic() - run_started)
+    stage_results: list[dict] = [dag_summary]
+    if retry_summary["total"]:
+        stage_results.append(retry_summary)
 
     # After all work is finished, gather recorded events from the global reporter
     reporter = get_reporter()
@@ -340,7 +477,7 @@ def orchestrate_services(
     respecting AWS dependencies, and executes deletion in topologically-sorted order.
 
     Returns:
-        Summary dict with execution statistics and stage-wise results
+        Summary dict with execution statistics and per-task results
     """
     config = load_config()
 
@@ -406,16 +543,40 @@ def orchestrate_services(
     if not isinstance(max_workers, int) or max_workers <= 0:
         max_workers = min(32, len(regions) * len(selected_resources))
 
-    # Get resource-level max workers (controls parallelism within each resource handler)
+    # Get resource-level max workers: the size of the shared execution pool, i.e. the global
+    # budget for in-flight API calls across all tasks and handlers
     resource_max_workers = getattr(getattr(config, "aws", None), "resource_max_workers", 10)
     if not isinstance(resource_max_workers, int) or resource_max_workers <= 0:
         resource_max_workers = 10
 
     logger.info(
-        "Parallelism config: max_workers=%d (stage-level), resource_max_workers=%d (per-resource)",
+        "Parallelism config: max_workers=%d (task-level), resource_max_workers=%d (shared pool)",
         max_workers,
         resource_max_workers,
     )
+    configure_execution_pool(resource_max_workers)
+
+    page_size = getattr(getattr(config, "aws", None), "page_size", None)
+    configure_page_size(page_size if isinstance(page_size, int) and page_size > 0 else DEFAULT_PAGE_SIZE)
+
+    # One cached client per (service, region), sized to the pool, rate limited per
+    # account/region/action and feeding throttling signals to the adaptive concurrency
+    # limits; clients are created on first use
+    client_config = build_client_config(config) if isinstance(config, Config) else None
+    rate_limiter = _build_rate_limiter(config, session)
+    concurrency = _build_concurrency_controller(config, resource_max_workers)
+    configure_concurrency_controller(concurrency)
+    configure_client_pool(session, client_config, rate_limiter, concurrency)
+    poller = _build_convergence_poller(config, session)
+    configure_convergence_poller(poller)
+    bucket_index = (
+        _build_bucket_region_index(config, session, resource_max_workers) if "s3" in selected_service_keys else None
+    )
+    # S3 handlers read aws.s3 (deletion pipeline, sharding, checkpoints, ...) from the run-wide settings
+    configure_s3_settings(getattr(getattr(config, "aws", None), "s3", None))
+    # EC2 handlers of a region share one describe sweep
+    inventory = Ec2Inventory(session) if "ec2" in selected_service_keys else None
+    configure_ec2_inventory(inventory)
 
     # Execute using topological sort for dependency-aware ordering
     summary = _execute_with_topological_sort(
@@ -426,6 +587,15 @@ def orchestrate_services(
         dry_run=dry_run,
         max_workers=max_workers,
         resource_max_workers=resource_max_workers,
+        retry_settings=getattr(getattr(config, "aws", None), "resource_retry", None),
     )
+    summary["rate_limit"] = rate_limiter.stats() if rate_limiter is not None else {}
+    summary["concurrency"] = concurrency.summary() if concurrency is not None else {}
+    summary["convergence"] = poller.stats() if poller is not None else {}
+    if bucket_index is not None:
+        bucket_index.save()
+        summary["s3_bucket_index"] = dict(bucket_index.stats)
+    if inventory is not None:
+        summary["ec2_inventory"] = dict(inventory.stats)
 
     return summary
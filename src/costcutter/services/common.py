@@ -1,14 +1,21 @@
 import logging
 import time
-from collections.abc import Callable
-from functools import wraps
+from collections.abc import Callable, Iterator
+from functools import partial, wraps
 from typing import Any, TypeVar
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.execution import in_worker, run_later
+
 _ACCOUNT_ID: str | None = None
 
+# Items requested per describe call by catalogs (``aws.page_size``)
+DEFAULT_PAGE_SIZE = 500
+_PAGE_SIZE: int = DEFAULT_PAGE_SIZE
+
 logger = logging.getLogger(__name__)
 
 # Type variable for decorated functions
@@ -20,13 +27,35 @@ def _get_account_id(session: Session) -> str:
     global _ACCOUNT_ID
     if _ACCOUNT_ID is None:
         try:
-            _ACCOUNT_ID = session.client("sts").get_caller_identity().get("Account", "")
+            _ACCOUNT_ID = get_client(session, "sts").get_caller_identity().get("Account", "")
         except Exception as e:  # pragma: no cover
             logger.error("Failed to resolve account id: %s", e)
             _ACCOUNT_ID = ""
     return _ACCOUNT_ID
 
 
+def configure_page_size(page_size: int) -> None:
+    """Set the number of items catalogs request per describe call."""
+    global _PAGE_SIZE
+    _PAGE_SIZE = page_size
+
+
+def paginate(client: Any, operation: str, result_key: str, max_page_size: int = 1000, **kwargs: Any) -> Iterator[Any]:
+    """Yield every ``result_key`` item across all pages of a paginated describe call.
+
+    Args:
+        client: Boto3 client.
+        operation: Paginated operation name (e.g. ``"describe_volumes"``).
+        result_key: Key holding the items in each page (e.g. ``"Volumes"``).
+        max_page_size: Largest page size the API accepts; the configured page size is capped to it.
+        **kwargs: Operation parameters, typically server-side ``Filters``.
+    """
+    paginator = client.get_paginator(operation)
+    pages = paginator.paginate(PaginationConfig={"PageSize": min(_PAGE_SIZE, max_page_size)}, **kwargs)
+    for page in pages:
+        yield from page.get(result_key, [])
+
+
 # Error codes that are transient and warrant retry
 TRANSIENT_ERROR_CODES = {
     "VolumeInUse",
@@ -41,6 +70,59 @@ TRANSIENT_ERROR_CODES = {
 }
 
 
+def is_transient_error(error: BaseException) -> bool:
+    """Return True when ``error`` is a ClientError with a transient (retryable) error code."""
+    if not isinstance(error, ClientError):
+        return False
+    error_code = error.response.get("Error", {}).get("Code", "")
+    return any(code in error_code for code in TRANSIENT_ERROR_CODES)
+
+
+def collect_retryable(items: list[Any], retryable: list[bool]) -> list[Any]:
+    """Return the items whose per-item cleanup reported a transient failure.
+
+    Args:
+        items: Items passed to the per-item cleanup function.
+        retryable: Per-item results, in the same order as ``items``.
+    """
+    return [item for item, retry in zip(items, retryable, strict=True) if retry]
+
+
+def _call_or_defer(
+    func: Callable[..., Any], args: tuple, kwargs: dict[str, Any], max_retries: int, backoff_base: float
+) -> Any:
+    """Run ``func``; on a soft blocker, re-run only this call from the pool's timer heap instead of sleeping."""
+    call = partial(func, *args, **kwargs)
+    delay: float | None = None
+    for attempt in range(max_retries + 1):
+        try:
+            return call() if delay is None else run_later(delay, call)
+        except ClientError as e:
+            if not is_transient_error(e):
+                raise
+            error_code = e.response.get("Error", {}).get("Code", "")
+            message = e.response.get("Error", {}).get("Message", "")
+            if attempt >= max_retries:
+                logger.error(
+                    "Transient error '%s' in %s persisted after %d retries: %s",
+                    error_code,
+                    func.__name__,
+                    max_retries,
+                    message,
+                )
+                raise
+            delay = backoff_base**attempt
+            logger.warning(
+                "Transient error '%s' in %s, retrying in %.1fs (attempt %d/%d): %s",
+                error_code,
+                func.__name__,
+                delay,
+                attempt + 1,
+                max_retries,
+                message,
+            )
+
+
 def retry_on_soft_blocker(max_retries: int = 3, backoff_base: float = 2.0) -> Callable[[F], F]:
     """Decorator to retry AWS API calls on transient dependency errors.
 
@@ -48,6 +130,11 @@ def retry_on_soft_blocker(max_retries: int = 3, backoff_base: float = 2.0) -> Ca
     and retries with exponential backoff. Hard blockers (other ClientErrors) are re-raised
     immediately without retry.
 
+    Inside an execution pool worker the call does not sleep: only the failed call is parked
+    on the pool's timer heap (see :func:`~costcutter.core.execution.run_later`) and a stand-in
+    worker runs other items until the backoff expires, so the caller resumes right after the
+    call and is never re-run. Outside the pool it falls back to sleeping in the calling thread.
+
     Args:
         max_retries: Number of retry attempts (default 3: 2s, 4s, 8s delays)
         backoff_base: Base for exponential backoff calculation (default 2.0)
@@ -58,13 +145,16 @@ def retry_on_soft_blocker(max_retries: int = 3, backoff_base: float = 2.0) -> Ca
     Example:
         @retry_on_soft_blocker(max_retries=3)
         def delete_volume(session, region, volume_id):
-            client = session.client("ec2", region_name=region)
+            client = get_client(session, "ec2", region)
             client.delete_volume(VolumeId=volume_id)
     """
 
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if in_worker():
+                return _call_or_defer(func, args, kwargs, max_retries, backoff_base)
+
             last_exception: Exception | None = None
 
             for attempt in range(max_retries + 1):
@@ -75,9 +165,7 @@ def retry_on_soft_blocker(max_retries: int = 3, backoff_base: float = 2.0) -> Ca
                     last_exception = e
 
                     # Check if error is transient (soft blocker)
-                    is_transient = any(code in error_code for code in TRANSIENT_ERROR_CODES)
-
-                    if not is_transient:
+                    if not is_transient_error(e):
                         # Hard blocker: re-raise immediately without retry
                         raise
 
@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from typing import Any
 
 from boto3.session import Session
 
@@ -19,7 +20,7 @@ _HANDLERS = {
 }
 
 
-def get_handler_for_resource(resource_type: str) -> Callable[..., None] | None:
+def get_handler_for_resource(resource_type: str) -> Callable[..., list[Any]] | None:
     """Get the handler function for a specific EC2 resource type.
 
     Args:
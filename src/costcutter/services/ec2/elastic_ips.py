@@ -1,54 +1,72 @@
 """Handler for releasing Elastic IP addresses."""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.execution import get_execution_pool
 from costcutter.reporter import get_reporter
-from costcutter.services.common import _get_account_id
+from costcutter.services.common import (
+    _get_account_id,
+    collect_retryable,
+    is_transient_error,
+    retry_on_soft_blocker,
+)
+from costcutter.services.ec2.inventory import forget_resources, get_ec2_inventory
 
 SERVICE: str = "ec2"
 RESOURCE: str = "elastic_ip"
 logger = logging.getLogger(__name__)
 
 
-def catalog_elastic_ips(session: Session, region: str) -> list[dict[str, Any]]:
+def catalog_elastic_ips(session: Session, region: str) -> Iterator[dict[str, Any]]:
     """
-    List all Elastic IP addresses in a region.
+    Yield all VPC Elastic IP addresses in a region.
 
     Args:
         session: Boto3 session for AWS credentials.
         region: AWS region name.
 
-    Returns:
-        List of Elastic IP address details (allocation_id, public_ip, association_id).
+    Yields:
+        Elastic IP address details (allocation_id, public_ip, association_id).
     """
-    client = session.client(service_name="ec2", region_name=region)
+    client = get_client(session, "ec2", region)
+    inventory = get_ec2_inventory(session)
 
-    addresses: list[dict[str, Any]] = []
     try:
-        response = client.describe_addresses()
-        all_addresses = response.get("Addresses", [])
-        # Filter VPC EIPs (have AllocationId)
-        for addr in all_addresses:
-            allocation_id = addr.get("AllocationId")
-            if allocation_id:
-                addresses.append({
-                    "allocation_id": allocation_id,
-                    "public_ip": addr.get("PublicIp", "N/A"),
-                    "association_id": addr.get("AssociationId"),
-                })
-        logger.info("[%s][ec2][elastic_ip] Found %d Elastic IPs", region, len(addresses))
+        if inventory is not None:
+            all_addresses = inventory.get(region, "addresses")
+        else:
+            # DescribeAddresses is not paginated; only VPC EIPs (which have an AllocationId) are requested
+            filters = [{"Name": "domain", "Values": ["vpc"]}]
+            all_addresses = client.describe_addresses(Filters=filters).get("Addresses", [])
     except ClientError as e:
         logger.error("[%s][ec2][elastic_ip] Failed to describe addresses: %s", region, e)
-        addresses = []
-    return addresses
+        return
+    logger.info("[%s][ec2][elastic_ip] Found %d Elastic IPs", region, len(all_addresses))
+    for addr in all_addresses:
+        allocation_id = addr.get("AllocationId")
+        if allocation_id:
+            yield {
+                "allocation_id": allocation_id,
+                "public_ip": addr.get("PublicIp", "N/A"),
+                "association_id": addr.get("AssociationId"),
+            }
+
+
+@retry_on_soft_blocker()
+def _release_address(client: Any, allocation_id: str, dry_run: bool) -> None:
+    """Release an address, retrying while a just-removed association is still in place (InvalidAddress.InUse)."""
+    client.release_address(AllocationId=allocation_id, DryRun=dry_run)
 
 
-def cleanup_elastic_ip(session: Session, region: str, eip_info: dict[str, Any], dry_run: bool = True) -> None:
+def cleanup_elastic_ip(session: Session, region: str, eip_info: dict[str, Any], dry_run: bool = True) -> bool:
     """
     Release a single Elastic IP address.
 
@@ -57,6 +75,9 @@ def cleanup_elastic_ip(session: Session, region: str, eip_info: dict[str, Any],
         region: AWS region name.
         eip_info: Dictionary with allocation_id, public_ip, association_id.
         dry_run: If True, simulate release without making changes.
+
+    Returns:
+        True when the deletion failed with a transient error and should be retried.
     """
     reporter = get_reporter()
     action = "catalog" if dry_run else "delete"
@@ -81,7 +102,7 @@ def cleanup_elastic_ip(session: Session, region: str, eip_info: dict[str, Any],
         arn=arn,
         meta=meta,
     )
-    client = session.client("ec2", region_name=region)
+    client = get_client(session, "ec2", region)
     try:
         # If associated, disassociate first
         if association_id and not dry_run:
@@ -95,21 +116,30 @@ def cleanup_elastic_ip(session: Session, region: str, eip_info: dict[str, Any],
                 )
             except ClientError as e:
                 code = e.response.get("Error", {}).get("Code") if hasattr(e, "response") else None
-                if code != "DryRunOperation":
+                if code == "InvalidAssociationID.NotFound":
+                    # Already disassociated, e.g. by an earlier attempt replayed from the retry queue
+                    logger.info(
+                        "[%s][ec2][elastic_ip] Already disassociated allocation_id=%s association_id=%s",
+                        region,
+                        allocation_id,
+                        association_id,
+                    )
+                elif code != "DryRunOperation":
                     logger.error(
                         "[%s][ec2][elastic_ip] disassociate failed allocation_id=%s error=%s",
                         region,
                         allocation_id,
                         e,
                     )
-                    return
+                    return is_transient_error(e)
 
         # Release the allocation
-        client.release_address(AllocationId=allocation_id, DryRun=dry_run)
+        _release_address(client, allocation_id, dry_run)
         if not dry_run:
             logger.info(
                 "[%s][ec2][elastic_ip] Released allocation_id=%s public_ip=%s", region, allocation_id, public_ip
             )
+            forget_resources(session, region, "addresses", [allocation_id])
             # Update reporter with success status
             reporter.record(
                 region,
@@ -133,9 +163,17 @@ def cleanup_elastic_ip(session: Session, region: str, eip_info: dict[str, Any],
                 arn=arn,
                 meta={"status": "failed", "dry_run": dry_run, "error": str(e), "public_ip": public_ip},
             )
+            return is_transient_error(e)
+    return False
 
 
-def cleanup_elastic_ips(session: Session, region: str, dry_run: bool = True, max_workers: int = 1) -> None:
+def cleanup_elastic_ips(
+    session: Session,
+    region: str,
+    dry_run: bool = True,
+    max_workers: int = 1,
+    resource_ids: list[Any] | None = None,
+) -> list[Any]:
     """
     Release all Elastic IP addresses in a region.
 
@@ -143,10 +181,20 @@ def cleanup_elastic_ips(session: Session, region: str, dry_run: bool = True, max
         session: Boto3 session for AWS credentials.
         region: AWS region name.
         dry_run: If True, simulate release without making changes.
-        max_workers: Number of threads for parallel execution.
+        max_workers: Maximum in-flight deletions for this handler (drawn from the shared execution pool).
+        resource_ids: Elastic IP details to retry instead of cataloging the region.
+
+    Returns:
+        Elastic IP details whose deletion failed with a transient error (see ``TRANSIENT_ERROR_CODES``).
     """
-    addresses: list = catalog_elastic_ips(session=session, region=region)
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(cleanup_elastic_ip, session, region, eip_info, dry_run) for eip_info in addresses]
-        for fut in as_completed(futures):
-            fut.result()
+    addresses: list = list(
+        catalog_elastic_ips(session=session, region=region) if resource_ids is None else resource_ids
+    )
+    retryable = get_execution_pool().map(
+        region,
+        partial(cleanup_elastic_ip, session, region, dry_run=dry_run),
+        addresses,
+        max_in_flight=max_workers,
+        gate=concurrency_gate(region, SERVICE),
+    )
+    return collect_retryable(addresses, retryable)
@@ -1,96 +1,204 @@
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import Any
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import THROTTLING_ERROR_CODES, concurrency_gate
+from costcutter.core.convergence import track_convergence
+from costcutter.core.execution import get_execution_pool
 from costcutter.reporter import get_reporter
-from costcutter.services.common import _get_account_id
+from costcutter.services.common import _get_account_id, is_transient_error, paginate
+from costcutter.services.ec2.inventory import LIVE_INSTANCE_STATES, get_ec2_inventory, invalidate_inventory
 
 SERVICE: str = "ec2"
 RESOURCE: str = "instance"
 logger = logging.getLogger(__name__)
 
 
-def catalog_instances(session: Session, region: str) -> list[str]:
-    client = session.client(service_name="ec2", region_name=region)
+def catalog_instances(session: Session, region: str) -> Iterator[str]:
+    """
+    Yield the IDs of all instances in a region that are not already terminating.
 
-    arns: list[str] = []
+    Args:
+        session: Boto3 session for AWS credentials.
+        region: AWS region name.
+
+    Yields:
+        Instance IDs, one describe page at a time.
+    """
+    client = get_client(session, "ec2", region)
+    inventory = get_ec2_inventory(session)
+
+    count = 0
     try:
-        reservations = client.describe_instances().get("Reservations", [])
-        arns = [i.get("InstanceId") for r in reservations for i in r.get("Instances", [])]
-        logger.info("[%s][ec2][instance] Found %d instances", region, len(arns))
+        if inventory is not None:
+            instances: Iterable[dict[str, Any]] = inventory.get(region, "instances")
+        else:
+            # Terminated and shutting-down instances are excluded server-side
+            filters = [{"Name": "instance-state-name", "Values": LIVE_INSTANCE_STATES}]
+            reservations = paginate(client, "describe_instances", "Reservations", Filters=filters)
+            instances = (instance for reservation in reservations for instance in reservation.get("Instances", []))
+        for instance in instances:
+            if instance.get("InstanceId"):
+                count += 1
+                yield instance["InstanceId"]
+        logger.info("[%s][ec2][instance] Found %d instances", region, count)
     except ClientError as e:
         logger.error("[%s][ec2][instance] Failed to describe instances: %s", region, e)
-        arns = []
-    return arns
 
 
-def cleanup_instance(session: Session, region: str, instance_id: Any, dry_run: bool = True) -> None:
+# TerminateInstances is all-or-nothing: one bad ID fails the whole request. Batches are split
+# in half on failure until the offending IDs are isolated, so a batch of N with k bad IDs costs
+# roughly k * log2(N) extra calls instead of N.
+TERMINATE_BATCH_SIZE: int = 500
+
+# Errors that apply to the request as a whole; splitting the batch would only multiply calls.
+_BATCH_WIDE_ERROR_CODES = THROTTLING_ERROR_CODES | {"UnauthorizedOperation", "AuthFailure", "DryRunOperation"}
+
+
+def _instance_arn(region: str, account: str, instance_id: str) -> str:
+    return f"arn:aws:ec2:{region}:{account}:instance/{instance_id}"
+
+
+def _terminate_batch(client: Any, region: str, account: str, instance_ids: list[str], dry_run: bool) -> list[str]:
+    """Terminate ``instance_ids`` in one call, bisecting on failure.
+
+    Returns:
+        Instance IDs whose termination failed with a transient error.
+    """
     reporter = get_reporter()
-    action = "catalog" if dry_run else "delete"
-    status = "discovered" if dry_run else "executing"
-    account = _get_account_id(session)
-    # Construct proper ARN for the instance resource
-    arn = f"arn:aws:ec2:{region}:{account}:instance/{instance_id}"
-    reporter.record(
-        region,
-        SERVICE,
-        RESOURCE,
-        action,
-        arn=arn,
-        meta={"status": status, "dry_run": dry_run},
-    )
-    client = session.client("ec2", region_name=region)
     try:
         response = client.terminate_instances(
-            InstanceIds=[instance_id],
+            InstanceIds=instance_ids,
             Force=True,
             SkipOsShutdown=True,
             DryRun=dry_run,
         )
-        ti = response.get("TerminatingInstances", [])
-        for inst in ti:
-            cur = inst.get("CurrentState", {}).get("Name")
-            prev = inst.get("PreviousState", {}).get("Name")
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code") if hasattr(e, "response") else None
+        if dry_run and code == "DryRunOperation":
             logger.info(
-                "[%s][ec2][instance] terminate requested instance_id=%s previous=%s current=%s dry_run=%s",
+                "[%s][ec2][instance] dry-run terminate would succeed for %d instances: %s",
                 region,
-                inst.get("InstanceId"),
-                prev,
-                cur,
-                dry_run,
+                len(instance_ids),
+                ", ".join(instance_ids),
+            )
+            return []
+        if len(instance_ids) > 1 and code not in _BATCH_WIDE_ERROR_CODES:
+            mid = len(instance_ids) // 2
+            logger.warning(
+                "[%s][ec2][instance] terminate failed for a batch of %d, splitting: %s", region, len(instance_ids), e
             )
-        if not dry_run:
-            # Update reporter with success status
+            return _terminate_batch(client, region, account, instance_ids[:mid], dry_run) + _terminate_batch(
+                client, region, account, instance_ids[mid:], dry_run
+            )
+        for instance_id in instance_ids:
+            logger.error("[%s][ec2][instance] terminate failed instance_id=%s error=%s", region, instance_id, e)
             reporter.record(
                 region,
                 SERVICE,
                 RESOURCE,
                 "delete",
-                arn=arn,
-                meta={"status": "terminated", "dry_run": False},
+                arn=_instance_arn(region, account, instance_id),
+                meta={"status": "failed", "dry_run": dry_run, "error": str(e)},
             )
-    except ClientError as e:
-        code = e.response.get("Error", {}).get("Code") if hasattr(e, "response") else None
-        if dry_run and code == "DryRunOperation":
-            logger.info("[%s][ec2][instance] dry-run terminate would succeed instance_id=%s", region, instance_id)
-        else:
-            logger.error("[%s][ec2][instance] terminate failed instance_id=%s error=%s", region, instance_id, e)
+        return list(instance_ids) if is_transient_error(e) else []
+
+    for inst in response.get("TerminatingInstances", []):
+        logger.info(
+            "[%s][ec2][instance] terminate requested instance_id=%s previous=%s current=%s dry_run=%s",
+            region,
+            inst.get("InstanceId"),
+            inst.get("PreviousState", {}).get("Name"),
+            inst.get("CurrentState", {}).get("Name"),
+            dry_run,
+        )
+    if not dry_run:
+        for instance_id in instance_ids:
             reporter.record(
                 region,
                 SERVICE,
                 RESOURCE,
                 "delete",
-                arn=arn,
-                meta={"status": "failed", "dry_run": dry_run, "error": str(e)},
+                arn=_instance_arn(region, account, instance_id),
+                meta={"status": "terminated", "dry_run": False},
             )
+        # Dependents wait until the instances are actually terminated
+        track_convergence(region, "instance", instance_ids)
+    return []
+
+
+def cleanup_instance_batch(session: Session, region: str, instance_ids: list[str], dry_run: bool = True) -> list[str]:
+    """Terminate a batch of instances with a single ``TerminateInstances`` call where possible.
 
+    Every instance still gets its own reporter events. When the call fails, the batch is
+    split in half and each half retried, isolating the IDs that cannot be terminated.
 
-def cleanup_instances(session: Session, region: str, dry_run: bool = True, max_workers: int = 1) -> None:
-    arns: list = catalog_instances(session=session, region=region)
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(cleanup_instance, session, region, arn, dry_run) for arn in arns]
-        for fut in as_completed(futures):
-            fut.result()
+    Args:
+        session: Boto3 session for AWS credentials.
+        region: AWS region name.
+        instance_ids: Instance IDs to terminate.
+        dry_run: If True, simulate termination without making changes.
+
+    Returns:
+        Instance IDs whose termination failed with a transient error and should be retried.
+    """
+    reporter = get_reporter()
+    action = "catalog" if dry_run else "delete"
+    status = "discovered" if dry_run else "executing"
+    account = _get_account_id(session)
+    for instance_id in instance_ids:
+        reporter.record(
+            region,
+            SERVICE,
+            RESOURCE,
+            action,
+            arn=_instance_arn(region, account, instance_id),
+            meta={"status": status, "dry_run": dry_run},
+        )
+    client = get_client(session, "ec2", region)
+    retryable = _terminate_batch(client, region, account, list(instance_ids), dry_run)
+    if not dry_run:
+        # Terminated instances release their interfaces and addresses, and their volumes detach
+        invalidate_inventory(session, region, "instances", "volumes", "addresses", "network_interfaces")
+    return retryable
+
+
+def cleanup_instance(session: Session, region: str, instance_id: Any, dry_run: bool = True) -> bool:
+    """Terminate a single instance; returns True when it failed transiently and should be retried."""
+    return bool(cleanup_instance_batch(session, region, [instance_id], dry_run=dry_run))
+
+
+def cleanup_instances(
+    session: Session,
+    region: str,
+    dry_run: bool = True,
+    max_workers: int = 1,
+    resource_ids: list[Any] | None = None,
+) -> list[Any]:
+    """Terminate all instances in a region, ``TERMINATE_BATCH_SIZE`` IDs per API call.
+
+    Args:
+        session: Boto3 session for AWS credentials.
+        region: AWS region name.
+        dry_run: If True, simulate termination without making changes.
+        max_workers: Maximum in-flight batches for this handler (drawn from the shared execution pool).
+        resource_ids: Instance IDs to retry instead of cataloging the region.
+
+    Returns:
+        Instance IDs whose termination failed with a transient error.
+    """
+    arns: list = list(catalog_instances(session=session, region=region) if resource_ids is None else resource_ids)
+    batches = [arns[i : i + TERMINATE_BATCH_SIZE] for i in range(0, len(arns), TERMINATE_BATCH_SIZE)]
+    retryable = get_execution_pool().map(
+        region,
+        partial(cleanup_instance_batch, session, region, dry_run=dry_run),
+        batches,
+        max_in_flight=max_workers,
+        gate=concurrency_gate(region, SERVICE),
+    )
+    return [instance_id for failed in retryable for instance_id in failed]
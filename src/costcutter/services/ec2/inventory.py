@@ -0,0 +1,192 @@
+"""Per-region snapshot of EC2 resources shared by all EC2 handlers.
+
+Every EC2 handler used to describe its own resource type, and none could see
+the others: the security group handler had no idea which network interfaces
+still used a group, the snapshot handler which snapshots back a registered AMI.
+The inventory describes every kind a region's handlers need in one concurrent
+sweep, the first time any of them asks, and serves later reads from memory:
+
+- instances (not yet terminating), volumes, snapshots and images owned by the
+  account, VPC Elastic IPs, key pairs, security groups and network interfaces;
+- a kind whose describe call failed is left out of the snapshot and described
+  again, on its own, when it is read;
+- handlers that change resources keep the snapshot true: deleted resources are
+  dropped from it (:func:`forget_resources`), and kinds whose state a change
+  affects indirectly (volumes, addresses and interfaces of terminated
+  instances, groups and interfaces of terminated Elastic Beanstalk
+  environments) are invalidated and described again on their next read
+  (:func:`invalidate_inventory`).
+
+The inventory is bound to the run's session; catalogs asked with any other
+session (or when no inventory is configured) describe their kind directly.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from boto3.session import Session
+from botocore.exceptions import ClientError
+
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.execution import get_execution_pool
+from costcutter.services.common import paginate
+
+logger = logging.getLogger(__name__)
+
+# Terminated and shutting-down instances are excluded server-side
+LIVE_INSTANCE_STATES: list[str] = ["pending", "running", "stopping", "stopped"]
+
+
+def _instances(client: Any) -> list[dict[str, Any]]:
+    filters = [{"Name": "instance-state-name", "Values": LIVE_INSTANCE_STATES}]
+    reservations = paginate(client, "describe_instances", "Reservations", Filters=filters)
+    return [instance for reservation in reservations for instance in reservation.get("Instances", [])]
+
+
+def _addresses(client: Any) -> list[dict[str, Any]]:
+    # DescribeAddresses is not paginated; only VPC EIPs (which have an AllocationId) are requested
+    return client.describe_addresses(Filters=[{"Name": "domain", "Values": ["vpc"]}]).get("Addresses", [])
+
+
+def _key_pairs(client: Any) -> list[dict[str, Any]]:
+    # DescribeKeyPairs is not paginated and returns every key pair in one response
+    return client.describe_key_pairs().get("KeyPairs", [])
+
+
+@dataclass(frozen=True, slots=True)
+class _Kind:
+    id_key: str
+    describe: Callable[[Any], list[dict[str, Any]]]
+
+
+# Resource kind -> identifying field and describe call (unfiltered where handlers need the full picture)
+KINDS: dict[str, _Kind] = {
+    "instances": _Kind("InstanceId", _instances),
+    # DescribeVolumes accepts at most 500 results per page
+    "volumes": _Kind("VolumeId", lambda c: list(paginate(c, "describe_volumes", "Volumes", max_page_size=500))),
+    "snapshots": _Kind("SnapshotId", lambda c: list(paginate(c, "describe_snapshots", "Snapshots", OwnerIds=["self"]))),
+    "images": _Kind("ImageId", lambda c: list(paginate(c, "describe_images", "Images", Owners=["self"]))),
+    "addresses": _Kind("AllocationId", _addresses),
+    "key_pairs": _Kind("KeyPairId", _key_pairs),
+    "security_groups": _Kind("GroupId", lambda c: list(paginate(c, "describe_security_groups", "SecurityGroups"))),
+    "network_interfaces": _Kind(
+        "NetworkInterfaceId", lambda c: list(paginate(c, "describe_network_interfaces", "NetworkInterfaces"))
+    ),
+}
+
+
+class Ec2Inventory:
+    """Lazily swept, per-region EC2 resource snapshot for one session.
+
+    Args:
+        session: Session the snapshot is described with (and bound to).
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        self._snapshots: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        self._swept: set[str] = set()
+        self._region_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.stats = {"sweeps": 0, "describes": 0, "hits": 0, "invalidations": 0}
+
+    def _region_lock(self, region: str) -> threading.Lock:
+        with self._lock:
+            return self._region_locks.setdefault(region, threading.Lock())
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _describe(self, region: str, kind: str) -> list[dict[str, Any]]:
+        self._count("describes")
+        return KINDS[kind].describe(get_client(self.session, "ec2", region))
+
+    def _sweep(self, region: str) -> None:
+        """Describe every kind of the region concurrently; kinds that fail are left out."""
+
+        def describe(kind: str) -> tuple[str, list[dict[str, Any]] | None]:
+            try:
+                return kind, self._describe(region, kind)
+            except ClientError as e:
+                logger.warning("[%s][ec2][inventory] could not describe %s: %s", region, kind, e)
+                return kind, None
+
+        results = get_execution_pool().map(region, describe, list(KINDS), gate=concurrency_gate(region, "ec2"))
+        snapshot = self._snapshots.setdefault(region, {})
+        snapshot.update({kind: items for kind, items in results if items is not None})
+        self._swept.add(region)
+        self._count("sweeps")
+        logger.info(
+            "[%s][ec2][inventory] swept %s",
+            region,
+            ", ".join(f"{len(items)} {kind}" for kind, items in sorted(snapshot.items())),
+        )
+
+    def get(self, region: str, kind: str) -> list[dict[str, Any]]:
+        """Return the region's resources of ``kind``, sweeping the region on first use.
+
+        Raises:
+            ClientError: When the kind is not in the snapshot and describing it fails.
+        """
+        with self._region_lock(region):
+            if region not in self._swept:
+                self._sweep(region)
+            snapshot = self._snapshots.setdefault(region, {})
+            if kind in snapshot:
+                self._count("hits")
+            else:
+                snapshot[kind] = self._describe(region, kind)
+            return list(snapshot[kind])
+
+    def forget(self, region: str, kind: str, ids: Iterable[str]) -> None:
+        """Drop deleted resources of ``kind`` from the region's snapshot."""
+        gone = set(ids)
+        id_key = KINDS[kind].id_key
+        with self._region_lock(region):
+            items = self._snapshots.get(region, {}).get(kind)
+            if items is not None:
+                self._snapshots[region][kind] = [item for item in items if item.get(id_key) not in gone]
+
+    def invalidate(self, region: str, *kinds: str) -> None:
+        """Drop ``kinds`` from the region's snapshot so their next read describes them again."""
+        with self._region_lock(region):
+            snapshot = self._snapshots.get(region, {})
+            for kind in kinds:
+                if snapshot.pop(kind, None) is not None:
+                    self._count("invalidations")
+
+
+_inventory: Ec2Inventory | None = None
+
+
+def configure_ec2_inventory(inventory: Ec2Inventory | None) -> None:
+    """Install (or clear) the run's EC2 inventory."""
+    global _inventory
+    _inventory = inventory
+
+
+def get_ec2_inventory(session: Session) -> Ec2Inventory | None:
+    """Return the run's inventory when it is bound to ``session``, else None (describe directly)."""
+    inventory = _inventory
+    return inventory if inventory is not None and inventory.session is session else None
+
+
+def forget_resources(session: Session, region: str, kind: str, ids: Iterable[str]) -> None:
+    """Drop deleted resources from the inventory; no-op when none is configured for ``session``."""
+    inventory = get_ec2_inventory(session)
+    if inventory is not None:
+        inventory.forget(region, kind, ids)
+
+
+def invalidate_inventory(session: Session, region: str, *kinds: str) -> None:
+    """Invalidate ``kinds`` of the region; no-op when no inventory is configured for ``session``."""
+    inventory = get_ec2_inventory(session)
+    if inventory is not None:
+        inventory.invalidate(region, *kinds)
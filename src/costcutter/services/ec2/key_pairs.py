@@ -1,32 +1,44 @@
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterator
+from functools import partial
+from typing import Any
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.execution import get_execution_pool
 from costcutter.reporter import get_reporter
-from costcutter.services.common import _get_account_id
+from costcutter.services.common import _get_account_id, collect_retryable, is_transient_error
+from costcutter.services.ec2.inventory import forget_resources, get_ec2_inventory
 
 SERVICE: str = "ec2"
 RESOURCE: str = "key_pair"
 logger = logging.getLogger(__name__)
 
 
-def catalog_key_pairs(session: Session, region: str) -> list[str]:
-    client = session.client(service_name="ec2", region_name=region)
+def catalog_key_pairs(session: Session, region: str) -> Iterator[str]:
+    client = get_client(session, "ec2", region)
+
+    inventory = get_ec2_inventory(session)
 
-    arns: list[str] = []
     try:
-        keypairs = client.describe_key_pairs().get("KeyPairs", [])
-        arns.extend([k.get("KeyPairId") for k in keypairs])
-        logger.info("[%s][ec2][key_pair] Found %d key pairs", region, len(arns))
+        if inventory is not None:
+            keypairs = inventory.get(region, "key_pairs")
+        else:
+            # DescribeKeyPairs is not paginated and returns every key pair in one response
+            keypairs = client.describe_key_pairs().get("KeyPairs", [])
     except ClientError as e:
         logger.error("[%s][ec2][key_pair] Failed to describe key pairs: %s", region, e)
-        arns = []
-    return arns
+        return
+    logger.info("[%s][ec2][key_pair] Found %d key pairs", region, len(keypairs))
+    for keypair in keypairs:
+        if keypair.get("KeyPairId"):
+            yield keypair["KeyPairId"]
 
 
-def cleanup_key_pair(session: Session, region: str, key_pair_id: str, dry_run: bool = True) -> None:
+def cleanup_key_pair(session: Session, region: str, key_pair_id: str, dry_run: bool = True) -> bool:
     reporter = get_reporter()
     action = "catalog" if dry_run else "delete"
     status = "discovered" if dry_run else "executing"
@@ -40,7 +52,7 @@ def cleanup_key_pair(session: Session, region: str, key_pair_id: str, dry_run: b
         arn=arn,
         meta={"status": status, "dry_run": dry_run},
     )
-    client = session.client("ec2", region_name=region)
+    client = get_client(session, "ec2", region)
     try:
         response = client.delete_key_pair(KeyPairId=key_pair_id, DryRun=dry_run)
         logger.info(
@@ -51,6 +63,7 @@ def cleanup_key_pair(session: Session, region: str, key_pair_id: str, dry_run: b
             dry_run,
         )
         if not dry_run:
+            forget_resources(session, region, "key_pairs", [key_pair_id])
             # Update reporter with success status
             reporter.record(
                 region,
@@ -74,11 +87,23 @@ def cleanup_key_pair(session: Session, region: str, key_pair_id: str, dry_run: b
                 arn=arn,
                 meta={"status": "failed", "dry_run": dry_run, "error": str(e)},
             )
+            return is_transient_error(e)
+    return False
 
 
-def cleanup_key_pairs(session: Session, region: str, dry_run: bool = True, max_workers: int = 1) -> None:
-    arns: list = catalog_key_pairs(session=session, region=region)
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(cleanup_key_pair, session, region, arn, dry_run) for arn in arns]
-        for fut in as_completed(futures):
-            fut.result()
+def cleanup_key_pairs(
+    session: Session,
+    region: str,
+    dry_run: bool = True,
+    max_workers: int = 1,
+    resource_ids: list[Any] | None = None,
+) -> list[Any]:
+    arns: list = list(catalog_key_pairs(session=session, region=region) if resource_ids is None else resource_ids)
+    retryable = get_execution_pool().map(
+        region,
+        partial(cleanup_key_pair, session, region, dry_run=dry_run),
+        arns,
+        max_in_flight=max_workers,
+        gate=concurrency_gate(region, SERVICE),
+    )
+    return collect_retryable(arns, retryable)
@@ -0,0 +1,207 @@
+"""Dependency resolution for deleting a region's security groups in one pass.
+
+``DeleteSecurityGroup`` fails with ``DependencyViolation`` while another group
+has a rule referencing the group or a network interface still uses it. Deleting
+every group in parallel and retrying the failures turns groups that reference
+each other into a retry storm that only settles by luck. Instead, the groups
+and network interfaces of the region are read once and resolved up front:
+
+- a group referenced by a group that is not deleted (the ``default`` group, a
+  group outside the run, or a blocked one) or used by an interface that cannot
+  be removed (attached to an instance or managed by another service) is
+  blocked, and so are the groups it references in turn;
+- the rules of the remaining groups that reference other groups are revoked,
+  one ``RevokeSecurityGroupIngress``/``Egress`` call per group and direction,
+  and detached interfaces that still use them are deleted, concurrently;
+- the groups are then deleted in topological order of the references that
+  could not be revoked (a group before the groups it references).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import partial
+from graphlib import CycleError, TopologicalSorter
+from typing import Any
+
+from boto3.session import Session
+from botocore.exceptions import ClientError
+
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.execution import get_execution_pool
+from costcutter.services.common import paginate
+from costcutter.services.ec2.inventory import forget_resources, get_ec2_inventory, invalidate_inventory
+
+logger = logging.getLogger(__name__)
+
+_DIRECTIONS = {"ingress": "IpPermissions", "egress": "IpPermissionsEgress"}
+
+
+@dataclass(slots=True)
+class SecurityGroupPlan:
+    """How a set of security groups is deleted."""
+
+    # Groups to delete, as the rules referencing other groups to revoke first (per direction)
+    revocations: dict[str, dict[str, list[dict[str, Any]]]] = field(default_factory=dict)
+    # Detached network interfaces to delete first
+    interfaces: list[str] = field(default_factory=list)
+    # Groups that cannot be deleted, with the reason
+    blocked: dict[str, str] = field(default_factory=dict)
+
+
+def group_references(group: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """Return the group's permissions that reference other groups, reduced to those references."""
+    rules: dict[str, list[dict[str, Any]]] = {}
+    for direction, key in _DIRECTIONS.items():
+        for permission in group.get(key, []):
+            pairs = [
+                {k: v for k, v in pair.items() if k in ("GroupId", "UserId")}
+                for pair in permission.get("UserIdGroupPairs", [])
+                if pair.get("GroupId") and pair["GroupId"] != group.get("GroupId")
+            ]
+            if pairs:
+                reduced = {k: v for k, v in permission.items() if k in ("IpProtocol", "FromPort", "ToPort")}
+                rules.setdefault(direction, []).append({**reduced, "UserIdGroupPairs": pairs})
+    return rules
+
+
+def _targets(rules: dict[str, list[dict[str, Any]]]) -> set[str]:
+    """Groups referenced by rules as returned by :func:`group_references`."""
+    return {
+        pair["GroupId"]
+        for permissions in rules.values()
+        for permission in permissions
+        for pair in permission["UserIdGroupPairs"]
+    }
+
+
+def plan_security_groups(
+    groups: list[dict[str, Any]], interfaces: list[dict[str, Any]], group_ids: list[str]
+) -> SecurityGroupPlan:
+    """Work out which of ``group_ids`` can be deleted and what has to go first.
+
+    Args:
+        groups: Every security group of the region (as described).
+        interfaces: Every network interface of the region (as described).
+        group_ids: Groups to delete.
+    """
+    plan = SecurityGroupPlan()
+    targets = set(group_ids)
+    by_id = {group["GroupId"]: group for group in groups if group.get("GroupId")}
+    orphans: dict[str, set[str]] = defaultdict(set)
+    for interface in interfaces:
+        used = {g["GroupId"] for g in interface.get("Groups", []) if g.get("GroupId") in targets}
+        if not used:
+            continue
+        interface_id = interface.get("NetworkInterfaceId", "")
+        if interface.get("Status") == "available" and not interface.get("RequesterManaged"):
+            for group_id in used:
+                orphans[group_id].add(interface_id)
+        else:
+            for group_id in used:
+                plan.blocked.setdefault(group_id, f"used by network interface {interface_id}")
+
+    # A group referenced by a group that stays cannot go either; propagate until nothing changes
+    changed = True
+    while changed:
+        changed = False
+        for group_id, group in by_id.items():
+            if group_id in targets and group_id not in plan.blocked:
+                continue
+            for referenced in _targets(group_references(group)) & targets:
+                if referenced not in plan.blocked:
+                    plan.blocked[referenced] = f"referenced by security group {group_id}"
+                    changed = True
+
+    for group_id in group_ids:
+        if group_id in plan.blocked:
+            continue
+        plan.revocations[group_id] = group_references(by_id.get(group_id, {}))
+        plan.interfaces.extend(sorted(orphans.get(group_id, ())))
+    plan.interfaces = list(dict.fromkeys(plan.interfaces))
+    return plan
+
+
+def _revoke(client: Any, region: str, group_id: str, rules: dict[str, list[dict[str, Any]]]) -> bool:
+    """Revoke the group's references to other groups; return False when some remain."""
+    revoked = True
+    for direction, permissions in rules.items():
+        revoke = client.revoke_security_group_ingress if direction == "ingress" else client.revoke_security_group_egress
+        try:
+            revoke(GroupId=group_id, IpPermissions=permissions)
+        except ClientError as e:
+            logger.warning(
+                "[%s][ec2][security_group] could not revoke %s rules of group_id=%s: %s", region, direction, group_id, e
+            )
+            revoked = False
+    return revoked
+
+
+def _delete_interface(client: Any, region: str, interface_id: str) -> bool:
+    try:
+        client.delete_network_interface(NetworkInterfaceId=interface_id)
+    except ClientError as e:
+        logger.warning("[%s][ec2][security_group] could not delete network interface %s: %s", region, interface_id, e)
+        return False
+    return True
+
+
+def _describe(session: Session, region: str, kind: str, operation: str, result_key: str) -> list[dict[str, Any]]:
+    inventory = get_ec2_inventory(session)
+    if inventory is not None:
+        return inventory.get(region, kind)
+    return list(paginate(get_client(session, "ec2", region), operation, result_key))
+
+
+def resolve_security_groups(
+    session: Session, region: str, group_ids: list[str]
+) -> tuple[list[list[str]], dict[str, str]]:
+    """Clear the way for deleting ``group_ids`` and return the order to delete them in.
+
+    Returns:
+        Layers of groups to delete (each layer after the previous one, groups within a layer
+        in parallel) and the blocked groups with the reason.
+    """
+    groups = _describe(session, region, "security_groups", "describe_security_groups", "SecurityGroups")
+    interfaces = _describe(session, region, "network_interfaces", "describe_network_interfaces", "NetworkInterfaces")
+    plan = plan_security_groups(groups, interfaces, group_ids)
+    client = get_client(session, "ec2", region)
+
+    to_revoke = {group_id: rules for group_id, rules in plan.revocations.items() if rules}
+    steps = [partial(_delete_interface, client, region, interface_id) for interface_id in plan.interfaces]
+    steps += [partial(_revoke, client, region, group_id, rules) for group_id, rules in to_revoke.items()]
+    done = get_execution_pool().map(region, lambda step: step(), steps, gate=concurrency_gate(region, "ec2"))
+    deleted = [i for i, ok in zip(plan.interfaces, done, strict=False) if ok]
+    unrevoked = [g for g, ok in zip(to_revoke, done[len(plan.interfaces) :], strict=True) if not ok]
+    forget_resources(session, region, "network_interfaces", deleted)
+    if to_revoke:
+        invalidate_inventory(session, region, "security_groups")
+    logger.info(
+        "[%s][ec2][security_group] resolved %d groups: revoked references of %d, deleted %d network interfaces, "
+        "%d blocked",
+        region,
+        len(group_ids),
+        len(to_revoke) - len(unrevoked),
+        len(deleted),
+        len(plan.blocked),
+    )
+
+    # References that are still in place: a group goes before the groups it references
+    sorter: TopologicalSorter[str] = TopologicalSorter(dict.fromkeys(plan.revocations, ()))
+    for group_id in unrevoked:
+        for referenced in _targets(plan.revocations[group_id]) & plan.revocations.keys():
+            sorter.add(referenced, group_id)
+    layers: list[list[str]] = []
+    try:
+        sorter.prepare()
+        while sorter.is_active():
+            layer = sorted(sorter.get_ready())
+            layers.append(layer)
+            sorter.done(*layer)
+    except CycleError as e:
+        logger.warning("[%s][ec2][security_group] unrevoked references form a cycle, deleting at once: %s", region, e)
+        return [list(plan.revocations)], plan.blocked
+    return layers, plan.blocked
@@ -1,37 +1,86 @@
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterable, Iterator
+from functools import partial
+from typing import Any
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.execution import get_execution_pool
 from costcutter.reporter import get_reporter
-from costcutter.services.common import _get_account_id
+from costcutter.services.common import (
+    _get_account_id,
+    collect_retryable,
+    is_transient_error,
+    paginate,
+    retry_on_soft_blocker,
+)
+from costcutter.services.ec2.inventory import forget_resources, get_ec2_inventory
+from costcutter.services.ec2.security_group_dependencies import resolve_security_groups
 
 SERVICE: str = "ec2"
 RESOURCE: str = "security_group"
 logger = logging.getLogger(__name__)
 
 
-def catalog_security_groups(session: Session, region: str) -> list[str]:
-    client = session.client(service_name="ec2", region_name=region)
+def _groups_in_use(interfaces: list[dict[str, Any]]) -> set[str]:
+    """Return the groups of network interfaces that are not attached to an instance.
 
-    security_group_ids: list[str] = []
+    Interfaces of instances go away when the instances are terminated, and detached
+    interfaces of the account are deleted with the groups; the others belong to other
+    services (load balancers, Lambda, RDS, ...) and keep their groups from being deleted.
+    """
+    return {
+        group["GroupId"]
+        for interface in interfaces
+        if not interface.get("Attachment", {}).get("InstanceId")
+        and (interface.get("Status") != "available" or interface.get("RequesterManaged"))
+        for group in interface.get("Groups", [])
+        if group.get("GroupId")
+    }
+
+
+def catalog_security_groups(session: Session, region: str) -> Iterator[str]:
+    client = get_client(session, "ec2", region)
+    inventory = get_ec2_inventory(session)
+
+    count = 0
     try:
-        security_groups = client.describe_security_groups().get("SecurityGroups", [])
+        in_use: set[str] = set()
+        if inventory is not None:
+            security_groups: Iterable[dict[str, Any]] = inventory.get(region, "security_groups")
+            in_use = _groups_in_use(inventory.get(region, "network_interfaces"))
+        else:
+            security_groups = paginate(client, "describe_security_groups", "SecurityGroups")
         for security_group in security_groups:
+            # Filters cannot exclude a value, so the undeletable default groups are skipped here
             if security_group.get("GroupName") == "default":
                 continue
+            if security_group.get("GroupId") in in_use:
+                logger.info(
+                    "[%s][ec2][security_group] Skipping group_id=%s still used by network interfaces",
+                    region,
+                    security_group["GroupId"],
+                )
+                continue
             group_id = security_group.get("GroupId")
             if group_id:
-                security_group_ids.append(group_id)
-        logger.info("[%s][ec2][security_group] Found %d security groups", region, len(security_group_ids))
+                count += 1
+                yield group_id
+        logger.info("[%s][ec2][security_group] Found %d security groups", region, count)
     except ClientError as e:
         logger.error("[%s][ec2][security_group] Failed to describe security groups: %s", region, e)
-        security_group_ids = []
-    return security_group_ids
 
 
-def cleanup_security_group(session: Session, region: str, security_group_id: str, dry_run: bool = True) -> None:
+@retry_on_soft_blocker()
+def _delete_security_group(client: Any, security_group_id: str, dry_run: bool) -> None:
+    """Delete a security group, retrying while network interfaces still reference it (DependencyViolation)."""
+    client.delete_security_group(GroupId=security_group_id, DryRun=dry_run)
+
+
+def cleanup_security_group(session: Session, region: str, security_group_id: str, dry_run: bool = True) -> bool:
     reporter = get_reporter()
     action = "catalog" if dry_run else "delete"
     status = "discovered" if dry_run else "executing"
@@ -45,9 +94,9 @@ def cleanup_security_group(session: Session, region: str, security_group_id: str
         arn=arn,
         meta={"status": status, "dry_run": dry_run},
     )
-    client = session.client("ec2", region_name=region)
+    client = get_client(session, "ec2", region)
     try:
-        client.delete_security_group(GroupId=security_group_id, DryRun=dry_run)
+        _delete_security_group(client, security_group_id, dry_run)
         logger.info(
             "[%s][ec2][security_group] delete requested group_id=%s dry_run=%s",
             region,
@@ -55,6 +104,7 @@ def cleanup_security_group(session: Session, region: str, security_group_id: str
             dry_run,
         )
         if not dry_run:
+            forget_resources(session, region, "security_groups", [security_group_id])
             # Update reporter with success status
             reporter.record(
                 region,
@@ -87,14 +137,55 @@ def cleanup_security_group(session: Session, region: str, security_group_id: str
                 arn=arn,
                 meta={"status": "failed", "dry_run": dry_run, "error": str(e)},
             )
+            return is_transient_error(e)
+    return False
 
 
-def cleanup_security_groups(session: Session, region: str, dry_run: bool = True, max_workers: int = 1) -> None:
-    security_group_ids: list[str] = catalog_security_groups(session=session, region=region)
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [
-            ex.submit(cleanup_security_group, session, region, security_group_id, dry_run)
-            for security_group_id in security_group_ids
-        ]
-        for fut in as_completed(futures):
-            fut.result()
+def cleanup_security_groups(
+    session: Session,
+    region: str,
+    dry_run: bool = True,
+    max_workers: int = 1,
+    resource_ids: list[Any] | None = None,
+) -> list[Any]:
+    security_group_ids: list[str] = list(
+        catalog_security_groups(session=session, region=region) if resource_ids is None else resource_ids
+    )
+    layers = [security_group_ids]
+    if not dry_run and security_group_ids:
+        try:
+            layers, blocked = resolve_security_groups(session, region, security_group_ids)
+        except ClientError as e:
+            logger.warning("[%s][ec2][security_group] could not resolve dependencies, deleting as is: %s", region, e)
+        else:
+            _record_blocked(session, region, blocked)
+
+    # Each layer only holds groups that groups of earlier layers referenced
+    retryable: dict[str, Any] = {}
+    for layer in layers:
+        results = get_execution_pool().map(
+            region,
+            partial(cleanup_security_group, session, region, dry_run=dry_run),
+            layer,
+            max_in_flight=max_workers,
+            gate=concurrency_gate(region, SERVICE),
+        )
+        retryable.update(zip(layer, results, strict=True))
+    deleted = [group_id for group_id in security_group_ids if group_id in retryable]
+    return collect_retryable(deleted, [retryable[group_id] for group_id in deleted])
+
+
+def _record_blocked(session: Session, region: str, blocked: dict[str, str]) -> None:
+    """Report groups the dependency resolver left in place, instead of failing to delete them."""
+    reporter = get_reporter()
+    account = _get_account_id(session) if blocked else None
+    for group_id, reason in blocked.items():
+        logger.info("[%s][ec2][security_group] Skipping group_id=%s %s", region, group_id, reason)
+        reporter.record(
+            region,
+            SERVICE,
+            RESOURCE,
+            "delete",
+            arn=f"arn:aws:ec2:{region}:{account}:security-group/{group_id}",
+            meta={"status": "skipped", "dry_run": False, "reason": reason},
+        )
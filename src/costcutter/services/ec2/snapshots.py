@@ -1,47 +1,68 @@
 """Handler for deleting EBS snapshots."""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import Any
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.execution import get_execution_pool
 from costcutter.reporter import get_reporter
-from costcutter.services.common import _get_account_id
+from costcutter.services.common import _get_account_id, collect_retryable, is_transient_error, paginate
+from costcutter.services.ec2.inventory import forget_resources, get_ec2_inventory
 
 SERVICE: str = "ec2"
 RESOURCE: str = "snapshot"
 logger = logging.getLogger(__name__)
 
 
-def catalog_snapshots(session: Session, region: str) -> list[str]:
+def catalog_snapshots(session: Session, region: str) -> Iterator[str]:
     """
-    List all EBS snapshots owned by the account in a region.
+    Yield all EBS snapshots owned by the account in a region.
 
     Args:
         session: Boto3 session for AWS credentials.
         region: AWS region name.
 
-    Returns:
-        List of snapshot IDs.
+    Yields:
+        Snapshot IDs, one describe page at a time.
     """
-    client = session.client(service_name="ec2", region_name=region)
+    client = get_client(session, "ec2", region)
+
+    inventory = get_ec2_inventory(session)
 
-    snapshot_ids: list[str] = []
+    count = 0
     try:
-        # Only get snapshots owned by this account
-        response = client.describe_snapshots(OwnerIds=["self"])
-        snapshots = response.get("Snapshots", [])
-        snapshot_ids = [snap.get("SnapshotId") for snap in snapshots if snap.get("SnapshotId")]
-        logger.info("[%s][ec2][snapshot] Found %d snapshots", region, len(snapshot_ids))
+        if inventory is not None:
+            # Snapshots backing a registered AMI cannot be deleted until the AMI is deregistered
+            backing = {
+                mapping["Ebs"]["SnapshotId"]
+                for image in inventory.get(region, "images")
+                for mapping in image.get("BlockDeviceMappings", [])
+                if mapping.get("Ebs", {}).get("SnapshotId")
+            }
+            snapshots: Iterable[dict[str, Any]] = [
+                s for s in inventory.get(region, "snapshots") if s.get("SnapshotId") not in backing
+            ]
+            if backing:
+                logger.info("[%s][ec2][snapshot] Skipping snapshots of %d registered AMIs", region, len(backing))
+        else:
+            # Only get snapshots owned by this account (public and shared snapshots are filtered server-side)
+            snapshots = paginate(client, "describe_snapshots", "Snapshots", OwnerIds=["self"])
+        for snapshot in snapshots:
+            if snapshot.get("SnapshotId"):
+                count += 1
+                yield snapshot["SnapshotId"]
+        logger.info("[%s][ec2][snapshot] Found %d snapshots", region, count)
     except ClientError as e:
         logger.error("[%s][ec2][snapshot] Failed to describe snapshots: %s", region, e)
-        snapshot_ids = []
-    return snapshot_ids
 
 
-def cleanup_snapshot(session: Session, region: str, snapshot_id: Any, dry_run: bool = True) -> None:
+def cleanup_snapshot(session: Session, region: str, snapshot_id: Any, dry_run: bool = True) -> bool:
     """
     Delete a single EBS snapshot.
 
@@ -50,6 +71,9 @@ def cleanup_snapshot(session: Session, region: str, snapshot_id: Any, dry_run: b
         region: AWS region name.
         snapshot_id: Snapshot ID to delete.
         dry_run: If True, simulate deletion without making changes.
+
+    Returns:
+        True when the deletion failed with a transient error and should be retried.
     """
     reporter = get_reporter()
     action = "catalog" if dry_run else "delete"
@@ -65,11 +89,12 @@ def cleanup_snapshot(session: Session, region: str, snapshot_id: Any, dry_run: b
         arn=arn,
         meta={"status": status, "dry_run": dry_run},
     )
-    client = session.client("ec2", region_name=region)
+    client = get_client(session, "ec2", region)
     try:
         client.delete_snapshot(SnapshotId=snapshot_id, DryRun=dry_run)
         if not dry_run:
             logger.info("[%s][ec2][snapshot] Deleted snapshot_id=%s", region, snapshot_id)
+            forget_resources(session, region, "snapshots", [snapshot_id])
             # Update reporter with success status
             reporter.record(
                 region,
@@ -93,9 +118,17 @@ def cleanup_snapshot(session: Session, region: str, snapshot_id: Any, dry_run: b
                 arn=arn,
                 meta={"status": "failed", "dry_run": dry_run, "error": str(e)},
             )
+            return is_transient_error(e)
+    return False
 
 
-def cleanup_snapshots(session: Session, region: str, dry_run: bool = True, max_workers: int = 1) -> None:
+def cleanup_snapshots(
+    session: Session,
+    region: str,
+    dry_run: bool = True,
+    max_workers: int = 1,
+    resource_ids: list[Any] | None = None,
+) -> list[Any]:
     """
     Delete all EBS snapshots owned by the account in a region.
 
@@ -103,10 +136,20 @@ def cleanup_snapshots(session: Session, region: str, dry_run: bool = True, max_w
         session: Boto3 session for AWS credentials.
         region: AWS region name.
         dry_run: If True, simulate deletion without making changes.
-        max_workers: Number of threads for parallel execution.
+        max_workers: Maximum in-flight deletions for this handler (drawn from the shared execution pool).
+        resource_ids: Snapshot IDs to retry instead of cataloging the region.
+
+    Returns:
+        Snapshot IDs whose deletion failed with a transient error (see ``TRANSIENT_ERROR_CODES``).
     """
-    snapshot_ids: list = catalog_snapshots(session=session, region=region)
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(cleanup_snapshot, session, region, snap_id, dry_run) for snap_id in snapshot_ids]
-        for fut in as_completed(futures):
-            fut.result()
+    snapshot_ids: list = list(
+        catalog_snapshots(session=session, region=region) if resource_ids is None else resource_ids
+    )
+    retryable = get_execution_pool().map(
+        region,
+        partial(cleanup_snapshot, session, region, dry_run=dry_run),
+        snapshot_ids,
+        max_in_flight=max_workers,
+        gate=concurrency_gate(region, SERVICE),
+    )
+    return collect_retryable(snapshot_ids, retryable)
@@ -1,46 +1,72 @@
 """Handler for deleting EBS volumes."""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import Any
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.convergence import track_convergence
+from costcutter.core.execution import get_execution_pool
 from costcutter.reporter import get_reporter
-from costcutter.services.common import _get_account_id
+from costcutter.services.common import (
+    _get_account_id,
+    collect_retryable,
+    is_transient_error,
+    paginate,
+    retry_on_soft_blocker,
+)
+from costcutter.services.ec2.inventory import forget_resources, get_ec2_inventory
 
 SERVICE: str = "ec2"
 RESOURCE: str = "volume"
 logger = logging.getLogger(__name__)
 
 
-def catalog_volumes(session: Session, region: str) -> list[str]:
+def catalog_volumes(session: Session, region: str) -> Iterator[str]:
     """
-    List all available (unattached) EBS volumes in a region.
+    Yield all available (unattached) EBS volumes in a region.
 
     Args:
         session: Boto3 session for AWS credentials.
         region: AWS region name.
 
-    Returns:
-        List of volume IDs.
+    Yields:
+        Volume IDs, one describe page at a time.
     """
-    client = session.client(service_name="ec2", region_name=region)
+    client = get_client(session, "ec2", region)
+    inventory = get_ec2_inventory(session)
 
-    volume_ids: list[str] = []
+    count = 0
     try:
-        response = client.describe_volumes(Filters=[{"Name": "status", "Values": ["available"]}])
-        volumes = response.get("Volumes", [])
-        volume_ids = [vol.get("VolumeId") for vol in volumes if vol.get("VolumeId")]
-        logger.info("[%s][ec2][volume] Found %d available volumes", region, len(volume_ids))
+        if inventory is not None:
+            volumes: Iterable[dict[str, Any]] = [
+                v for v in inventory.get(region, "volumes") if v.get("State") == "available"
+            ]
+        else:
+            filters = [{"Name": "status", "Values": ["available"]}]
+            # DescribeVolumes accepts at most 500 results per page
+            volumes = paginate(client, "describe_volumes", "Volumes", max_page_size=500, Filters=filters)
+        for volume in volumes:
+            if volume.get("VolumeId"):
+                count += 1
+                yield volume["VolumeId"]
+        logger.info("[%s][ec2][volume] Found %d available volumes", region, count)
     except ClientError as e:
         logger.error("[%s][ec2][volume] Failed to describe volumes: %s", region, e)
-        volume_ids = []
-    return volume_ids
 
 
-def cleanup_volume(session: Session, region: str, volume_id: Any, dry_run: bool = True) -> None:
+@retry_on_soft_blocker()
+def _delete_volume(client: Any, volume_id: str, dry_run: bool) -> None:
+    """Delete a volume, retrying while it is still attached (e.g. VolumeInUse right after instance termination)."""
+    client.delete_volume(VolumeId=volume_id, DryRun=dry_run)
+
+
+def cleanup_volume(session: Session, region: str, volume_id: Any, dry_run: bool = True) -> bool:
     """
     Delete a single EBS volume.
 
@@ -49,6 +75,9 @@ def cleanup_volume(session: Session, region: str, volume_id: Any, dry_run: bool
         region: AWS region name.
         volume_id: Volume ID to delete.
         dry_run: If True, simulate deletion without making changes.
+
+    Returns:
+        True when the deletion failed with a transient error and should be retried.
     """
     reporter = get_reporter()
     action = "catalog" if dry_run else "delete"
@@ -64,9 +93,9 @@ def cleanup_volume(session: Session, region: str, volume_id: Any, dry_run: bool
         arn=arn,
         meta={"status": status, "dry_run": dry_run},
     )
-    client = session.client("ec2", region_name=region)
+    client = get_client(session, "ec2", region)
     try:
-        client.delete_volume(VolumeId=volume_id, DryRun=dry_run)
+        _delete_volume(client, volume_id, dry_run)
         if not dry_run:
             logger.info("[%s][ec2][volume] Deleted volume_id=%s", region, volume_id)
             # Update reporter with success status
@@ -78,6 +107,8 @@ def cleanup_volume(session: Session, region: str, volume_id: Any, dry_run: bool
                 arn=arn,
                 meta={"status": "deleted", "dry_run": False},
             )
+            track_convergence(region, "volume", [volume_id])
+            forget_resources(session, region, "volumes", [volume_id])
     except ClientError as e:
         code = e.response.get("Error", {}).get("Code") if hasattr(e, "response") else None
         if dry_run and code == "DryRunOperation":
@@ -92,9 +123,17 @@ def cleanup_volume(session: Session, region: str, volume_id: Any, dry_run: bool
                 arn=arn,
                 meta={"status": "failed", "dry_run": dry_run, "error": str(e)},
             )
+            return is_transient_error(e)
+    return False
 
 
-def cleanup_volumes(session: Session, region: str, dry_run: bool = True, max_workers: int = 1) -> None:
+def cleanup_volumes(
+    session: Session,
+    region: str,
+    dry_run: bool = True,
+    max_workers: int = 1,
+    resource_ids: list[Any] | None = None,
+) -> list[Any]:
     """
     Delete all available (unattached) EBS volumes in a region.
 
@@ -102,10 +141,18 @@ def cleanup_volumes(session: Session, region: str, dry_run: bool = True, max_wor
         session: Boto3 session for AWS credentials.
         region: AWS region name.
         dry_run: If True, simulate deletion without making changes.
-        max_workers: Number of threads for parallel execution.
+        max_workers: Maximum in-flight deletions for this handler (drawn from the shared execution pool).
+        resource_ids: Volume IDs to retry instead of cataloging the region.
+
+    Returns:
+        Volume IDs whose deletion failed with a transient error (see ``TRANSIENT_ERROR_CODES``).
     """
-    volume_ids: list = catalog_volumes(session=session, region=region)
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(cleanup_volume, session, region, vol_id, dry_run) for vol_id in volume_ids]
-        for fut in as_completed(futures):
-            fut.result()
+    volume_ids: list = list(catalog_volumes(session=session, region=region) if resource_ids is None else resource_ids)
+    retryable = get_execution_pool().map(
+        region,
+        partial(cleanup_volume, session, region, dry_run=dry_run),
+        volume_ids,
+        max_in_flight=max_workers,
+        gate=concurrency_gate(region, SERVICE),
+    )
+    return collect_retryable(volume_ids, retryable)
@@ -1,11 +1,15 @@
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Any
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.execution import get_execution_pool
 from costcutter.reporter import get_reporter
-from costcutter.services.common import _get_account_id
+from costcutter.services.common import _get_account_id, collect_retryable, is_transient_error
 
 SERVICE: str = "elasticbeanstalk"
 RESOURCE: str = "application"
@@ -13,7 +17,7 @@ logger = logging.getLogger(__name__)
 
 
 def catalog_applications(session: Session, region: str) -> list[str]:
-    client = session.client(service_name="elasticbeanstalk", region_name=region)
+    client = get_client(session, "elasticbeanstalk", region)
 
     application_names: list[str] = []
     try:
@@ -29,7 +33,7 @@ def catalog_applications(session: Session, region: str) -> list[str]:
     return application_names
 
 
-def cleanup_application(session: Session, region: str, application_name: str, dry_run: bool = True) -> None:
+def cleanup_application(session: Session, region: str, application_name: str, dry_run: bool = True) -> bool:
     reporter = get_reporter()
     action = "catalog" if dry_run else "delete"
     status = "discovered" if dry_run else "executing"
@@ -53,9 +57,9 @@ def cleanup_application(session: Session, region: str, application_name: str, dr
             region,
             application_name,
         )
-        return
+        return False
 
-    client = session.client("elasticbeanstalk", region_name=region)
+    client = get_client(session, "elasticbeanstalk", region)
 
     try:
         # Delete the application with TerminateEnvByForce to handle any remaining environments
@@ -94,11 +98,25 @@ def cleanup_application(session: Session, region: str, application_name: str, dr
             arn=arn,
             meta={"status": "failed", "dry_run": False, "error": str(e)},
         )
-
-
-def cleanup_applications(session: Session, region: str, dry_run: bool = True, max_workers: int = 1) -> None:
-    application_names: list[str] = catalog_applications(session=session, region=region)
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(cleanup_application, session, region, app_name, dry_run) for app_name in application_names]
-        for fut in as_completed(futures):
-            fut.result()
+        return is_transient_error(e)
+    return False
+
+
+def cleanup_applications(
+    session: Session,
+    region: str,
+    dry_run: bool = True,
+    max_workers: int = 1,
+    resource_ids: list[Any] | None = None,
+) -> list[Any]:
+    application_names: list[str] = (
+        catalog_applications(session=session, region=region) if resource_ids is None else list(resource_ids)
+    )
+    retryable = get_execution_pool().map(
+        region,
+        partial(cleanup_application, session, region, dry_run=dry_run),
+        application_names,
+        max_in_flight=max_workers,
+        gate=concurrency_gate(region, SERVICE),
+    )
+    return collect_retryable(application_names, retryable)
@@ -1,11 +1,17 @@
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Any
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.convergence import track_convergence
+from costcutter.core.execution import get_execution_pool
 from costcutter.reporter import get_reporter
-from costcutter.services.common import _get_account_id
+from costcutter.services.common import _get_account_id, collect_retryable, is_transient_error
+from costcutter.services.ec2.inventory import invalidate_inventory
 
 SERVICE: str = "elasticbeanstalk"
 RESOURCE: str = "environment"
@@ -13,7 +19,7 @@ logger = logging.getLogger(__name__)
 
 
 def catalog_environments(session: Session, region: str) -> list[str]:
-    client = session.client(service_name="elasticbeanstalk", region_name=region)
+    client = get_client(session, "elasticbeanstalk", region)
 
     environment_names: list[str] = []
     try:
@@ -32,7 +38,7 @@ def catalog_environments(session: Session, region: str) -> list[str]:
     return environment_names
 
 
-def cleanup_environment(session: Session, region: str, environment_name: str, dry_run: bool = True) -> None:
+def cleanup_environment(session: Session, region: str, environment_name: str, dry_run: bool = True) -> bool:
     reporter = get_reporter()
     action = "catalog" if dry_run else "delete"
     status = "discovered" if dry_run else "executing"
@@ -56,9 +62,9 @@ def cleanup_environment(session: Session, region: str, environment_name: str, dr
             region,
             environment_name,
         )
-        return
+        return False
 
-    client = session.client("elasticbeanstalk", region_name=region)
+    client = get_client(session, "elasticbeanstalk", region)
 
     try:
         # Terminate the environment (does not delete immediately, but marks for termination)
@@ -81,6 +87,14 @@ def cleanup_environment(session: Session, region: str, environment_name: str, dr
             arn=arn,
             meta={"status": "terminated", "dry_run": False},
         )
+        # Applications and security groups wait until the environment is fully terminated
+        terminated = track_convergence(region, "environment", [environment_name])
+        # Termination deletes the environment's security groups and network interfaces
+        invalidate = partial(invalidate_inventory, session, region, "security_groups", "network_interfaces")
+        if terminated is None:
+            invalidate()
+        else:
+            terminated.add_done_callback(lambda _: invalidate())
 
     except ClientError as e:
         logger.error(
@@ -97,11 +111,25 @@ def cleanup_environment(session: Session, region: str, environment_name: str, dr
             arn=arn,
             meta={"status": "failed", "dry_run": False, "error": str(e)},
         )
-
-
-def cleanup_environments(session: Session, region: str, dry_run: bool = True, max_workers: int = 1) -> None:
-    environment_names: list[str] = catalog_environments(session=session, region=region)
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(cleanup_environment, session, region, env_name, dry_run) for env_name in environment_names]
-        for fut in as_completed(futures):
-            fut.result()
+        return is_transient_error(e)
+    return False
+
+
+def cleanup_environments(
+    session: Session,
+    region: str,
+    dry_run: bool = True,
+    max_workers: int = 1,
+    resource_ids: list[Any] | None = None,
+) -> list[Any]:
+    environment_names: list[str] = (
+        catalog_environments(session=session, region=region) if resource_ids is None else list(resource_ids)
+    )
+    retryable = get_execution_pool().map(
+        region,
+        partial(cleanup_environment, session, region, dry_run=dry_run),
+        environment_names,
+        max_in_flight=max_workers,
+        gate=concurrency_gate(region, SERVICE),
+    )
+    return collect_retryable(environment_names, retryable)
@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from typing import Any
 
 from boto3.session import Session
 
@@ -7,7 +8,7 @@ from costcutter.services.s3.buckets import cleanup_buckets
 _HANDLERS = {"buckets": cleanup_buckets}
 
 
-def get_handler_for_resource(resource_type: str) -> Callable[..., None] | None:
+def get_handler_for_resource(resource_type: str) -> Callable[..., list[Any]] | None:
     """Get the handler function for a specific S3 resource type.
 
     Args:
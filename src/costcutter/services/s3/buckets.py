@@ -1,46 +1,83 @@
+import heapq
 import logging
-from collections.abc import Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from functools import partial
+from itertools import count, islice
 from typing import Any
 
 from boto3.session import Session
 from botocore.exceptions import ClientError
 
+from costcutter.core.client_pool import get_client
+from costcutter.core.concurrency import THROTTLING_ERROR_CODES, concurrency_gate
+from costcutter.core.execution import RetryLater, current_attempt, get_execution_pool
+from costcutter.dependencies import GLOBAL_REGION
 from costcutter.reporter import get_reporter
+from costcutter.services.common import collect_retryable, is_transient_error
+from costcutter.services.s3.checkpoints import get_list_checkpoints
+from costcutter.services.s3.estimates import estimate_object_counts, largest_first
+from costcutter.services.s3.expiration import install_expiration, is_empty, is_expiring
+from costcutter.services.s3.freeze import freeze_writes, thaw_writes
+from costcutter.services.s3.listing import sharded_catalog_objects
+from costcutter.services.s3.manifest import find_manifest, read_manifest
+from costcutter.services.s3.object_lock import DELETABLE, LOCKED, PARTIAL, ObjectLockAssessment, assess_object_lock
+from costcutter.services.s3.regions import UNKNOWN_REGION, get_bucket_region_index
+from costcutter.services.s3.sampling import estimate_bucket
+from costcutter.services.s3.settings import get_s3_settings
 
 SERVICE: str = "s3"
 RESOURCE: str = "buckets"
 logger = logging.getLogger(__name__)
 
+# DeleteObjects accepts at most 1000 keys per request
+DELETE_OBJECTS_BATCH_SIZE = 1000
+# Per-key DeleteObjects errors worth another attempt
+RETRYABLE_KEY_ERROR_CODES = THROTTLING_ERROR_CODES | {"InternalError", "ServiceUnavailable", "RequestTimeout"}
+# Upper bound for the backoff of a retried key
+KEY_RETRY_MAX_DELAY = 30.0
+# Bucket deletion errors that invalidate a listing checkpoint
+CHECKPOINT_RESET_ERROR_CODES = {"NoSuchBucket", "BucketNotEmpty"}
 
-def catalog_objects(client: Any, bucket_name: str, region: str) -> Iterator[dict[str, str | None]]:
+
+def catalog_objects(
+    client: Any, bucket_name: str, region: str, start: dict[str, str] | None = None
+) -> Iterator[dict[str, Any]]:
     """Stream top-level objects and versions for a bucket.
 
-    Yields dicts with 'Key' and optional 'VersionId'. Does not accumulate all
-    results in memory.
+    Yields dicts with 'Key', optional 'VersionId' and 'Size' (0 for delete markers).
+    The last object of every truncated ``ListObjectVersions`` page also carries a
+    'Checkpoint': the ``KeyMarker``/``VersionIdMarker`` to resume listing from once
+    it and every object before it are deleted. Does not accumulate all results in memory.
+
+    Args:
+        start: Marker to resume listing from (a previous 'Checkpoint').
     """
     try:
         # List object versions first; include DeleteMarkers so VersionId deletions work.
         paginator = client.get_paginator("list_object_versions")
         any_versions = False
-        for page in paginator.paginate(Bucket=bucket_name, Prefix=""):
-            # "Versions" contains actual object versions
-            if "Versions" in page:
-                any_versions = True
-                for v in page["Versions"]:
-                    yield {"Key": v["Key"], "VersionId": v.get("VersionId")}
-            # "DeleteMarkers" contains delete markers (also need VersionId)
-            if "DeleteMarkers" in page:
-                any_versions = True
-                for d in page["DeleteMarkers"]:
-                    yield {"Key": d["Key"], "VersionId": d.get("VersionId")}
+        for page in paginator.paginate(Bucket=bucket_name, Prefix="", **(start or {})):
+            # "Versions" contains actual object versions, "DeleteMarkers" delete markers (also need VersionId)
+            objects = [
+                {"Key": v["Key"], "VersionId": v.get("VersionId"), "Size": v.get("Size", 0)}
+                for v in page.get("Versions", [])
+            ]
+            objects += [{"Key": d["Key"], "VersionId": d.get("VersionId")} for d in page.get("DeleteMarkers", [])]
+            any_versions = any_versions or "Versions" in page or "DeleteMarkers" in page
+            if objects and page.get("IsTruncated") and page.get("NextKeyMarker"):
+                objects[-1]["Checkpoint"] = {"KeyMarker": page["NextKeyMarker"]}
+                if page.get("NextVersionIdMarker"):
+                    objects[-1]["Checkpoint"]["VersionIdMarker"] = page["NextVersionIdMarker"]
+            yield from objects
         # Fall back to list_objects_v2 for non-versioned buckets (no VersionId).
         if not any_versions:
             paginator = client.get_paginator("list_objects_v2")
             for page in paginator.paginate(Bucket=bucket_name, Prefix=""):
                 if "Contents" in page:
                     for obj in page["Contents"]:
-                        yield {"Key": obj["Key"], "VersionId": None}
+                        yield {"Key": obj["Key"], "VersionId": None, "Size": obj.get("Size", 0)}
         logger.info(
             "[%s][s3] catalog_objects: finished streaming objects for bucket=%s",
             region,
@@ -51,137 +88,374 @@ def catalog_objects(client: Any, bucket_name: str, region: str) -> Iterator[dict
         return
 
 
-def abort_multipart_uploads(client: Any, bucket_name: str, region: str) -> int:
-    """Abort any in-progress multipart uploads for the bucket."""
-    aborted = 0
+def _abort_upload(client: Any, bucket_name: str, region: str, upload: dict[str, Any]) -> Counter:
+    """Abort one multipart upload, counting the bytes of its uploaded parts."""
+    key = upload["Key"]
+    upload_id = upload["UploadId"]
+    size = 0
     try:
+        paginator = client.get_paginator("list_parts")
+        for page in paginator.paginate(Bucket=bucket_name, Key=key, UploadId=upload_id):
+            size += sum(part.get("Size", 0) for part in page.get("Parts", []))
+    except ClientError as e:
+        # The size is only reported; the upload is aborted regardless
+        logger.debug("[%s][s3] abort_multipart_uploads: could not list parts Key=%s: %s", region, key, e)
+    try:
+        client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
+    except ClientError as e:
+        logger.warning(
+            "[%s][s3] abort_multipart_uploads: failed abort upload Key=%s UploadId=%s: %s",
+            region,
+            key,
+            upload_id,
+            e,
+        )
+        return Counter()
+    return Counter(uploads=1, bytes=size)
+
+
+def abort_multipart_uploads(
+    client: Any, bucket_name: str, region: str, max_in_flight: int | None = None
+) -> dict[str, int]:
+    """Abort any in-progress multipart uploads for the bucket.
+
+    Uploads are aborted concurrently on the shared execution pool, within the region's S3
+    concurrency gate, while the listing of further uploads continues.
+
+    Returns:
+        Number of aborted ``uploads`` and the ``bytes`` of their uploaded parts.
+    """
+
+    def uploads() -> Iterator[dict[str, Any]]:
         paginator = client.get_paginator("list_multipart_uploads")
         for page in paginator.paginate(Bucket=bucket_name):
-            uploads = page.get("Uploads", [])
-            for up in uploads:
-                key = up.get("Key")
-                upload_id = up.get("UploadId")
-                if not key or not upload_id:
-                    continue
-                try:
-                    client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
-                    aborted += 1
-                except ClientError as e:
-                    logger.warning(
-                        "[%s][s3] abort_multipart_uploads: failed abort upload Key=%s UploadId=%s: %s",
-                        region,
-                        key,
-                        upload_id,
-                        e,
-                    )
-        logger.info("[%s][s3] abort_multipart_uploads: aborted %d uploads for bucket=%s", region, aborted, bucket_name)
+            for up in page.get("Uploads", []):
+                if up.get("Key") and up.get("UploadId"):
+                    yield up
+
+    totals: Counter = Counter()
+    try:
+        aborts = get_execution_pool().imap(
+            region,
+            partial(_abort_upload, client, bucket_name, region),
+            uploads(),
+            max_in_flight=max_in_flight or get_s3_settings().delete_workers,
+            gate=concurrency_gate(region, SERVICE),
+        )
+        for counts in aborts:
+            totals.update(counts)
+        logger.info(
+            "[%s][s3] abort_multipart_uploads: aborted %d uploads (%d bytes) for bucket=%s",
+            region,
+            totals["uploads"],
+            totals["bytes"],
+            bucket_name,
+        )
     except ClientError as e:
         logger.exception("[%s][s3] Failed to list/abort multipart uploads: %s", region, e)
-    return aborted
+    return {"uploads": totals["uploads"], "bytes": totals["bytes"]}
 
 
-def cleanup_objects(
-    client: Any, bucket_name: str, objects_iter: Iterator[dict[str, str | None]], region: str, reporter
-) -> None:
-    """Delete objects in batches of <=1000. Objects must be dicts with 'Key' and optional 'VersionId'."""
-    batch: list[dict[str, str]] = []
-
-    def _flush_batch():
-        nonlocal batch
-        if not batch:
-            return
-        try:
-            response = client.delete_objects(Bucket=bucket_name, Delete={"Objects": batch, "Quiet": False})
-            logger.info(
-                "[%s][s3] cleanup_objects: delete_objects response Deleted=%s",
-                region,
-                response.get("Deleted", []),
-            )
-            if "Errors" in response:
-                logger.error(
-                    "[%s][s3] cleanup_objects: delete_objects reported errors=%s",
-                    region,
-                    response["Errors"],
-                )
-                # Record a failure event per errored object so reporter shows final status
-                for err in response["Errors"]:
-                    key = err.get("Key")
-                    ver = err.get("VersionId")
-                    code = err.get("Code")
-                    message = err.get("Message")
-                    obj_arn = f"arn:aws:s3:::{bucket_name}/{key}"
-                    meta_fail = {"status": "failed", "key": key, "error_code": code, "error_message": message}
-                    if ver:
-                        meta_fail["version_id"] = ver
-                    try:
-                        reporter.record(region, SERVICE, "object", "delete", arn=obj_arn, meta=meta_fail)
-                    except Exception:
-                        # never fail the delete flow because reporting failed
-                        logger.exception("[%s][s3] failed to record delete error for %s", region, key)
-        except ClientError as e:
+def _record_key_failure(bucket_name: str, err: dict[str, Any], region: str, reporter) -> None:
+    key = err.get("Key")
+    meta_fail = {"status": "failed", "key": key, "error_code": err.get("Code"), "error_message": err.get("Message")}
+    if err.get("VersionId"):
+        meta_fail["version_id"] = err["VersionId"]
+    try:
+        reporter.record(region, SERVICE, "object", "delete", arn=f"arn:aws:s3:::{bucket_name}/{key}", meta=meta_fail)
+    except Exception:
+        # never fail the delete flow because reporting failed
+        logger.exception("[%s][s3] failed to record delete error for %s", region, key)
+
+
+def _delete_batch(
+    client: Any,
+    bucket_name: str,
+    batch: Sequence[dict[str, Any]],
+    region: str,
+    reporter,
+    max_attempts: int = 0,
+    delay: float = 0.0,
+    locked: bool = False,
+) -> tuple[Counter, list[dict[str, Any]]]:
+    """Delete one batch of up to 1000 objects and record a failure event per errored key.
+
+    ``Quiet`` mode makes S3 report only the keys it failed to delete, so the response
+    size does not grow with the batch. Keys that failed with a retryable error (see
+    ``RETRYABLE_KEY_ERROR_CODES``) and were attempted fewer than ``max_attempts`` times
+    are returned for another attempt instead of being recorded as failed.
+
+    Args:
+        delay: Seconds to defer the call on the execution pool first (retried keys).
+        locked: The bucket holds Object Lock versions: keys denied with ``AccessDenied`` are
+            counted as ``locked`` instead of failed.
+
+    Returns:
+        Counts of deleted ``objects``, ``versions`` and ``bytes`` and of ``failed`` and ``locked``
+        keys, and the objects to retry (with their ``Attempts`` count incremented).
+    """
+    if delay > 0 and current_attempt() == 0:
+        raise RetryLater(delay)
+    entries: list[dict[str, str]] = []
+    for obj in batch:
+        # omit VersionId when None
+        entry = {"Key": obj["Key"]}
+        if obj.get("VersionId"):
+            entry["VersionId"] = obj["VersionId"]
+        entries.append(entry)
+    try:
+        response = client.delete_objects(Bucket=bucket_name, Delete={"Objects": entries, "Quiet": True})
+        errors = response.get("Errors", [])
+    except ClientError as e:
+        error = e.response.get("Error", {})
+        if error.get("Code") not in RETRYABLE_KEY_ERROR_CODES:
             logger.exception("[%s][s3] _delete_objects_in_batches: Error deleting objects: %s", region, e)
-        batch = []
+            for entry in entries:
+                _record_key_failure(
+                    bucket_name, {**entry, "Code": error.get("Code"), "Message": error.get("Message")}, region, reporter
+                )
+            return Counter(failed=len(batch)), []
+        # A throttled or failed call is retried like per-key errors
+        errors = [{**entry, "Code": error.get("Code"), "Message": error.get("Message")} for entry in entries]
 
-    for obj in objects_iter:
-        key = obj.get("Key")
-        if not key:
+    by_key = {(obj["Key"], obj.get("VersionId") or None): obj for obj in batch}
+    counts: Counter = Counter()
+    retry: list[dict[str, Any]] = []
+    for err in errors:
+        obj = by_key.pop((err.get("Key"), err.get("VersionId") or None), None)
+        if locked and err.get("Code") == "AccessDenied":
+            # Expected for versions under retention or legal hold
+            counts["locked"] += 1
+            continue
+        attempts = (obj or {}).get("Attempts", 0) + 1
+        if obj is not None and err.get("Code") in RETRYABLE_KEY_ERROR_CODES and attempts < max_attempts:
+            retry.append({**obj, "Attempts": attempts})
             continue
-        version_id = obj.get("VersionId")
-        # record each object's ARN (meta includes VersionId when present).
-        obj_arn = f"arn:aws:s3:::{bucket_name}/{key}"
-        meta = {"status": "executing", "key": key}
-        if version_id:
-            meta["version_id"] = version_id
-        reporter.record(region, SERVICE, "object", "delete", arn=obj_arn, meta=meta)
+        # Record a failure event per errored object so reporter shows final status
+        counts["failed"] += 1
+        _record_key_failure(bucket_name, err, region, reporter)
+    if counts["failed"]:
+        logger.error(
+            "[%s][s3] cleanup_objects: delete_objects reported errors=%s",
+            region,
+            errors,
+        )
+    for obj in by_key.values():
+        counts["objects"] += 1
+        counts["versions"] += 1 if obj.get("VersionId") else 0
+        counts["bytes"] += obj.get("Size") or 0
+    return counts, retry
+
+
+class _KeyRetries:
+    """Backoff queue of errored keys, folded into the batches that follow.
+
+    Only touched from the thread consuming the deletion pipeline, so it needs no lock.
+    """
+
+    def __init__(self, base_delay: float) -> None:
+        self._base_delay = base_delay
+        self._heap: list[tuple[float, int, dict[str, Any]]] = []
+        self._seq = count()
+        # Keys queued or sent again whose outcome is not known yet
+        self.outstanding = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def push(self, objects: list[dict[str, Any]]) -> None:
+        for obj in objects:
+            delay = min(KEY_RETRY_MAX_DELAY, self._base_delay * 2 ** (obj["Attempts"] - 1))
+            # A retried key no longer marks a resumable position
+            obj.pop("Checkpoint", None)
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), obj))
+        self.outstanding += len(objects)
+
+    def ready(self, limit: int) -> list[dict[str, Any]]:
+        """Pop up to ``limit`` keys whose backoff has elapsed."""
+        now = time.monotonic()
+        objects: list[dict[str, Any]] = []
+        while self._heap and len(objects) < limit and self._heap[0][0] <= now:
+            objects.append(heapq.heappop(self._heap)[2])
+        return objects
+
+    def drain(self) -> Iterator[tuple[float, list[dict[str, Any]]]]:
+        """Pop every key as batches paired with the delay until the batch's last key is due."""
+        while self._heap:
+            batch = [heapq.heappop(self._heap) for _ in range(min(DELETE_OBJECTS_BATCH_SIZE, len(self._heap)))]
+            yield max(0.0, batch[-1][0] - time.monotonic()), [obj for _, _, obj in batch]
+
+
+def cleanup_objects(
+    client: Any,
+    bucket_name: str,
+    objects_iter: Iterator[dict[str, Any]],
+    region: str,
+    reporter,
+    max_in_flight: int | None = None,
+    checkpoint: Callable[[dict[str, str]], None] | None = None,
+    locked: bool = False,
+    summarize: bool = True,
+) -> dict[str, int]:
+    """Delete objects in batches of <=1000. Objects must be dicts with 'Key' and optional 'VersionId' and 'Size'.
+
+    Listing and deletion form a pipeline: ``objects_iter`` is consumed on the calling thread
+    while up to ``max_in_flight`` ``DeleteObjects`` calls run on the shared execution pool.
+    At most twice that many batches are buffered, so memory stays flat for any bucket size.
+
+    Keys that fail with a retryable error (e.g. ``SlowDown``, ``InternalError``) are re-queued
+    with exponential backoff and folded into later batches, up to ``aws.s3.key_retry_attempts``
+    attempts per key, so a few throttled keys do not leave the bucket non-empty.
+
+    Deletions are reported as one per-bucket event carrying the counts; only failed keys get
+    an event of their own, so reporting memory grows with failures, not objects. With
+    ``aws.s3.object_events`` every object is also recorded before it is deleted.
+
+    ``checkpoint`` is called with an object's 'Checkpoint' marker once that object and every
+    object before it are deleted and no key is waiting for a retry.
 
-        # build per-object delete entry; omit VersionId when None
-        entry: dict[str, str] = {"Key": key}
-        if version_id:
-            entry["VersionId"] = version_id
-        batch.append(entry)
+    With ``locked`` (a bucket holding Object Lock versions), keys denied with ``AccessDenied``
+    are counted as ``locked`` without an event of their own.
+
+    With ``summarize`` off, the counts are returned without the per-bucket event, for callers
+    that delete a bucket in several passes and record one summary.
+
+    Returns:
+        Counts of deleted ``objects``, ``versions`` (versioned entries and delete markers)
+        and ``bytes``, and of ``failed`` keys (and ``locked`` keys, when there are any).
+    """
+    settings = get_s3_settings()
+    retries = _KeyRetries(settings.key_retry_base_delay)
+
+    def entries() -> Iterator[dict[str, Any]]:
+        for obj in objects_iter:
+            key = obj.get("Key")
+            if not key:
+                continue
+            if settings.object_events:
+                # record each object's ARN (meta includes VersionId when present).
+                meta = {"status": "executing", "key": key}
+                if obj.get("VersionId"):
+                    meta["version_id"] = obj["VersionId"]
+                reporter.record(region, SERVICE, "object", "delete", arn=f"arn:aws:s3:::{bucket_name}/{key}", meta=meta)
+            yield obj
+
+    def batches() -> Iterator[tuple[float, list[dict[str, Any]]]]:
+        # Keys whose backoff elapsed ride along with freshly listed ones
+        fresh = entries()
+        while True:
+            batch = retries.ready(DELETE_OBJECTS_BATCH_SIZE)
+            batch.extend(islice(fresh, DELETE_OBJECTS_BATCH_SIZE - len(batch)))
+            if not batch:
+                return
+            yield 0.0, batch
+
+    delete = partial(
+        _delete_batch,
+        client,
+        bucket_name,
+        region=region,
+        reporter=reporter,
+        max_attempts=settings.key_retry_attempts,
+        locked=locked,
+    )
+
+    def run(item: tuple[float, list[dict[str, Any]]]) -> tuple[Counter, list[dict[str, Any]], int, dict | None]:
+        delay, batch = item
+        counts, retry = delete(batch, delay=delay)
+        markers = [obj["Checkpoint"] for obj in batch if obj.get("Checkpoint")]
+        return counts, retry, sum(1 for obj in batch if obj.get("Attempts")), markers[-1] if markers else None
+
+    totals: Counter = Counter()
+    source = batches()
+    # Keys still backing off when the listing ends are retried in further rounds
+    while True:
+        deletes = get_execution_pool().imap(
+            region,
+            run,
+            source,
+            max_in_flight=max_in_flight or settings.delete_workers,
+            gate=concurrency_gate(region, SERVICE),
+        )
+        # Results arrive in batch order, so a marker is safe once nothing before it is pending
+        for counts, retry, retried, marker in deletes:
+            totals.update(counts)
+            retries.outstanding -= retried
+            retries.push(retry)
+            if checkpoint is not None and marker and not retries.outstanding and not totals["failed"]:
+                checkpoint(marker)
+        if not retries:
+            break
+        logger.info("[%s][s3] cleanup_objects: retrying throttled keys of bucket=%s", region, bucket_name)
+        source = retries.drain()
+
+    if not summarize:
+        return dict(totals)
+    return _record_summary(reporter, region, bucket_name, totals)
+
+
+def _record_summary(reporter, region: str, bucket_name: str, totals: Counter) -> dict[str, int]:
+    """Record the per-bucket deletion event and return its counts."""
+    summary = {name: totals[name] for name in ("objects", "versions", "bytes", "failed")}
+    if totals["locked"]:
+        summary["locked"] = totals["locked"]
+    reporter.record(
+        region,
+        SERVICE,
+        "object",
+        "delete",
+        arn=f"arn:aws:s3:::{bucket_name}/*",
+        meta={"status": "deleted" if not summary["failed"] else "failed", **summary},
+    )
+    return summary
 
-        if len(batch) >= 1000:
-            _flush_batch()
 
-    # final flush
-    _flush_batch()
+def _outside_prefixes(objects: Iterator[dict[str, Any]], prefixes: tuple[str, ...]) -> Iterator[dict[str, Any]]:
+    """Drop the objects under any of ``prefixes``."""
+    return (obj for obj in objects if not obj.get("Key", "").startswith(prefixes))
 
 
 def catalog_buckets(session: Session, region: str) -> list[str]:
-    # Use an S3 client without a forced region to list and query bucket locations.
-    client = session.client(service_name="s3")
+    """Return the buckets located in ``region``, from the run-level bucket region index."""
+    bucket_names = get_bucket_region_index(session).buckets_in(region)
+    logger.info("[%s][s3] catalog_buckets: discovered %d buckets in region %s", region, len(bucket_names), region)
+    return bucket_names
+
 
-    bucket_names: list[str] = []
+def _record_estimate(session: Session, region: str, bucket_name: str) -> None:
+    """Sample a bucket's key space and record its estimated size and deletion time."""
+    settings = get_s3_settings()
     try:
-        resp = client.list_buckets()
-        buckets = resp.get("Buckets", [])
-        for b in buckets:
-            name = b.get("Name")
-            if not name:
-                continue
-            try:
-                # Some test/dummy clients may not implement get_bucket_location.
-                if not hasattr(client, "get_bucket_location"):
-                    # assume the bucket is in the requested region
-                    bucket_region = region
-                else:
-                    loc = client.get_bucket_location(Bucket=name).get("LocationConstraint")
-                    # AWS returns None for us-east-1
-                    bucket_region = loc or "us-east-1"
-            except ClientError as e:
-                logger.warning("[%s][s3] could not get location for bucket=%s: %s", region, name, e)
-                continue
-            # include bucket only if its location matches the requested region
-            if bucket_region == region:
-                bucket_names.append(name)
-        logger.info("[%s][s3] catalog_buckets: discovered %d buckets in region %s", region, len(bucket_names), region)
+        estimate = estimate_bucket(
+            get_client(session, "s3", region),
+            bucket_name,
+            region,
+            positions=settings.estimate_probes,
+            delete_workers=settings.delete_workers,
+            list_shards=settings.list_shards,
+        )
     except ClientError as e:
-        logger.exception("[%s][s3] Failed to list buckets: %s", region, e)
-        bucket_names = []
-    return bucket_names
+        logger.warning("[%s][s3][bucket] could not estimate bucket=%s: %s", region, bucket_name, e)
+        return
+    logger.info(
+        "[%s][s3][bucket] dry-run: bucket=%s holds ~%d versions (%d bytes), projected deletion %.1fs",
+        region,
+        bucket_name,
+        estimate["versions"],
+        estimate["bytes"],
+        estimate["projected_seconds"],
+    )
+    get_reporter().record(
+        region,
+        SERVICE,
+        RESOURCE,
+        "estimate",
+        arn=f"arn:aws:s3:::{bucket_name}",
+        meta={"status": "estimated", "dry_run": True, **estimate},
+    )
 
 
-def cleanup_bucket(session: Session, region: str, bucket_name: str, dry_run: bool = True) -> None:
+def cleanup_bucket(session: Session, region: str, bucket_name: str, dry_run: bool = True) -> bool:
     reporter = get_reporter()
     action = "catalog" if dry_run else "delete"
     status = "discovered" if dry_run else "executing"
@@ -200,21 +474,99 @@ def cleanup_bucket(session: Session, region: str, bucket_name: str, dry_run: boo
     # S3 ARNs omit account id; region is used for logging.
     if dry_run:
         logger.info("[%s][s3][bucket] dry-run: would process bucket=%s", region, bucket_name)
-        return
+        if get_s3_settings().dry_run_estimate:
+            _record_estimate(session, region, bucket_name)
+        return False
+    checkpoints = get_list_checkpoints()
+    client = None
+    frozen = None
     try:
-        client = session.client("s3", region_name=region)
-        # Abort any in-progress multipart uploads first
-        abort_multipart_uploads(client=client, bucket_name=bucket_name, region=region)
+        client = get_client(session, "s3", region)
+        lock = ObjectLockAssessment(DELETABLE)
+        if get_s3_settings().object_lock_check:
+            lock = assess_object_lock(client, bucket_name, region)
+        if lock.status == LOCKED:
+            # Every delete would be denied: do not list the bucket at all
+            logger.warning("[%s][s3][bucket] skipping Object Lock bucket=%s: %s", region, bucket_name, lock.reason)
+            reporter.record(
+                region,
+                SERVICE,
+                RESOURCE,
+                "delete",
+                arn=arn,
+                meta={"status": "skipped", "dry_run": False, "reason": f"object lock: {lock.reason}"},
+            )
+            return False
+        if get_s3_settings().freeze_writes:
+            # Keep producers from refilling the bucket while it is emptied
+            frozen = freeze_writes(client, bucket_name, region)
 
         # Stream objects/versions and delete in batches to avoid memory blowup.
-        objects_iter = catalog_objects(client=client, bucket_name=bucket_name, region=region)
-        # Use the batched deleter which also records per-object reports.
-        cleanup_objects(
-            client=client, bucket_name=bucket_name, objects_iter=objects_iter, region=region, reporter=reporter
+        shards = get_s3_settings().list_shards
+        checkpoint = None
+        if shards > 1:
+            objects_iter = sharded_catalog_objects(client, bucket_name, region, shards)
+        else:
+            # Resume an interrupted wipe from the last fully deleted listing position
+            start = checkpoints.get(bucket_name) if checkpoints is not None else None
+            if start:
+                logger.info("[%s][s3][bucket] resuming bucket=%s from %s", region, bucket_name, start)
+            objects_iter = catalog_objects(client=client, bucket_name=bucket_name, region=region, start=start)
+            if checkpoints is not None:
+                checkpoint = partial(checkpoints.update, bucket_name)
+        if lock.locked_prefixes:
+            # Prefixes where the probe found locked versions are left as they are
+            objects_iter = _outside_prefixes(objects_iter, lock.locked_prefixes)
+        delete_objects = partial(
+            cleanup_objects,
+            client=client,
+            bucket_name=bucket_name,
+            region=region,
+            reporter=reporter,
+            locked=lock.status == PARTIAL,
+            summarize=False,
         )
+        manifest = find_manifest(get_s3_settings().manifest_dir, bucket_name)
+
+        def empty_bucket() -> dict[str, int]:
+            totals: Counter = Counter()
+            if manifest is not None:
+                # Known keys go straight to the deleter; the listing below only verifies
+                logger.info(
+                    "[%s][s3][bucket] deleting keys of bucket=%s from manifest %s", region, bucket_name, manifest
+                )
+                known = read_manifest(manifest, get_s3_settings().manifest_columns)
+                totals.update(delete_objects(objects_iter=_outside_prefixes(known, lock.locked_prefixes)))
+            totals.update(delete_objects(objects_iter=objects_iter, checkpoint=checkpoint))
+            # One summary covers the manifest and the verification listing
+            return _record_summary(reporter, region, bucket_name, totals)
+
+        # Abort in-progress multipart uploads while objects are listed and deleted by the batched deleter
+        steps = [partial(abort_multipart_uploads, client=client, bucket_name=bucket_name, region=region), empty_bucket]
+        aborted, _ = get_execution_pool().map(region, lambda step: step(), steps)
+        if lock.status == PARTIAL:
+            # Locked versions remain, so the bucket itself cannot be deleted yet
+            logger.warning(
+                "[%s][s3][bucket] emptied unlocked versions of bucket=%s: %s", region, bucket_name, lock.reason
+            )
+            if checkpoints is not None:
+                checkpoints.clear(bucket_name)
+            reporter.record(
+                region,
+                SERVICE,
+                RESOURCE,
+                "delete",
+                arn=arn,
+                meta={"status": "partial", "dry_run": False, "reason": f"object lock: {lock.reason}"},
+            )
+            return False
 
         # Finally delete the bucket
         client.delete_bucket(Bucket=bucket_name)
+        frozen = None
+        get_bucket_region_index(session).discard(bucket_name)
+        if checkpoints is not None:
+            checkpoints.clear(bucket_name)
         logger.info("[%s][s3][bucket] delete requested bucket=%s", region, bucket_name)
         # Update reporter with success status
         reporter.record(
@@ -223,10 +575,18 @@ def cleanup_bucket(session: Session, region: str, bucket_name: str, dry_run: boo
             RESOURCE,
             "delete",
             arn=arn,
-            meta={"status": "deleted", "dry_run": False},
+            meta={
+                "status": "deleted",
+                "dry_run": False,
+                "multipart_uploads_aborted": aborted["uploads"],
+                "multipart_bytes_reclaimed": aborted["bytes"],
+            },
         )
     except ClientError as e:
         code = e.response.get("Error", {}).get("Code") if hasattr(e, "response") else None
+        if checkpoints is not None and code in CHECKPOINT_RESET_ERROR_CODES:
+            # The bucket is gone, or keys exist behind the saved marker: list it in full next time
+            checkpoints.clear(bucket_name)
         if dry_run and code == "DryRunOperation":
             logger.info("[%s][s3][bucket] dry-run delete would succeed bucket_name=%s", region, bucket_name)
         else:
@@ -239,14 +599,134 @@ def cleanup_bucket(session: Session, region: str, bucket_name: str, dry_run: boo
                 arn=arn,
                 meta={"status": "failed", "dry_run": False, "error": str(e)},
             )
+            return is_transient_error(e)
+    finally:
+        if frozen is not None:
+            # Emptying was aborted: give the bucket its policy and versioning back
+            thaw_writes(client, bucket_name, frozen, region)
+    return False
+
 
+def expire_bucket(session: Session, region: str, bucket_name: str, estimated_objects: float = 0.0) -> bool:
+    """Let S3 empty a very large bucket through lifecycle expiration, and delete it once empty.
 
-def cleanup_buckets(session: Session, region: str, dry_run: bool = True, max_workers: int = 1) -> None:
-    bucket_names: list[str] = catalog_buckets(session=session, region=region)
+    The first run installs the expire-everything lifecycle rules and records the bucket as
+    ``expiring``. Later runs find the rules; the bucket is deleted through :func:`cleanup_bucket`
+    as soon as it is empty and reported as still ``expiring`` until then.
+
+    Args:
+        session: Boto3 session for AWS credentials.
+        region: Region of the bucket.
+        bucket_name: Bucket to expire.
+        estimated_objects: Estimated object count (reported only).
+
+    Returns:
+        True when installing the rules failed with a transient error.
+    """
+    reporter = get_reporter()
+    arn = f"arn:aws:s3:::{bucket_name}"
+    try:
+        client = get_client(session, "s3", region)
+        if is_expiring(client, bucket_name):
+            if is_empty(client, bucket_name):
+                logger.info("[%s][s3][bucket] lifecycle expiration finished, deleting bucket=%s", region, bucket_name)
+                return cleanup_bucket(session, region, bucket_name, dry_run=False)
+            logger.info("[%s][s3][bucket] bucket=%s is still expiring", region, bucket_name)
+        else:
+            install_expiration(client, bucket_name)
+            logger.info(
+                "[%s][s3][bucket] installed expire-everything lifecycle rules on bucket=%s (~%d objects)",
+                region,
+                bucket_name,
+                estimated_objects,
+            )
+        reporter.record(
+            region,
+            SERVICE,
+            RESOURCE,
+            "expire",
+            arn=arn,
+            meta={"status": "expiring", "dry_run": False, "estimated_objects": int(estimated_objects)},
+        )
+    except ClientError as e:
+        logger.error("[%s][s3][bucket] lifecycle expiration failed bucket_name=%s error=%s", region, bucket_name, e)
+        reporter.record(
+            region,
+            SERVICE,
+            RESOURCE,
+            "expire",
+            arn=arn,
+            meta={"status": "failed", "dry_run": False, "error": str(e)},
+        )
+        return is_transient_error(e)
+    return False
+
+
+def _bucket_targets(
+    session: Session, region: str, regions: list[str] | None, names: list[str] | None
+) -> dict[str, str]:
+    """Return bucket -> region for the buckets this task covers."""
+    index = get_bucket_region_index(session).regions()
+    scope = regions if region == GLOBAL_REGION and regions is not None else [region]
+    if names is None:
+        names = [name for name, where in index.items() if where in scope or where == UNKNOWN_REGION]
+    # Buckets the index cannot place (clients without location APIs) are handled in the first region in scope
+    return {name: index.get(name) or scope[0] for name in names if scope}
+
+
+def cleanup_buckets(
+    session: Session,
+    region: str,
+    dry_run: bool = True,
+    max_workers: int = 1,
+    resource_ids: list[Any] | None = None,
+    regions: list[str] | None = None,
+) -> list[Any]:
+    """
+    Empty and delete the buckets of one region, or of every region for the global task.
+
+    When called for ``GLOBAL_REGION``, all buckets of ``regions`` form one work queue on
+    the shared execution pool, ordered largest first by their CloudWatch object counts,
+    so any free worker picks up the next bucket regardless of its region. Buckets whose
+    estimate exceeds ``aws.s3.expire_above_objects`` are emptied by lifecycle expiration
+    (see :func:`expire_bucket`) instead of ``DeleteObjects`` calls.
+
+    Args:
+        session: Boto3 session for AWS credentials.
+        region: AWS region name, or ``GLOBAL_REGION``.
+        dry_run: If True, simulate deletion without making changes.
+        max_workers: Maximum buckets processed at once (drawn from the shared execution pool).
+        resource_ids: Bucket names to retry instead of cataloging.
+        regions: Regions covered by the global task.
+
+    Returns:
+        Bucket names whose deletion failed with a transient error.
+    """
+    if region != GLOBAL_REGION and resource_ids is None:
+        targets = dict.fromkeys(catalog_buckets(session=session, region=region), region)
+    else:
+        targets = _bucket_targets(session, region, regions, None if resource_ids is None else list(resource_ids))
+    bucket_names = list(targets)
+    threshold = get_s3_settings().expire_above_objects
+    estimates: dict[str, float] = {}
+    if not dry_run and (len(bucket_names) > 1 or (threshold is not None and bucket_names)):
+        # Longest-processing-time first: start the biggest buckets while there is still other work to overlap
+        estimates = estimate_object_counts(session, targets)
+        bucket_names = largest_first(targets, estimates)
+    expiring = {name for name in bucket_names if threshold is not None and estimates.get(name, 0.0) > threshold}
     logger.info("[%s][s3] cleanup_buckets: buckets to process (%d)=%s", region, len(bucket_names), bucket_names)
-    # Process buckets concurrently; tune `max_workers` as needed.
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(cleanup_bucket, session, region, bucket_name, dry_run) for bucket_name in bucket_names]
-        for fut in as_completed(futures):
-            # propagate exceptions from worker threads to the caller
-            fut.result()
+
+    def process(name: str) -> bool:
+        if name in expiring:
+            return expire_bucket(session, targets[name], name, estimates[name])
+        return cleanup_bucket(session, targets[name], name, dry_run=dry_run)
+
+    # Process buckets concurrently on the shared execution pool, each with its own region's client.
+    retryable = get_execution_pool().map(
+        region,
+        process,
+        bucket_names,
+        max_in_flight=max_workers,
+        gate=concurrency_gate(region, SERVICE) if region != GLOBAL_REGION else None,
+    )
+    return collect_retryable(bucket_names, retryable)
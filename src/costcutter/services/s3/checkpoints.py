@@ -0,0 +1,96 @@
+"""Persisted listing positions that make bucket wipes resumable.
+
+Emptying a huge bucket can take hours. When a run is interrupted, the next one
+would list the bucket from its first key again, paging through everything that
+was already deleted. Instead, the ``ListObjectVersions`` position
+(``KeyMarker``/``VersionIdMarker``) reached once every key before it was
+deleted is written to a small JSON state file, and the next run resumes there.
+
+A checkpoint is dropped when the bucket is deleted or no longer exists, and
+when deleting the bucket fails with ``BucketNotEmpty`` (keys written behind the
+marker), so the next run falls back to a full listing.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from costcutter.services.s3.settings import get_s3_settings
+
+logger = logging.getLogger(__name__)
+
+Marker = dict[str, str]
+
+
+class ListCheckpoints:
+    """Bucket name -> listing marker, backed by a JSON file.
+
+    Args:
+        path: State file the checkpoints are loaded from and written to.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path).expanduser()
+        self._markers: dict[str, Marker] | None = None
+        self._lock = threading.Lock()
+
+    def get(self, bucket_name: str) -> Marker | None:
+        """Return the marker to resume ``bucket_name`` from, if one was saved."""
+        with self._lock:
+            marker = self._load().get(bucket_name)
+            return dict(marker) if marker else None
+
+    def update(self, bucket_name: str, marker: Marker) -> None:
+        """Save ``marker`` as the position up to which ``bucket_name`` is deleted."""
+        with self._lock:
+            self._load()[bucket_name] = dict(marker)
+            self._write()
+
+    def clear(self, bucket_name: str) -> None:
+        """Forget the checkpoint of ``bucket_name``."""
+        with self._lock:
+            if self._load().pop(bucket_name, None) is not None:
+                self._write()
+
+    def _load(self) -> dict[str, Marker]:
+        # Called with self._lock held
+        if self._markers is None:
+            self._markers = {}
+            if self._path.exists():
+                try:
+                    payload = json.loads(self._path.read_text(encoding="utf-8"))
+                    if isinstance(payload, dict):
+                        self._markers = payload
+                except (OSError, ValueError) as e:
+                    logger.warning("[s3] ignoring unreadable listing checkpoints %s: %s", self._path, e)
+        return self._markers
+
+    def _write(self) -> None:
+        # Called with self._lock held
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+            tmp.write_text(json.dumps(self._markers, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self._path)
+        except OSError as e:
+            logger.warning("[s3] could not write listing checkpoints %s: %s", self._path, e)
+
+
+_stores: dict[Path, ListCheckpoints] = {}
+_stores_lock = threading.Lock()
+
+
+def get_list_checkpoints() -> ListCheckpoints | None:
+    """Return the checkpoint store configured in ``aws.s3``, or None when checkpoints are disabled."""
+    settings = get_s3_settings()
+    if not settings.list_checkpoint_enabled:
+        return None
+    path = Path(settings.list_checkpoint_path).expanduser()
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = ListCheckpoints(path)
+        return _stores[path]
@@ -0,0 +1,61 @@
+"""Lifecycle expiration for S3 buckets too large to empty through the API.
+
+Emptying a bucket with billions of object versions takes millions of
+``DeleteObjects`` calls. Instead, an expire-everything lifecycle configuration
+lets S3 remove current versions, noncurrent versions, delete markers and
+incomplete multipart uploads itself, at no request cost. Expiration runs
+asynchronously (typically within a few days), so the bucket is only deleted by
+a later run that finds it empty.
+
+The lifecycle rule doubles as the "expiring" marker: no local state is kept,
+and any run that sees the rule knows the bucket is being emptied by S3.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+# ID of the rule marking a bucket as expiring
+EXPIRE_RULE_ID = "costcutter-expire-all"
+
+# Expiration by age and removal of expired delete markers cannot share one rule
+EXPIRE_ALL_RULES: list[dict[str, Any]] = [
+    {
+        "ID": EXPIRE_RULE_ID,
+        "Filter": {"Prefix": ""},
+        "Status": "Enabled",
+        "Expiration": {"Days": 1},
+        "NoncurrentVersionExpiration": {"NoncurrentDays": 1},
+        "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 1},
+    },
+    {
+        "ID": f"{EXPIRE_RULE_ID}-delete-markers",
+        "Filter": {"Prefix": ""},
+        "Status": "Enabled",
+        "Expiration": {"ExpiredObjectDeleteMarker": True},
+    },
+]
+
+
+def install_expiration(client: Any, bucket_name: str) -> None:
+    """Replace the bucket's lifecycle configuration with the expire-everything rules."""
+    client.put_bucket_lifecycle_configuration(Bucket=bucket_name, LifecycleConfiguration={"Rules": EXPIRE_ALL_RULES})
+
+
+def is_expiring(client: Any, bucket_name: str) -> bool:
+    """Return True when a previous run installed the expire-everything rules on the bucket."""
+    try:
+        response = client.get_bucket_lifecycle_configuration(Bucket=bucket_name)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "NoSuchLifecycleConfiguration":
+            return False
+        raise
+    return any(rule.get("ID") == EXPIRE_RULE_ID for rule in response.get("Rules", []))
+
+
+def is_empty(client: Any, bucket_name: str) -> bool:
+    """Return True when the bucket holds no object versions or delete markers."""
+    page = client.list_object_versions(Bucket=bucket_name, MaxKeys=1)
+    return not page.get("Versions") and not page.get("DeleteMarkers")
@@ -0,0 +1,98 @@
+"""Write freeze applied to S3 buckets before they are emptied.
+
+Producers that keep writing while a bucket is emptied can keep its listing from
+ever reaching the end, so ``DeleteBucket`` fails with ``BucketNotEmpty`` run
+after run. Freezing the bucket first bounds the work: versioning is suspended
+and a bucket policy statement denies ``s3:PutObject`` (which also covers
+multipart uploads) to every principal. Deletions are not affected.
+
+The original policy and versioning status are returned by :func:`freeze_writes`
+and restored by :func:`thaw_writes` when emptying the bucket is aborted. The
+deny statement carries a fixed ``Sid``, so a freeze left behind by a crashed run
+is recognised and not counted as part of the original policy.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+FREEZE_SID = "CostCutterWriteFreeze"
+
+
+def _freeze_statement(bucket_name: str) -> dict[str, Any]:
+    return {
+        "Sid": FREEZE_SID,
+        "Effect": "Deny",
+        "Principal": "*",
+        "Action": "s3:PutObject",
+        "Resource": f"arn:aws:s3:::{bucket_name}/*",
+    }
+
+
+def _current_policy(client: Any, bucket_name: str) -> dict[str, Any] | None:
+    try:
+        policy = json.loads(client.get_bucket_policy(Bucket=bucket_name)["Policy"])
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") == "NoSuchBucketPolicy":
+            return None
+        raise
+    # Drop a freeze left behind by an earlier run
+    policy["Statement"] = [s for s in policy.get("Statement", []) if s.get("Sid") != FREEZE_SID]
+    return policy if policy["Statement"] else None
+
+
+def freeze_writes(client: Any, bucket_name: str, region: str) -> dict[str, Any] | None:
+    """Suspend versioning and deny new writes to the bucket.
+
+    Returns:
+        The original ``policy`` (None when the bucket had none) and ``versioning`` status
+        to restore, or None when the bucket could not be frozen (emptying proceeds unfrozen).
+    """
+    try:
+        original = _current_policy(client, bucket_name)
+        versioning = client.get_bucket_versioning(Bucket=bucket_name).get("Status")
+        policy = original or {"Version": "2012-10-17", "Statement": []}
+        frozen = {**policy, "Statement": [*policy["Statement"], _freeze_statement(bucket_name)]}
+        client.put_bucket_policy(Bucket=bucket_name, Policy=json.dumps(frozen))
+    except ClientError as e:
+        logger.warning(
+            "[%s][s3][bucket] could not freeze writes to bucket=%s, emptying it anyway: %s", region, bucket_name, e
+        )
+        return None
+    saved = {"policy": original, "versioning": versioning}
+    if versioning == "Enabled":
+        try:
+            client.put_bucket_versioning(Bucket=bucket_name, VersioningConfiguration={"Status": "Suspended"})
+        except ClientError as e:
+            # Writes are already denied; only the version suspension is missing
+            logger.warning("[%s][s3][bucket] could not suspend versioning of bucket=%s: %s", region, bucket_name, e)
+            saved["versioning"] = None
+    logger.info("[%s][s3][bucket] froze writes to bucket=%s", region, bucket_name)
+    return saved
+
+
+def thaw_writes(client: Any, bucket_name: str, saved: dict[str, Any], region: str) -> None:
+    """Restore the policy and versioning status saved by :func:`freeze_writes` (errors are logged)."""
+    try:
+        if saved["versioning"] == "Enabled":
+            client.put_bucket_versioning(Bucket=bucket_name, VersioningConfiguration={"Status": "Enabled"})
+        if saved["policy"] is None:
+            client.delete_bucket_policy(Bucket=bucket_name)
+        else:
+            client.put_bucket_policy(Bucket=bucket_name, Policy=json.dumps(saved["policy"]))
+    except ClientError as e:
+        logger.error(
+            "[%s][s3][bucket] could not restore bucket=%s after an aborted cleanup (policy Sid %s): %s",
+            region,
+            bucket_name,
+            FREEZE_SID,
+            e,
+        )
+        return
+    logger.info("[%s][s3][bucket] restored policy and versioning of bucket=%s", region, bucket_name)
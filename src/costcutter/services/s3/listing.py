@@ -0,0 +1,185 @@
+"""Prefix-sharded, concurrent listing of S3 object versions.
+
+A single ``ListObjectVersions`` paginator returns at most 1000 entries per round
+trip, so listing a bucket with hundreds of millions of versions is serial and
+dominates its cleanup time. The sharded lister first discovers the bucket's
+key-space partitions with delimiter listings, breadth first and concurrently
+for the prefixes of one level, until there are enough of them:
+
+- only the first few pages of each delimiter listing are read, so discovery
+  never walks a large flat key space; a prefix whose sub-prefixes were not all
+  seen within them is not expanded;
+- every prefix that is not expanded becomes a shard listed in full;
+- every expanded prefix gets a shard listing only the keys directly under it
+  (``Delimiter="/"``), so keys outside any sub-prefix are still covered.
+
+Shards are then listed concurrently one page per work item on the execution
+pool (see :meth:`~costcutter.core.execution.ExecutionPool.expand`), so no
+worker blocks on a listing and only finished pages are buffered. A throttled or
+failed page is deferred and listed again; a page that cannot be listed is
+recorded as a failure of its shard. Keyspaces without a ``/`` hierarchy yield a
+single shard and are listed serially.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+from functools import partial
+from itertools import islice
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from costcutter.core.concurrency import THROTTLING_ERROR_CODES, concurrency_gate
+from costcutter.core.execution import RetryLater, current_attempt, get_execution_pool
+from costcutter.reporter import get_reporter
+
+logger = logging.getLogger(__name__)
+
+DELIMITER = "/"
+# Prefix levels expanded at most while looking for enough shards
+MAX_DISCOVERY_DEPTH = 3
+# Delimiter listing pages read per prefix while discovering shards
+DISCOVERY_PAGES = 3
+# Page listing errors worth another attempt, attempts per page and the backoff between them
+RETRYABLE_PAGE_ERROR_CODES = THROTTLING_ERROR_CODES | {"InternalError", "ServiceUnavailable", "RequestTimeout"}
+PAGE_RETRY_ATTEMPTS = 5
+PAGE_RETRY_BASE_DELAY = 1.0
+PAGE_RETRY_MAX_DELAY = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class Shard:
+    """One partition of a bucket's key space and the listing position within it."""
+
+    prefix: str
+    delimiter: str | None = None
+    key_marker: str | None = None
+    version_marker: str | None = None
+
+
+def _common_prefixes(client: Any, bucket_name: str, prefix: str) -> tuple[list[str], bool]:
+    """Return the sub-prefixes directly under ``prefix`` and whether all of them were seen.
+
+    Only the first ``DISCOVERY_PAGES`` pages of the delimiter listing are read.
+    """
+    prefixes: list[str] = []
+    paginator = client.get_paginator("list_object_versions")
+    pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter=DELIMITER)
+    for page in islice(pages, DISCOVERY_PAGES):
+        prefixes.extend(p["Prefix"] for p in page.get("CommonPrefixes", []) if p.get("Prefix"))
+        if not page.get("IsTruncated"):
+            return prefixes, True
+    return prefixes, False
+
+
+def discover_shards(client: Any, bucket_name: str, region: str, target: int) -> list[Shard]:
+    """Partition the bucket's key space into at least ``target`` shards where its prefixes allow.
+
+    Args:
+        client: S3 client for the bucket's region.
+        bucket_name: Bucket to partition.
+        region: Bucket region (execution pool lane).
+        target: Desired number of shards.
+
+    Returns:
+        Shards that together cover every key of the bucket exactly once.
+    """
+    frontier = [""]
+    # Prefixes listed in full, and prefixes listed with a delimiter next to their sub-prefixes
+    leaves: list[str] = []
+    expanded: list[str] = []
+    for _ in range(MAX_DISCOVERY_DEPTH):
+        if not frontier or len(frontier) + len(leaves) + len(expanded) >= target:
+            break
+        listings = get_execution_pool().map(
+            region,
+            partial(_common_prefixes, client, bucket_name),
+            frontier,
+            gate=concurrency_gate(region, "s3"),
+        )
+        children: list[str] = []
+        for prefix, (sub_prefixes, complete) in zip(frontier, listings, strict=True):
+            if complete and sub_prefixes:
+                expanded.append(prefix)
+                children.extend(sub_prefixes)
+            else:
+                leaves.append(prefix)
+        frontier = children
+    return [Shard(prefix) for prefix in frontier + leaves] + [Shard(prefix, DELIMITER) for prefix in expanded]
+
+
+def list_shard_page(
+    client: Any, bucket_name: str, region: str, shard: Shard
+) -> tuple[list[dict[str, Any]], list[Shard]]:
+    """List one page of a shard.
+
+    Runs as one work item of the execution pool: a page failing with a retryable error is
+    deferred with :class:`RetryLater` and listed again, up to ``PAGE_RETRY_ATTEMPTS`` times.
+    Any other error, or the last failed attempt, is recorded as a failed listing of the shard.
+
+    Returns:
+        The page's objects (``Key``, ``VersionId`` and ``Size``) and the shard positioned at the next page, if any.
+    """
+    kwargs: dict[str, Any] = {"Bucket": bucket_name, "Prefix": shard.prefix}
+    if shard.delimiter:
+        kwargs["Delimiter"] = shard.delimiter
+    if shard.key_marker is not None:
+        kwargs["KeyMarker"] = shard.key_marker
+        if shard.version_marker:
+            kwargs["VersionIdMarker"] = shard.version_marker
+    try:
+        page = client.list_object_versions(**kwargs)
+    except ClientError as e:
+        error = e.response.get("Error", {})
+        attempt = current_attempt()
+        if error.get("Code") in RETRYABLE_PAGE_ERROR_CODES and attempt + 1 < PAGE_RETRY_ATTEMPTS:
+            raise RetryLater(min(PAGE_RETRY_MAX_DELAY, PAGE_RETRY_BASE_DELAY * 2**attempt)) from e
+        logger.error("[%s][s3] failed to list bucket=%s prefix=%r: %s", region, bucket_name, shard.prefix, e)
+        meta = {"status": "failed", "prefix": shard.prefix, "error_code": error.get("Code")}
+        meta["error_message"] = error.get("Message")
+        get_reporter().record(
+            region, "s3", "object", "list", arn=f"arn:aws:s3:::{bucket_name}/{shard.prefix}*", meta=meta
+        )
+        return [], []
+    objects = [
+        {"Key": v["Key"], "VersionId": v.get("VersionId"), "Size": v.get("Size", 0)} for v in page.get("Versions", [])
+    ]
+    objects += [{"Key": d["Key"], "VersionId": d.get("VersionId"), "Size": 0} for d in page.get("DeleteMarkers", [])]
+    if not page.get("IsTruncated"):
+        return objects, []
+    return objects, [
+        replace(shard, key_marker=page.get("NextKeyMarker"), version_marker=page.get("NextVersionIdMarker"))
+    ]
+
+
+def sharded_catalog_objects(
+    client: Any, bucket_name: str, region: str, shards: int, max_in_flight: int | None = None
+) -> Iterator[dict[str, Any]]:
+    """Stream every object version of a bucket, listing up to ``max_in_flight`` shards concurrently.
+
+    Args:
+        client: S3 client for the bucket's region.
+        bucket_name: Bucket to list.
+        region: Bucket region (execution pool lane and logging).
+        shards: Desired number of key-space partitions.
+        max_in_flight: Concurrent page listings (default: ``shards``).
+
+    Yields:
+        Dicts with ``Key``, ``VersionId`` and ``Size``, in no particular order.
+    """
+    try:
+        partitions = discover_shards(client, bucket_name, region, shards)
+    except ClientError as e:
+        logger.error("[%s][s3] shard discovery failed for bucket=%s, listing serially: %s", region, bucket_name, e)
+        partitions = [Shard("")]
+    logger.info("[%s][s3] listing bucket=%s in %d shards", region, bucket_name, len(partitions))
+    yield from get_execution_pool().expand(
+        region,
+        partial(list_shard_page, client, bucket_name, region),
+        partitions,
+        max_in_flight=max_in_flight or shards,
+        gate=concurrency_gate(region, "s3"),
+    )
@@ -0,0 +1,90 @@
+"""Local key manifests that replace the object listing of a bucket.
+
+Listing a bucket with hundreds of millions of versions takes hours of serial
+``ListObjectVersions`` calls. When the keys are already known, e.g. from S3
+Inventory, a local manifest can feed the batch deleter directly at disk speed;
+one verification listing afterwards catches whatever the manifest missed.
+
+Manifests live in ``aws.s3.manifest_dir`` as ``<bucket>.csv`` or
+``<bucket>.csv.gz`` and hold one version per row. Columns are mapped by name,
+from a header row or from ``aws.s3.manifest_columns`` for headerless files such
+as S3 Inventory CSV (its ``fileSchema``, e.g. ``Bucket, Key, VersionId, ...``).
+Without either, rows are ``key[,version_id]``. Keys are URL-decoded when the
+layout has a ``Bucket`` column, as S3 Inventory encodes them.
+
+Files are memory-mapped and decoded line by line, so memory stays flat for any
+manifest size.
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import mmap
+from collections.abc import Iterator, Sequence
+from itertools import chain
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote_plus
+
+GZIP_MAGIC = b"\x1f\x8b"
+# Columns of a manifest without a header or configured columns
+PLAIN_COLUMNS = ("key", "versionid")
+
+
+def find_manifest(manifest_dir: str | Path | None, bucket_name: str) -> Path | None:
+    """Return the manifest of ``bucket_name`` in ``manifest_dir``, if there is one."""
+    if not manifest_dir:
+        return None
+    directory = Path(manifest_dir).expanduser()
+    for name in (f"{bucket_name}.csv", f"{bucket_name}.csv.gz"):
+        if (directory / name).is_file():
+            return directory / name
+    return None
+
+
+def _column_names(row: Sequence[str]) -> list[str]:
+    """Normalise column names: ``VersionId``, ``version_id`` and ``versionid`` match alike."""
+    return [cell.strip().lower().replace("_", "") for cell in row]
+
+
+def read_manifest(path: str | Path, columns: Sequence[str] | None = None) -> Iterator[dict[str, Any]]:
+    """Stream the versions listed in a manifest.
+
+    Args:
+        path: Manifest file, optionally gzipped.
+        columns: Column names of a headerless manifest; by default they come from a header
+            row, or the rows are ``key[,version_id]``.
+
+    Yields:
+        Dicts with ``Key`` and ``VersionId`` (None when the row has none).
+
+    Raises:
+        ValueError: If ``columns`` has no ``Key`` column.
+    """
+    if columns and "key" not in _column_names(columns):
+        raise ValueError(f"manifest columns have no Key column: {list(columns)}")
+    path = Path(path)
+    if path.stat().st_size == 0:
+        return
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        stream: Any = gzip.GzipFile(fileobj=mapped) if mapped[:2] == GZIP_MAGIC else mapped
+        rows = csv.reader(line.decode("utf-8") for line in iter(stream.readline, b""))
+        first = next(rows, [])
+        if columns:
+            names = _column_names(columns)
+            # A headerless file may still start with the configured columns
+            header = _column_names(first) == names
+        else:
+            names = _column_names(first)
+            header = "key" in names
+            if not header:
+                names = list(PLAIN_COLUMNS)
+        key_at = names.index("key")
+        version_at = names.index("versionid") if "versionid" in names else None
+        decode = unquote_plus if "bucket" in names else str
+        for row in rows if header else chain([first], rows):
+            if len(row) <= key_at or not row[key_at]:
+                continue
+            version_id = row[version_at] if version_at is not None and len(row) > version_at else None
+            yield {"Key": decode(row[key_at]), "VersionId": version_id or None}
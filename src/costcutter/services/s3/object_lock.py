@@ -0,0 +1,135 @@
+"""Object Lock pre-check that keeps CostCutter from emptying buckets it cannot delete.
+
+Versions under a retention period or a legal hold cannot be deleted, so
+emptying an Object Lock bucket in compliance mode produces one ``AccessDenied``
+per version and still ends with ``BucketNotEmpty``. Before listing, a bucket is
+classified from a few cheap calls:
+
+- no Object Lock configuration: every version is deletable;
+- otherwise the retention and legal hold of a sample of versions are probed,
+  a few from each prefix found by shard discovery (see
+  :func:`~costcutter.services.s3.listing.discover_shards`): when every sampled
+  version is locked the bucket is skipped, when some are it is emptied as far
+  as possible but not deleted, and the prefixes where locked versions were
+  found are left out of the deletion.
+
+A default retention only applies to new uploads, so it is not enough to skip a
+bucket on its own. Governance-mode retention counts as locked because
+CostCutter does not bypass it.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.execution import get_execution_pool
+from costcutter.services.s3.listing import Shard, discover_shards
+
+logger = logging.getLogger(__name__)
+
+DELETABLE = "deletable"
+PARTIAL = "partial"
+LOCKED = "locked"
+
+# Versions whose retention and legal hold are probed, spread over this many prefixes
+OBJECT_LOCK_SAMPLE_SIZE = 20
+OBJECT_LOCK_SAMPLE_SHARDS = 5
+# Errors meaning "no Object Lock configuration / retention / legal hold"
+_NOT_CONFIGURED_CODES = {"ObjectLockConfigurationNotFoundError", "NoSuchObjectLockConfiguration"}
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectLockAssessment:
+    """Whether a bucket's versions can be deleted, and why not."""
+
+    status: str
+    reason: str = ""
+    # Prefixes holding sampled locked versions (``PARTIAL`` only), left out of the deletion
+    locked_prefixes: tuple[str, ...] = ()
+
+
+def _error_code(error: ClientError) -> str:
+    return error.response.get("Error", {}).get("Code", "")
+
+
+def _is_locked(client: Any, bucket_name: str, version: dict[str, Any]) -> bool:
+    """Return True when the version is under an active retention period or legal hold."""
+    kwargs = {"Bucket": bucket_name, "Key": version["Key"]}
+    if version.get("VersionId"):
+        kwargs["VersionId"] = version["VersionId"]
+    try:
+        retention = client.get_object_retention(**kwargs).get("Retention", {})
+        until = retention.get("RetainUntilDate")
+        if until is not None and until > datetime.now(UTC):
+            return True
+    except ClientError as e:
+        if _error_code(e) not in _NOT_CONFIGURED_CODES:
+            raise
+    try:
+        return client.get_object_legal_hold(**kwargs).get("LegalHold", {}).get("Status") == "ON"
+    except ClientError as e:
+        if _error_code(e) not in _NOT_CONFIGURED_CODES:
+            raise
+    return False
+
+
+def _sample_versions(client: Any, bucket_name: str, shard: Shard, count: int) -> list[dict[str, Any]]:
+    """Return up to ``count`` versions from the start of a shard."""
+    kwargs: dict[str, Any] = {"Bucket": bucket_name, "Prefix": shard.prefix, "MaxKeys": count}
+    if shard.delimiter:
+        kwargs["Delimiter"] = shard.delimiter
+    return [*client.list_object_versions(**kwargs).get("Versions", [])][:count]
+
+
+def assess_object_lock(
+    client: Any, bucket_name: str, region: str, sample_size: int = OBJECT_LOCK_SAMPLE_SIZE
+) -> ObjectLockAssessment:
+    """Classify the bucket as ``DELETABLE``, ``PARTIAL`` or ``LOCKED``.
+
+    Errors other than a missing configuration are logged and the bucket is treated as
+    deletable, so the pre-check never blocks a cleanup that would have worked.
+    """
+    pool = get_execution_pool()
+    gate = concurrency_gate(region, "s3")
+    try:
+        try:
+            config = client.get_object_lock_configuration(Bucket=bucket_name).get("ObjectLockConfiguration", {})
+        except ClientError as e:
+            if _error_code(e) in _NOT_CONFIGURED_CODES:
+                return ObjectLockAssessment(DELETABLE)
+            raise
+        if config.get("ObjectLockEnabled") != "Enabled":
+            return ObjectLockAssessment(DELETABLE)
+
+        shards = discover_shards(client, bucket_name, region, OBJECT_LOCK_SAMPLE_SHARDS)
+        per_shard = max(1, sample_size // len(shards))
+        listed = pool.map(
+            region, lambda shard: _sample_versions(client, bucket_name, shard, per_shard), shards, gate=gate
+        )
+        sample = [(shard, version) for shard, versions in zip(shards, listed, strict=True) for version in versions]
+        if not sample:
+            return ObjectLockAssessment(DELETABLE)
+        locked = pool.map(region, lambda item: _is_locked(client, bucket_name, item[1]), sample, gate=gate)
+    except ClientError as e:
+        logger.warning("[%s][s3][bucket] could not check Object Lock of bucket=%s: %s", region, bucket_name, e)
+        return ObjectLockAssessment(DELETABLE)
+
+    held = sum(locked)
+    if held == len(sample):
+        return ObjectLockAssessment(LOCKED, f"all {held} sampled versions under retention or legal hold")
+    if held:
+        # A prefix listed with a delimiter also covers its sub-prefixes, so only full-prefix shards are left out
+        prefixes = {shard.prefix for (shard, _), hit in zip(sample, locked, strict=True) if hit}
+        prefixes &= {shard.prefix for shard in shards if shard.prefix and not shard.delimiter}
+        return ObjectLockAssessment(
+            PARTIAL,
+            f"{held} of {len(sample)} sampled versions under retention or legal hold",
+            tuple(sorted(prefixes)),
+        )
+    return ObjectLockAssessment(DELETABLE)
@@ -0,0 +1,243 @@
+"""Run-level index of S3 bucket regions.
+
+S3 buckets are global: ``ListBuckets`` returns every bucket of the account no
+matter which regional endpoint is asked. Resolving each bucket's region from
+every S3 region task costs O(buckets x regions) lookups, so the index is built
+once per session and shared by all region tasks.
+
+Regions come from the ``BucketRegion`` field of paginated ``ListBuckets``
+responses where available. Buckets without it are resolved in parallel on the
+execution pool with ``HeadBucket`` (the ``x-amz-bucket-region`` header, also
+present on redirect errors) and fall back to ``GetBucketLocation``. The index
+can optionally be persisted to a JSON file, keyed by account, and reused while
+it is younger than its TTL.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any
+
+from boto3.session import Session
+from botocore.exceptions import ClientError
+
+from costcutter.core.client_pool import get_client
+from costcutter.core.execution import get_execution_pool
+from costcutter.services.common import _get_account_id
+
+logger = logging.getLogger(__name__)
+
+# Execution pool lane used for location lookups (buckets are not bound to a task region)
+INDEX_LANE = "s3-bucket-index"
+# ListBuckets accepts up to 10,000 buckets per page
+LIST_BUCKETS_PAGE_SIZE = 10000
+
+# Sentinel region for buckets whose region cannot be determined because the client does not
+# expose any location API; such buckets are offered to every region, as before the index existed
+UNKNOWN_REGION: str | None = None
+
+
+def _region_from_headers(response: dict[str, Any]) -> str | None:
+    headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+    return headers.get("x-amz-bucket-region")
+
+
+def _head_bucket_region(client: Any, bucket_name: str) -> str | None:
+    try:
+        response = client.head_bucket(Bucket=bucket_name)
+    except ClientError as e:
+        # A bucket in another region answers with a redirect that still carries its region
+        return _region_from_headers(e.response)
+    return response.get("BucketRegion") or _region_from_headers(response)
+
+
+def _location_region(client: Any, bucket_name: str) -> str:
+    # GetBucketLocation returns None for us-east-1
+    return client.get_bucket_location(Bucket=bucket_name).get("LocationConstraint") or "us-east-1"
+
+
+class BucketRegionIndex:
+    """Bucket name -> region map for one session, built at most once.
+
+    Args:
+        session: Session used to list buckets and resolve their regions.
+        cache_path: Optional JSON file the index is loaded from and saved to.
+        cache_ttl: Seconds a cached index stays valid.
+        max_in_flight: Maximum concurrent location lookups.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        cache_path: str | Path | None = None,
+        cache_ttl: float = 86400.0,
+        max_in_flight: int | None = None,
+    ) -> None:
+        self._session = session
+        self._cache_path = Path(cache_path).expanduser() if cache_path else None
+        self._cache_ttl = cache_ttl
+        self._max_in_flight = max_in_flight
+        self._regions: dict[str, str | None] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {"buckets": 0, "listed": 0, "head_bucket": 0, "get_bucket_location": 0, "cache_hit": 0}
+
+    def regions(self) -> dict[str, str | None]:
+        """Return the bucket -> region map, building (or loading) it on first use."""
+        with self._lock:
+            if self._regions is None:
+                self._regions = self._load_cache()
+                if self._regions is None:
+                    built = self._build()
+                    # A failed listing is not persisted, so the next run lists again
+                    self._dirty = built is not None
+                    self._regions = built or {}
+                self.stats["buckets"] = len(self._regions)
+            return dict(self._regions)
+
+    def buckets_in(self, region: str) -> list[str]:
+        """Return the names of the buckets located in ``region``."""
+        return [name for name, where in self.regions().items() if where in (region, UNKNOWN_REGION)]
+
+    def discard(self, bucket_name: str) -> None:
+        """Forget a deleted bucket so a persisted index does not offer it again."""
+        with self._lock:
+            if self._regions is not None and self._regions.pop(bucket_name, False) is not False:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Persist the index to the cache file when it changed (no-op without a cache path)."""
+        with self._lock:
+            if self._cache_path is None or self._regions is None or not self._dirty:
+                return
+            account = _get_account_id(self._session)
+            try:
+                payload = self._read_cache_file()
+                payload[account] = {"updated": time.time(), "regions": self._regions}
+                self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._cache_path.with_suffix(self._cache_path.suffix + ".tmp")
+                tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+                os.replace(tmp, self._cache_path)
+                self._dirty = False
+            except OSError as e:
+                logger.warning("[s3] could not write bucket region cache %s: %s", self._cache_path, e)
+
+    def _read_cache_file(self) -> dict[str, Any]:
+        if self._cache_path is None or not self._cache_path.exists():
+            return {}
+        try:
+            payload = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning("[s3] ignoring unreadable bucket region cache %s: %s", self._cache_path, e)
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def _load_cache(self) -> dict[str, str | None] | None:
+        if self._cache_path is None:
+            return None
+        entry = self._read_cache_file().get(_get_account_id(self._session))
+        if not isinstance(entry, dict) or time.time() - float(entry.get("updated", 0)) > self._cache_ttl:
+            return None
+        self.stats["cache_hit"] = 1
+        logger.info("[s3] loaded regions of %d buckets from %s", len(entry.get("regions", {})), self._cache_path)
+        return dict(entry.get("regions", {}))
+
+    def _list_buckets(self, client: Any) -> list[dict[str, Any]]:
+        if hasattr(client, "can_paginate") and client.can_paginate("list_buckets"):
+            # Paginated ListBuckets responses carry each bucket's region
+            paginator = client.get_paginator("list_buckets")
+            pages = paginator.paginate(PaginationConfig={"PageSize": LIST_BUCKETS_PAGE_SIZE})
+            return [bucket for page in pages for bucket in page.get("Buckets", [])]
+        return client.list_buckets().get("Buckets", [])
+
+    def _build(self) -> dict[str, str | None] | None:
+        client = get_client(self._session, "s3")
+        try:
+            listed = self._list_buckets(client)
+        except ClientError as e:
+            logger.exception("[s3] Failed to list buckets: %s", e)
+            return None
+
+        regions: dict[str, str | None] = {}
+        unresolved: list[str] = []
+        for bucket in listed:
+            name = bucket.get("Name")
+            if not name:
+                continue
+            if bucket.get("BucketRegion"):
+                regions[name] = bucket["BucketRegion"]
+            else:
+                unresolved.append(name)
+        self.stats["listed"] = len(regions)
+
+        resolved = get_execution_pool().map(
+            INDEX_LANE, lambda name: self._resolve(client, name), unresolved, max_in_flight=self._max_in_flight
+        )
+        regions.update({name: region for name, region in zip(unresolved, resolved, strict=True) if region is not False})
+        logger.info(
+            "[s3] indexed %d buckets (%d from ListBuckets, %d resolved individually)",
+            len(regions),
+            self.stats["listed"],
+            len(unresolved),
+        )
+        return regions
+
+    def _count(self, call: str) -> None:
+        with self._stats_lock:
+            self.stats[call] += 1
+
+    def _resolve(self, client: Any, bucket_name: str) -> str | None | bool:
+        """Return the bucket's region, ``UNKNOWN_REGION`` when it cannot be asked, or False on error."""
+        if hasattr(client, "head_bucket"):
+            self._count("head_bucket")
+            region = _head_bucket_region(client, bucket_name)
+            if region:
+                return region
+        if not hasattr(client, "get_bucket_location"):
+            return UNKNOWN_REGION
+        try:
+            self._count("get_bucket_location")
+            return _location_region(client, bucket_name)
+        except ClientError as e:
+            logger.warning("[s3] could not get location for bucket=%s: %s", bucket_name, e)
+            return False
+
+
+_indexes: weakref.WeakKeyDictionary[Any, BucketRegionIndex] = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def configure_bucket_region_index(
+    session: Session,
+    cache_path: str | Path | None = None,
+    cache_ttl: float = 86400.0,
+    max_in_flight: int | None = None,
+) -> BucketRegionIndex:
+    """Register a fresh bucket region index for ``session`` (one per run)."""
+    index = BucketRegionIndex(session, cache_path=cache_path, cache_ttl=cache_ttl, max_in_flight=max_in_flight)
+    with _indexes_lock:
+        _indexes[session] = index
+    return index
+
+
+def get_bucket_region_index(session: Session) -> BucketRegionIndex:
+    """Return the index bound to ``session``, creating an uncached one if needed.
+
+    Sessions that cannot be weak-referenced get a new index per call.
+    """
+    with _indexes_lock:
+        try:
+            index = _indexes.get(session)
+        except TypeError:
+            return BucketRegionIndex(session)
+        if index is None:
+            index = BucketRegionIndex(session)
+            _indexes[session] = index
+        return index
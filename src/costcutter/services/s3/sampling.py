@@ -0,0 +1,214 @@
+"""Sampling estimator of a bucket's size and deletion time, for dry runs.
+
+A bucket that fits in its first pages is counted exactly. Otherwise a few of the
+shards found by :func:`~costcutter.services.s3.listing.discover_shards` are listed
+for a bounded number of pages each; a shard that does not fit in them is sampled
+with one page at each of several positions between its first and last key, and
+the key space those pages leave uncovered is extrapolated from the space covered.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import time
+from typing import Any
+
+from costcutter.core.concurrency import concurrency_gate
+from costcutter.core.execution import get_execution_pool
+from costcutter.services.s3.listing import Shard, discover_shards
+
+# Entries listed per page
+PAGE_KEYS = 1000
+# Single-key listings spent at most locating the last key of a shard
+END_PROBES = 24
+# Pages listed at most to sample a shard that does not fit in its first pages
+SHARD_PAGES = 32
+# Key characters that place a key in its shard's key space
+POSITION_DEPTH = 64
+# Keys per DeleteObjects call and its typical latency, used for the projection
+DELETE_BATCH_SIZE = 1000
+DELETE_BATCH_SECONDS = 1.0
+
+
+def _list(client: Any, bucket_name: str, shard: Shard, marker: str | None, max_keys: int = PAGE_KEYS) -> dict:
+    kwargs: dict[str, Any] = {"Bucket": bucket_name, "Prefix": shard.prefix, "MaxKeys": max_keys}
+    if shard.delimiter:
+        kwargs["Delimiter"] = shard.delimiter
+    if marker:
+        kwargs["KeyMarker"] = marker
+    return client.list_object_versions(**kwargs)
+
+
+def _entries(page: dict[str, Any]) -> list[tuple[str, list[float]]]:
+    """Key and (current objects, versions, bytes) of every version and delete marker of a page, in key order."""
+    entries = [(v["Key"], [1.0 if v.get("IsLatest") else 0.0, 1.0, v.get("Size", 0)]) for v in page.get("Versions", [])]
+    entries += [(d["Key"], [0.0, 1.0, 0.0]) for d in page.get("DeleteMarkers", [])]
+    return sorted(entries, key=lambda entry: entry[0])
+
+
+def _sum(entries: list[tuple[str, list[float]]], scale: float = 1.0) -> list[float]:
+    return [scale * sum(values[i] for _, values in entries) for i in range(3)]
+
+
+class _KeySpace:
+    """Positions of the keys of a shard, as numbers spelled with the characters its keys use."""
+
+    def __init__(self, prefix: str, keys: list[str]) -> None:
+        self.prefix = prefix
+        self.chars = sorted({c for key in keys for c in key[len(prefix) :]})
+        self.end = len(self.chars) ** POSITION_DEPTH
+
+    def position(self, key: str) -> int:
+        base = len(self.chars)
+        suffix = key[len(self.prefix) :][:POSITION_DEPTH].ljust(POSITION_DEPTH, self.chars[0])
+        position = 0
+        for c in suffix:
+            position = position * base + min(bisect.bisect_left(self.chars, c), base - 1)
+        return position
+
+    def key(self, position: int) -> str:
+        base = len(self.chars)
+        chars = []
+        for _ in range(POSITION_DEPTH):
+            position, digit = divmod(position, base)
+            chars.append(self.chars[digit])
+        return self.prefix + "".join(reversed(chars))
+
+
+def _head(client: Any, bucket_name: str, shard: Shard, pages: int) -> tuple[list[tuple[str, list[float]]], bool, int]:
+    """List up to ``pages`` pages of a shard; return their entries, whether they hold the whole shard, and the calls."""
+    listed: list[tuple[str, list[float]]] = []
+    marker = None
+    for calls in range(1, pages + 1):
+        page = _list(client, bucket_name, shard, marker)
+        listed += _entries(page)
+        if not page.get("IsTruncated"):
+            return listed, True, calls
+        marker = page["NextKeyMarker"]
+    return listed, False, pages
+
+
+def _extrapolate(client: Any, bucket_name: str, region: str, shard: Shard, head: list, positions: int) -> list[float]:
+    """Estimate a shard whose first pages listed ``head`` but not every key."""
+    space = _KeySpace(shard.prefix, [key for key, _ in head])
+    start = space.position(head[0][0])
+    # Gallop past the listed keys, then bisect, for the last key: a single-key listing shows whether keys follow
+    low = space.position(head[-1][0])
+    step, high = max(1, low - start), space.end
+    for _ in range(END_PROBES):
+        if (high - low) * 100 < low - start:
+            break
+        middle = min(low + step, (low + high) // 2) if high < space.end else min(low + step, space.end - 1)
+        found = _entries(_list(client, bucket_name, shard, space.key(middle), max_keys=1))
+        if found:
+            low, step = max(middle, space.position(found[0][0])), step * 2
+        else:
+            high = middle
+    else:
+        # Not located within the probes: estimate up to the last key found
+        high = low + 1
+
+    def probe(span: tuple[str, int, int]) -> tuple[list[tuple[str, list[float]]], bool]:
+        page = _list(client, bucket_name, shard, span[0])
+        return _entries(page), bool(page.get("IsTruncated"))
+
+    # Spans of the key space (marker to list after, from and to position), one page listed from each. A span its
+    # page does not cover leaves a rest: the rests that would hold the most keys at their page's density are split
+    # and listed again, and those left when the pages run out get the density of all the key space covered
+    bounds = [start + (high - start) * j // positions for j in range(positions + 1)]
+    spans = [(space.key(a), a, b) for a, b in zip(bounds, bounds[1:], strict=False)]
+    listings = [(head, True)] + get_execution_pool().map(region, probe, spans[1:], gate=concurrency_gate(region, "s3"))
+    budget = SHARD_PAGES - len(listings)
+    totals, covered, rests = [0.0, 0.0, 0.0], 0, []
+    while True:
+        for (_, a, b), (listed, truncated) in zip(spans, listings, strict=True):
+            inside = [entry for entry in listed if space.position(entry[0]) < b]
+            totals = [total + n for total, n in zip(totals, _sum(inside), strict=True)]
+            last = space.position(listed[-1][0]) if listed else a
+            if truncated and len(inside) == len(listed) and last > a:
+                covered += last - a
+                rests.append((len(listed) * (b - last) / (last - a), listed[-1][0], last - a, last, b))
+            else:
+                covered += b - a
+        rests.sort(reverse=True)
+        refined, rests = rests[: min(positions, budget // 2)], rests[min(positions, budget // 2) :]
+        if not refined:
+            break
+        spans = []
+        for _, marker, width, last, b in refined:
+            # Split as far into the rest as the rest is times the width listed, as keys often cluster
+            middle = last + math.isqrt(width * (b - last))
+            spans += [(marker, last, middle), (space.key(middle), middle, b)]
+        listings = get_execution_pool().map(region, probe, spans, gate=concurrency_gate(region, "s3"))
+        budget -= len(spans)
+    rest = sum(b - last for *_, last, b in rests)
+    return [total * (1 + rest / max(covered, 1)) for total in totals]
+
+
+def _estimate_shard(
+    client: Any, bucket_name: str, region: str, shard: Shard, positions: int, pages: int
+) -> tuple[list[float], bool]:
+    """Count a shard from up to ``pages`` pages, or extrapolate it; return the totals and whether they are exact."""
+    listed, complete, _ = _head(client, bucket_name, shard, pages)
+    if complete or shard.delimiter or not listed:
+        # Keys directly under an expanded prefix are counted, not extrapolated
+        return _sum(listed), complete
+    return _extrapolate(client, bucket_name, region, shard, listed, positions), False
+
+
+def estimate_bucket(
+    client: Any,
+    bucket_name: str,
+    region: str,
+    positions: int = 8,
+    pages: int = 2,
+    delete_workers: int = 4,
+    list_shards: int = 1,
+) -> dict[str, Any]:
+    """Estimate a bucket's current objects, versions and bytes and its projected deletion time.
+
+    Args:
+        client: S3 client for the bucket's region.
+        bucket_name: Bucket to sample.
+        region: Bucket region (execution pool lane).
+        positions: Shards sampled, and positions sampled in a shard that does not fit in ``pages``.
+        pages: Pages listed from the start of the bucket and of each sampled shard.
+        delete_workers: Concurrent ``DeleteObjects`` calls of a real run.
+        list_shards: Concurrent listings of a real run.
+
+    Returns:
+        ``objects``, ``versions`` and ``bytes`` (rounded), whether they are ``exact``, and
+        ``projected_seconds``.
+    """
+    started = time.monotonic()
+    listed, exact, calls = _head(client, bucket_name, Shard(""), pages)
+    seconds_per_page = (time.monotonic() - started) / calls
+    totals = _sum(listed)
+    if not exact:
+        shards = discover_shards(client, bucket_name, region, positions)
+        step = max(1.0, len(shards) / positions)
+        sampled = [shards[int(j * step)] for j in range(min(positions, len(shards)))]
+        estimates = get_execution_pool().map(
+            region,
+            lambda shard: _estimate_shard(client, bucket_name, region, shard, positions, pages),
+            sampled,
+            gate=concurrency_gate(region, "s3"),
+        )
+        scale = len(shards) / len(sampled)
+        estimated = [scale * sum(counted[i] for counted, _ in estimates) for i in range(3)]
+        exact = len(sampled) == len(shards) and all(done for _, done in estimates)
+        # The first pages were counted, so the estimate is at least what they hold
+        totals = [max(total, n) for total, n in zip(totals, estimated, strict=True)]
+
+    objects, versions, size = totals
+    batches = versions / DELETE_BATCH_SIZE
+    listing = batches * seconds_per_page / max(list_shards, 1)
+    deleting = batches * DELETE_BATCH_SECONDS / max(delete_workers, 1)
+    return {
+        "objects": round(objects),
+        "versions": round(versions),
+        "bytes": round(size),
+        "exact": exact,
+        "projected_seconds": round(max(listing, deleting), 1),
+    }
@@ -0,0 +1,16 @@
+"""Run-wide S3 settings (``aws.s3``) shared by the S3 handlers."""
+
+from costcutter.config import S3Settings
+
+_settings: S3Settings | None = None
+
+
+def configure_s3_settings(settings: S3Settings | None) -> None:
+    """Install the run's ``aws.s3`` settings (None restores the defaults)."""
+    global _settings
+    _settings = settings
+
+
+def get_s3_settings() -> S3Settings:
+    """Return the configured ``aws.s3`` settings, or the defaults when none were configured."""
+    return _settings if _settings is not None else S3Settings()
@@ -0,0 +1,82 @@
+"""Tests for costcutter.core.client_pool"""
+
+import threading
+
+from botocore.config import Config as BotoConfig
+
+from costcutter.core.client_pool import ClientPool, configure_client_pool, get_client
+
+
+class CountingSession:
+    def __init__(self):
+        self.calls: list[tuple[str, dict]] = []
+        self._lock = threading.Lock()
+
+    def client(self, service_name, **kwargs):
+        with self._lock:
+            self.calls.append((service_name, kwargs))
+        return object()
+
+
+def test_get_client_caches_per_service_and_region():
+    session = CountingSession()
+    a = get_client(session, "ec2", "us-east-1")  # type: ignore[arg-type]
+    b = get_client(session, "ec2", "us-east-1")  # type: ignore[arg-type]
+    c = get_client(session, "ec2", "eu-west-1")  # type: ignore[arg-type]
+    d = get_client(session, "s3")  # type: ignore[arg-type]
+
+    assert a is b
+    assert a is not c
+    assert session.calls == [
+        ("ec2", {"region_name": "us-east-1"}),
+        ("ec2", {"region_name": "eu-west-1"}),
+        ("s3", {}),
+    ]
+    assert d is get_client(session, "s3")  # type: ignore[arg-type]
+
+
+def test_concurrent_get_creates_client_once():
+    session = CountingSession()
+    pool = ClientPool(session)  # type: ignore[arg-type]
+    barrier = threading.Barrier(8)
+    results: list[object] = []
+
+    def worker():
+        barrier.wait()
+        results.append(pool.get("ec2", "us-east-1"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(session.calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_configured_pool_applies_client_config():
+    session = CountingSession()
+    cfg = BotoConfig(max_pool_connections=42)
+    configure_client_pool(session, cfg)  # type: ignore[arg-type]
+
+    get_client(session, "ec2", "us-east-1")  # type: ignore[arg-type]
+
+    assert session.calls == [("ec2", {"region_name": "us-east-1", "config": cfg})]
+
+
+def test_get_client_without_weakref_support_is_not_cached():
+    class SlottedSession:
+        __slots__ = ("made",)
+
+        def __init__(self):
+            self.made = 0
+
+        def client(self, service_name, **kwargs):
+            self.made += 1
+            return object()
+
+    session = SlottedSession()
+    get_client(session, "ec2", "us-east-1")  # type: ignore[arg-type]
+    get_client(session, "ec2", "us-east-1")  # type: ignore[arg-type]
+    assert session.made == 2
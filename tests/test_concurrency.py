@@ -0,0 +1,145 @@
+"""Tests for costcutter.core.concurrency"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from costcutter.core.concurrency import (
+    AdaptiveConcurrency,
+    ConcurrencyController,
+    concurrency_gate,
+    configure_concurrency_controller,
+)
+from costcutter.core.execution import ExecutionPool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limit_increases_additively_after_a_window_of_successes():
+    gate = AdaptiveConcurrency(initial=2, maximum=4, clock=FakeClock())
+
+    gate.on_success()
+    assert gate.limit == 2
+    gate.on_success()
+    assert gate.limit == 3
+    for _ in range(3):
+        gate.on_success()
+    assert gate.limit == 4
+    for _ in range(10):
+        gate.on_success()
+    assert gate.limit == 4  # capped at maximum
+
+
+def test_throttle_cuts_limit_once_per_cooldown():
+    clock = FakeClock()
+    gate = AdaptiveConcurrency(initial=8, minimum=1, maximum=8, backoff_factor=0.5, cooldown=1.0, clock=clock)
+
+    gate.on_throttle()
+    gate.on_throttle()  # same burst, ignored
+    assert gate.limit == 4
+    clock.now = 2.0
+    gate.on_throttle()
+    clock.now = 4.0
+    gate.on_throttle()
+    gate.on_throttle()
+    assert gate.limit == 1
+    assert gate.throttles == 5
+
+    summary = gate.summary()
+    assert [h["reason"] for h in summary["history"]] == ["initial", "throttled", "throttled", "throttled"]
+    assert [h["limit"] for h in summary["history"]] == [8, 4, 2, 1]
+
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(initial=1, minimum=2, maximum=1)
+
+
+def test_controller_feeds_gate_from_client_events():
+    controller = ConcurrencyController(initial=2, maximum=10, cooldown=0)
+    client = boto3.client("ec2", region_name="eu-west-1", aws_access_key_id="testing", aws_secret_access_key="testing")
+    controller.attach(client)
+    gate = controller.gate("eu-west-1", "ec2")
+
+    with Stubber(client) as stubber:
+        for i in range(2):
+            stubber.add_response("delete_volume", {}, {"VolumeId": f"vol-{i}"})
+            client.delete_volume(VolumeId=f"vol-{i}")
+    assert gate.limit == 3
+
+    client.meta.events.emit(
+        "needs-retry.ec2.DeleteVolume",
+        response=(SimpleNamespace(status_code=503, headers={}), {"Error": {"Code": "RequestLimitExceeded"}}),
+        endpoint=None,
+        operation=None,
+        attempts=1,
+        caught_exception=None,
+        request_dict={"context": {}},
+    )
+    assert gate.limit == 1
+    assert controller.summary()["eu-west-1/ec2"]["throttles"] == 1
+
+
+def test_s3_per_key_slowdown_counts_as_throttle():
+    controller = ConcurrencyController(initial=4, maximum=10, cooldown=0)
+    client = boto3.client("s3", region_name="us-east-1", aws_access_key_id="testing", aws_secret_access_key="testing")
+    controller.attach(client)
+
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            "delete_objects",
+            {"Errors": [{"Key": "a", "Code": "SlowDown", "Message": "Reduce your request rate."}]},
+            {"Bucket": "b", "Delete": {"Objects": [{"Key": "a"}]}},
+        )
+        client.delete_objects(Bucket="b", Delete={"Objects": [{"Key": "a"}]})
+
+    assert controller.gate("us-east-1", "s3").limit == 2
+
+
+def test_pool_shares_gate_limit_across_lanes():
+    gate = AdaptiveConcurrency(initial=2, maximum=2)
+    pool = ExecutionPool(8)
+    lock = threading.Lock()
+    current = 0
+    peak = 0
+
+    def fn(_):
+        nonlocal current, peak
+        with lock:
+            current += 1
+            peak = max(peak, current)
+        time.sleep(0.02)
+        with lock:
+            current -= 1
+
+    try:
+        lanes = [threading.Thread(target=pool.map, args=("r", fn, range(6)), kwargs={"gate": gate}) for _ in range(2)]
+        for t in lanes:
+            t.start()
+        for t in lanes:
+            t.join()
+    finally:
+        pool.shutdown()
+
+    assert peak <= 2
+    assert gate.in_flight == 0
+
+
+def test_concurrency_gate_is_none_without_controller():
+    configure_concurrency_controller(None)
+    assert concurrency_gate("us-east-1", "ec2") is None
+
+    controller = ConcurrencyController()
+    configure_concurrency_controller(controller)
+    try:
+        assert concurrency_gate("us-east-1", "ec2") is controller.gate("us-east-1", "ec2")
+    finally:
+        configure_concurrency_controller(None)
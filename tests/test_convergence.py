@@ -0,0 +1,94 @@
+"""Tests for costcutter.core.convergence"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from costcutter.core.convergence import (
+    ConvergencePoller,
+    configure_convergence_poller,
+    track_convergence,
+)
+
+
+def _ec2_client(monkeypatch, pages_per_call):
+    """Patch get_client with an EC2 mock whose describe_instances paginator yields ``pages_per_call`` in turn."""
+    client = MagicMock()
+    calls: list[list[str]] = []
+
+    def paginate(Filters):  # noqa: N803
+        ids = Filters[0]["Values"]
+        calls.append(list(ids))
+        alive = pages_per_call[min(len(calls) - 1, len(pages_per_call) - 1)]
+        instances = [{"InstanceId": i, "State": {"Name": "shutting-down"}} for i in ids if i in alive]
+        return [{"Reservations": [{"Instances": instances}]}]
+
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    monkeypatch.setattr("costcutter.core.convergence.get_client", lambda *a, **k: client)
+    return calls
+
+
+def test_pending_ids_are_polled_in_batches(monkeypatch):
+    calls = _ec2_client(monkeypatch, [set()])
+    poller = ConvergencePoller(session=None, interval=0.01, timeout=5)
+    ids = [f"i-{n:04d}" for n in range(250)]
+
+    first = poller.track("us-east-1", "instance", ids[:100])
+    second = poller.track("us-east-1", "instance", ids[100:])
+
+    assert first.result(timeout=5) == []
+    assert second.result(timeout=5) == []
+    # One poll round covers both registrations, chunked to 200 IDs per call
+    assert sorted(len(c) for c in calls) == [50, 200]
+    assert poller.stats() == {"polls": 1, "describe_calls": 2, "converged": 250, "timed_out": 0}
+
+
+def test_waiters_resolve_per_id(monkeypatch):
+    _ec2_client(monkeypatch, [{"i-slow"}, {"i-slow"}, set()])
+    poller = ConvergencePoller(session=None, interval=0.01, timeout=5)
+
+    fast = poller.track("us-east-1", "instance", ["i-fast"])
+    slow = poller.track("us-east-1", "instance", ["i-slow"])
+    everything = poller.watch("us-east-1", "instance")
+
+    assert fast.result(timeout=5) == []
+    assert not slow.done()
+    assert slow.result(timeout=5) == []
+    assert everything.result(timeout=5) == []
+    assert poller.watch("us-east-1", "instance") is None
+
+
+def test_ids_still_present_at_timeout_are_reported(monkeypatch):
+    _ec2_client(monkeypatch, [{"i-stuck"}])
+    poller = ConvergencePoller(session=None, interval=0.01, timeout=0.05)
+
+    future = poller.track("us-east-1", "instance", ["i-stuck", "i-gone"])
+
+    assert future.result(timeout=5) == ["i-stuck"]
+    assert poller.stats()["timed_out"] == 1
+    assert poller.stats()["converged"] == 1
+
+
+def test_ids_tracked_while_a_poll_finishes_get_one_poll_loop(monkeypatch):
+    calls = _ec2_client(monkeypatch, [set()])
+    poller = ConvergencePoller(session=None, interval=0.01, timeout=5)
+    later = []
+
+    first = poller.track("us-east-1", "instance", ["i-1"])
+    # Runs in the finishing poll, after it released the lock
+    first.add_done_callback(lambda _: later.append(poller.track("us-east-1", "instance", ["i-2"])))
+
+    assert first.result(timeout=5) == []
+    assert later[0].result(timeout=5) == []
+    time.sleep(0.1)
+    assert calls == [["i-1"], ["i-2"]]
+    assert poller.stats()["polls"] == 2
+
+
+def test_track_convergence_without_poller_is_noop():
+    configure_convergence_poller(None)
+    assert track_convergence("us-east-1", "instance", ["i-1"]) is None
+
+    with pytest.raises(ValueError):
+        ConvergencePoller(session=None).track("us-east-1", "bucket", ["b"])
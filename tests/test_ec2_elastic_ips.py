@@ -30,7 +30,7 @@ def test_catalog_elastic_ips() -> None:
         ]
     }
 
-    result = catalog_elastic_ips(mock_session, "us-east-1")
+    result = list(catalog_elastic_ips(mock_session, "us-east-1"))
 
     assert len(result) == 2
     assert result[0]["allocation_id"] == "eipalloc-123"
@@ -39,6 +39,7 @@ def test_catalog_elastic_ips() -> None:
     assert result[1]["allocation_id"] == "eipalloc-456"
     assert result[1]["public_ip"] == "5.6.7.8"
     assert result[1]["association_id"] is None
+    mock_client.describe_addresses.assert_called_once_with(Filters=[{"Name": "domain", "Values": ["vpc"]}])
 
 
 def test_catalog_elastic_ips_client_error() -> None:
@@ -51,7 +52,7 @@ def test_catalog_elastic_ips_client_error() -> None:
         {"Error": {"Code": "UnauthorizedOperation"}}, "DescribeAddresses"
     )
 
-    result = catalog_elastic_ips(mock_session, "us-east-1")
+    result = list(catalog_elastic_ips(mock_session, "us-east-1"))
 
     assert result == []
 
@@ -134,7 +135,7 @@ def test_cleanup_elastic_ip_disassociate_fails() -> None:
     mock_session.client.return_value = mock_client
 
     mock_client.disassociate_address.side_effect = ClientError(
-        {"Error": {"Code": "InvalidAssociationID.NotFound"}}, "DisassociateAddress"
+        {"Error": {"Code": "AuthFailure"}}, "DisassociateAddress"
     )
 
     eip_info = {
@@ -150,6 +151,27 @@ def test_cleanup_elastic_ip_disassociate_fails() -> None:
     mock_client.release_address.assert_not_called()
 
 
+def test_cleanup_elastic_ip_already_disassociated_is_released() -> None:
+    """A stale association (removed by an earlier attempt) does not stop the release."""
+    mock_session = MagicMock()
+    mock_client = MagicMock()
+    mock_session.client.return_value = mock_client
+
+    mock_client.disassociate_address.side_effect = ClientError(
+        {"Error": {"Code": "InvalidAssociationID.NotFound"}}, "DisassociateAddress"
+    )
+
+    eip_info = {
+        "allocation_id": "eipalloc-123",
+        "public_ip": "1.2.3.4",
+        "association_id": "eipassoc-abc",
+    }
+
+    assert cleanup_elastic_ip(mock_session, "us-east-1", eip_info, dry_run=False) is False
+
+    mock_client.release_address.assert_called_once_with(AllocationId="eipalloc-123", DryRun=False)
+
+
 def test_cleanup_elastic_ip_release_fails() -> None:
     """Test cleanup when release fails."""
     mock_session = MagicMock()
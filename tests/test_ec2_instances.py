@@ -1,5 +1,7 @@
 """Tests for costcutter.services.ec2.instances"""
 
+from botocore.exceptions import ClientError
+
 from costcutter.services.ec2 import instances
 
 
@@ -9,8 +11,14 @@ class DummySession:
             def get_caller_identity(self):
                 return {"Account": "123456789012"}
 
-            def describe_instances(self):
-                return {"Reservations": [{"Instances": [{"InstanceId": "i-123"}]}]}
+            def get_paginator(self, operation_name):
+                class Paginator:
+                    def paginate(self, PaginationConfig, Filters):  # noqa: N803
+                        assert Filters == [{"Name": "instance-state-name", "Values": instances.LIVE_INSTANCE_STATES}]
+                        yield {"Reservations": [{"Instances": [{"InstanceId": "i-123"}]}]}
+                        yield {"Reservations": [{"Instances": [{"InstanceId": "i-456"}]}]}
+
+                return Paginator()
 
             def terminate_instances(self, **kwargs):
                 return {
@@ -40,8 +48,8 @@ def test_get_account_id():
 
 def test_catalog_instances():
     session = DummySession()
-    arns = instances.catalog_instances(session, "us-east-1")  # type: ignore[arg-type]
-    assert "i-123" in arns
+    arns = list(instances.catalog_instances(session, "us-east-1"))  # type: ignore[arg-type]
+    assert arns == ["i-123", "i-456"]
 
 
 def test_cleanup_instance(monkeypatch):
@@ -55,5 +63,83 @@ def test_cleanup_instance(monkeypatch):
 def test_cleanup_instances(monkeypatch):
     session = DummySession()
     monkeypatch.setattr("costcutter.services.ec2.instances.catalog_instances", lambda *args, **kwargs: ["i-123"])
-    monkeypatch.setattr("costcutter.services.ec2.instances.cleanup_instance", lambda *args, **kwargs: None)
+    monkeypatch.setattr("costcutter.services.ec2.instances.cleanup_instance_batch", lambda *args, **kwargs: [])
     instances.cleanup_instances(session, "us-east-1", dry_run=True, max_workers=1)  # type: ignore[arg-type]
+
+
+def _recording_reporter(monkeypatch):
+    events: list[tuple[str, str]] = []
+
+    class Reporter:
+        def record(self, region, service, resource, action, arn=None, meta=None):
+            events.append((arn.rsplit("/", 1)[-1], meta["status"]))
+
+    monkeypatch.setattr("costcutter.services.ec2.instances.get_reporter", lambda: Reporter())
+    monkeypatch.setattr("costcutter.services.ec2.instances._get_account_id", lambda session: "123456789012")
+    return events
+
+
+def test_cleanup_instances_batches_ids(monkeypatch):
+    events = _recording_reporter(monkeypatch)
+    calls: list[list[str]] = []
+
+    class Client:
+        def terminate_instances(self, InstanceIds, **kwargs):  # noqa: N803
+            calls.append(InstanceIds)
+            return {"TerminatingInstances": [{"InstanceId": i} for i in InstanceIds]}
+
+    ids = [f"i-{n}" for n in range(instances.TERMINATE_BATCH_SIZE + 3)]
+    monkeypatch.setattr("costcutter.services.ec2.instances.get_client", lambda *a, **k: Client())
+    monkeypatch.setattr("costcutter.services.ec2.instances.catalog_instances", lambda *a, **k: ids)
+
+    retry = instances.cleanup_instances(object(), "us-east-1", dry_run=False, max_workers=2)  # type: ignore[arg-type]
+
+    assert retry == []
+    assert sorted(len(c) for c in calls) == [3, instances.TERMINATE_BATCH_SIZE]
+    assert sum(1 for _, status in events if status == "terminated") == len(ids)
+
+
+def test_cleanup_instance_batch_bisects_to_isolate_failures(monkeypatch):
+    events = _recording_reporter(monkeypatch)
+    calls: list[list[str]] = []
+
+    class Client:
+        def terminate_instances(self, InstanceIds, **kwargs):  # noqa: N803
+            calls.append(InstanceIds)
+            if "i-protected" in InstanceIds:
+                raise ClientError({"Error": {"Code": "OperationNotPermitted"}}, "TerminateInstances")
+            if "i-busy" in InstanceIds:
+                raise ClientError(
+                    {"Error": {"Code": "InstanceInvalidState.TerminationInProgress"}}, "TerminateInstances"
+                )
+            return {"TerminatingInstances": [{"InstanceId": i} for i in InstanceIds]}
+
+    monkeypatch.setattr("costcutter.services.ec2.instances.get_client", lambda *a, **k: Client())
+    ids = ["i-1", "i-2", "i-protected", "i-3", "i-4", "i-5", "i-busy", "i-6"]
+
+    retry = instances.cleanup_instance_batch(object(), "us-east-1", ids, dry_run=False)  # type: ignore[arg-type]
+
+    assert retry == ["i-busy"]
+    assert len(calls) < 2 * len(ids)
+    statuses = dict(e for e in events if e[1] != "executing")
+    assert statuses.pop("i-protected") == "failed"
+    assert statuses.pop("i-busy") == "failed"
+    assert set(statuses.values()) == {"terminated"}
+    assert set(statuses) == {"i-1", "i-2", "i-3", "i-4", "i-5", "i-6"}
+
+
+def test_cleanup_instance_batch_does_not_split_on_throttling(monkeypatch):
+    _recording_reporter(monkeypatch)
+    calls: list[list[str]] = []
+
+    class Client:
+        def terminate_instances(self, InstanceIds, **kwargs):  # noqa: N803
+            calls.append(InstanceIds)
+            raise ClientError({"Error": {"Code": "RequestLimitExceeded"}}, "TerminateInstances")
+
+    monkeypatch.setattr("costcutter.services.ec2.instances.get_client", lambda *a, **k: Client())
+
+    retry = instances.cleanup_instance_batch(object(), "us-east-1", ["i-1", "i-2", "i-3"], dry_run=False)  # type: ignore[arg-type]
+
+    assert retry == ["i-1", "i-2", "i-3"]
+    assert len(calls) == 1
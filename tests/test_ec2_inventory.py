@@ -0,0 +1,153 @@
+"""Tests for costcutter.services.ec2.inventory"""
+
+from collections import Counter
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+from botocore.exceptions import ClientError
+
+from costcutter.services.ec2 import instances
+from costcutter.services.ec2.inventory import Ec2Inventory, configure_ec2_inventory, get_ec2_inventory
+from costcutter.services.ec2.key_pairs import catalog_key_pairs
+from costcutter.services.ec2.security_groups import catalog_security_groups
+from costcutter.services.ec2.snapshots import catalog_snapshots
+from costcutter.services.ec2.volumes import catalog_volumes
+from costcutter.services.elasticbeanstalk import environments
+
+PAGES = {
+    "describe_instances": {"Reservations": [{"Instances": [{"InstanceId": "i-1"}]}]},
+    "describe_volumes": {"Volumes": [{"VolumeId": "vol-1", "State": "in-use"}]},
+    "describe_snapshots": {"Snapshots": [{"SnapshotId": "snap-ami"}, {"SnapshotId": "snap-free"}]},
+    "describe_images": {"Images": [{"ImageId": "ami-1", "BlockDeviceMappings": [{"Ebs": {"SnapshotId": "snap-ami"}}]}]},
+    "describe_security_groups": {
+        "SecurityGroups": [
+            {"GroupId": "sg-default", "GroupName": "default"},
+            {"GroupId": "sg-web", "GroupName": "web"},
+            {"GroupId": "sg-lambda", "GroupName": "lambda"},
+        ]
+    },
+    "describe_network_interfaces": {
+        "NetworkInterfaces": [
+            # Goes away with its instance
+            {"NetworkInterfaceId": "eni-1", "Attachment": {"InstanceId": "i-1"}, "Groups": [{"GroupId": "sg-web"}]},
+            {"NetworkInterfaceId": "eni-2", "InterfaceType": "lambda", "Groups": [{"GroupId": "sg-lambda"}]},
+        ]
+    },
+}
+
+
+class Client:
+    def __init__(self):
+        self.calls = Counter()
+
+    def get_paginator(self, operation):
+        def paginate(**kwargs):
+            self.calls[operation] += 1
+            yield PAGES[operation]
+
+        return SimpleNamespace(paginate=paginate)
+
+    def describe_addresses(self, Filters):  # noqa: N803
+        self.calls["describe_addresses"] += 1
+        raise ClientError({"Error": {"Code": "UnauthorizedOperation"}}, "DescribeAddresses")
+
+    def describe_key_pairs(self):
+        self.calls["describe_key_pairs"] += 1
+        return {"KeyPairs": [{"KeyPairId": "key-1"}]}
+
+    def terminate_instances(self, **kwargs):
+        return {"TerminatingInstances": []}
+
+    def terminate_environment(self, **kwargs):
+        return {}
+
+
+def _configure():
+    client = Client()
+    session = SimpleNamespace(client=lambda *a, **k: client)
+    inventory = Ec2Inventory(session)  # type: ignore[arg-type]
+    configure_ec2_inventory(inventory)
+    return session, inventory, client
+
+
+def test_handlers_share_one_sweep_and_use_each_others_resources():
+    session, inventory, client = _configure()
+    try:
+        assert list(catalog_key_pairs(session, "r")) == ["key-1"]  # type: ignore[arg-type]
+        # Snapshots of registered AMIs are left alone
+        assert list(catalog_snapshots(session, "r")) == ["snap-free"]  # type: ignore[arg-type]
+        # Only the group held by a non-instance interface is skipped
+        assert list(catalog_security_groups(session, "r")) == ["sg-web"]  # type: ignore[arg-type]
+        assert list(catalog_volumes(session, "r")) == []  # type: ignore[arg-type]
+    finally:
+        configure_ec2_inventory(None)
+
+    # Every kind described once; the failed one is retried on its own when read
+    assert all(count == 1 for count in client.calls.values())
+    assert inventory.stats["sweeps"] == 1
+    assert inventory.stats["hits"] == 6
+
+
+def test_terminating_instances_invalidates_dependent_kinds(monkeypatch):
+    session, inventory, client = _configure()
+    monkeypatch.setattr(instances, "_get_account_id", lambda s: "123")
+    monkeypatch.setattr(instances, "get_reporter", lambda: SimpleNamespace(record=lambda *a, **k: None))
+    monkeypatch.setattr(instances, "track_convergence", lambda *a: None)
+    try:
+        assert list(instances.catalog_instances(session, "r")) == ["i-1"]  # type: ignore[arg-type]
+        instances.cleanup_instance_batch(session, "r", ["i-1"], dry_run=False)  # type: ignore[arg-type]
+        list(catalog_volumes(session, "r"))  # type: ignore[arg-type]
+        list(catalog_security_groups(session, "r"))  # type: ignore[arg-type]
+    finally:
+        configure_ec2_inventory(None)
+
+    assert client.calls["describe_volumes"] == 2
+    assert client.calls["describe_network_interfaces"] == 2
+    assert client.calls["describe_security_groups"] == 1
+    # Addresses failed to describe, so there was nothing to invalidate
+    assert inventory.stats["invalidations"] == 3
+
+
+def test_terminated_environments_invalidate_their_groups_and_interfaces(monkeypatch):
+    session, inventory, client = _configure()
+    terminated: Future = Future()
+    monkeypatch.setattr(environments, "_get_account_id", lambda s: "123")
+    monkeypatch.setattr(environments, "get_reporter", lambda: SimpleNamespace(record=lambda *a, **k: None))
+    monkeypatch.setattr(environments, "track_convergence", lambda *a: terminated)
+    try:
+        list(catalog_security_groups(session, "r"))  # type: ignore[arg-type]
+        environments.cleanup_environment(session, "r", "env-1", dry_run=False)  # type: ignore[arg-type]
+        # Still terminating: the environment's groups and interfaces exist
+        list(catalog_security_groups(session, "r"))  # type: ignore[arg-type]
+        assert client.calls["describe_security_groups"] == 1
+        terminated.set_result([])
+        list(catalog_security_groups(session, "r"))  # type: ignore[arg-type]
+    finally:
+        configure_ec2_inventory(None)
+
+    assert client.calls["describe_security_groups"] == 2
+    assert client.calls["describe_network_interfaces"] == 2
+    assert inventory.stats["invalidations"] == 2
+
+
+def test_inventory_is_only_served_to_its_session():
+    session = SimpleNamespace()
+    inventory = Ec2Inventory(session)  # type: ignore[arg-type]
+    configure_ec2_inventory(inventory)
+    try:
+        assert get_ec2_inventory(session) is inventory  # type: ignore[arg-type]
+        assert get_ec2_inventory(SimpleNamespace()) is None  # type: ignore[arg-type]
+    finally:
+        configure_ec2_inventory(None)
+    assert get_ec2_inventory(session) is None  # type: ignore[arg-type]
+
+
+def test_forget_drops_deleted_resources():
+    session, inventory, _ = _configure()
+    try:
+        inventory.forget("r", "key_pairs", ["key-1"])  # not swept yet: nothing to drop
+        assert [k["KeyPairId"] for k in inventory.get("r", "key_pairs")] == ["key-1"]
+        inventory.forget("r", "key_pairs", ["key-1"])
+        assert inventory.get("r", "key_pairs") == []
+    finally:
+        configure_ec2_inventory(None)
@@ -0,0 +1,122 @@
+"""Tests for costcutter.services.ec2.security_group_dependencies"""
+
+from types import SimpleNamespace
+
+from botocore.exceptions import ClientError
+
+from costcutter.services.ec2 import security_groups
+from costcutter.services.ec2.security_group_dependencies import plan_security_groups, resolve_security_groups
+
+
+def _ref(*group_ids):
+    return [
+        {"IpProtocol": "tcp", "FromPort": 443, "ToPort": 443, "UserIdGroupPairs": [{"GroupId": g} for g in group_ids]}
+    ]
+
+
+GROUPS = [
+    {"GroupId": "sg-default", "GroupName": "default", "IpPermissions": _ref("sg-db")},
+    # app and web reference each other; app references itself, which never blocks
+    {"GroupId": "sg-web", "IpPermissions": _ref("sg-app"), "IpPermissionsEgress": [{"IpProtocol": "-1"}]},
+    {"GroupId": "sg-app", "IpPermissions": _ref("sg-web", "sg-app"), "IpPermissionsEgress": _ref("sg-cache")},
+    {"GroupId": "sg-cache", "IpPermissions": [{"IpProtocol": "tcp", "IpRanges": [{"CidrIp": "10.0.0.0/8"}]}]},
+    {"GroupId": "sg-db", "IpPermissions": _ref("sg-secrets")},
+    {"GroupId": "sg-secrets"},
+    {"GroupId": "sg-lb"},
+]
+INTERFACES = [
+    {"NetworkInterfaceId": "eni-left", "Status": "available", "Groups": [{"GroupId": "sg-cache"}]},
+    {"NetworkInterfaceId": "eni-elb", "Status": "in-use", "Groups": [{"GroupId": "sg-lb"}]},
+]
+TARGETS = ["sg-web", "sg-app", "sg-cache", "sg-db", "sg-secrets", "sg-lb"]
+
+
+class Client:
+    def __init__(self, fail_revoke=()):
+        self.fail_revoke = set(fail_revoke)
+        self.revoked = []
+        self.deleted_interfaces = []
+
+    def get_paginator(self, operation):
+        pages = {"describe_security_groups": {"SecurityGroups": GROUPS}}
+        pages["describe_network_interfaces"] = {"NetworkInterfaces": INTERFACES}
+        return SimpleNamespace(paginate=lambda **kwargs: iter([pages[operation]]))
+
+    def _revoke(self, direction, GroupId, IpPermissions):  # noqa: N803
+        if GroupId in self.fail_revoke:
+            raise ClientError({"Error": {"Code": "UnauthorizedOperation"}}, "RevokeSecurityGroupIngress")
+        self.revoked.append((direction, GroupId, IpPermissions))
+
+    def revoke_security_group_ingress(self, **kwargs):
+        self._revoke("ingress", **kwargs)
+
+    def revoke_security_group_egress(self, **kwargs):
+        self._revoke("egress", **kwargs)
+
+    def delete_network_interface(self, NetworkInterfaceId):  # noqa: N803
+        self.deleted_interfaces.append(NetworkInterfaceId)
+
+
+def test_plan_blocks_groups_kept_by_others_and_their_references():
+    plan = plan_security_groups(GROUPS, INTERFACES, TARGETS)
+
+    assert plan.blocked == {
+        "sg-lb": "used by network interface eni-elb",
+        "sg-db": "referenced by security group sg-default",
+        "sg-secrets": "referenced by security group sg-db",
+    }
+    assert list(plan.revocations) == ["sg-web", "sg-app", "sg-cache"]
+    assert plan.revocations["sg-app"] == {
+        "ingress": _ref("sg-web"),
+        "egress": _ref("sg-cache"),
+    }
+    assert plan.revocations["sg-cache"] == {}
+    assert plan.interfaces == ["eni-left"]
+
+
+def test_resolve_revokes_in_bulk_and_deletes_in_one_layer():
+    client = Client()
+    session = SimpleNamespace(client=lambda *a, **k: client)
+
+    layers, blocked = resolve_security_groups(session, "r", TARGETS)  # type: ignore[arg-type]
+
+    assert layers == [["sg-app", "sg-cache", "sg-web"]]
+    assert set(blocked) == {"sg-lb", "sg-db", "sg-secrets"}
+    assert sorted((d, g) for d, g, _ in client.revoked) == [
+        ("egress", "sg-app"),
+        ("ingress", "sg-app"),
+        ("ingress", "sg-web"),
+    ]
+    assert client.deleted_interfaces == ["eni-left"]
+
+
+def test_unrevoked_references_order_the_deletions():
+    client = Client(fail_revoke={"sg-app"})
+    session = SimpleNamespace(client=lambda *a, **k: client)
+
+    layers, _ = resolve_security_groups(session, "r", ["sg-web", "sg-app", "sg-cache"])  # type: ignore[arg-type]
+    # app still references web and cache, so it goes first
+    assert layers == [["sg-app"], ["sg-cache", "sg-web"]]
+
+    # web and app still reference each other: no order works, delete them together
+    client = Client(fail_revoke={"sg-app", "sg-web"})
+    layers, _ = resolve_security_groups(session, "r", ["sg-web", "sg-app", "sg-cache"])  # type: ignore[arg-type]
+    assert layers == [["sg-web", "sg-app", "sg-cache"]]
+
+
+def test_cleanup_skips_blocked_groups_and_deletes_the_rest(monkeypatch):
+    client = Client()
+    deleted = []
+    client.delete_security_group = lambda GroupId, DryRun: deleted.append(GroupId)  # noqa: N803
+    session = SimpleNamespace(client=lambda *a, **k: client)
+    records = []
+    monkeypatch.setattr(security_groups, "_get_account_id", lambda s: "123")
+    monkeypatch.setattr(
+        security_groups, "get_reporter", lambda: SimpleNamespace(record=lambda *a, **k: records.append(k["meta"]))
+    )
+
+    retry = security_groups.cleanup_security_groups(session, "r", dry_run=False, resource_ids=TARGETS)  # type: ignore[arg-type]
+
+    assert retry == []
+    assert sorted(deleted) == ["sg-app", "sg-cache", "sg-web"]
+    assert sum(meta["status"] == "skipped" for meta in records) == 3
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 
 from botocore.exceptions import ClientError
 
+from costcutter.core.execution import run_later
 from costcutter.services.ec2.security_groups import (
     catalog_security_groups,
     cleanup_security_group,
@@ -17,15 +18,17 @@ def test_catalog_security_groups() -> None:
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
 
-    mock_client.describe_security_groups.return_value = {
-        "SecurityGroups": [
-            {"GroupId": "sg-123", "GroupName": "custom-sg"},
-            {"GroupId": "sg-456", "GroupName": "default"},  # Should be filtered out
-            {"GroupId": "sg-789", "GroupName": "another-sg"},
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "SecurityGroups": [
+                {"GroupId": "sg-123", "GroupName": "custom-sg"},
+                {"GroupId": "sg-456", "GroupName": "default"},  # Should be filtered out
+                {"GroupId": "sg-789", "GroupName": "another-sg"},
+            ]
+        }
+    ]
 
-    result = catalog_security_groups(mock_session, "us-east-1")
+    result = list(catalog_security_groups(mock_session, "us-east-1"))
 
     assert result == ["sg-123", "sg-789"]
 
@@ -36,11 +39,11 @@ def test_catalog_security_groups_client_error() -> None:
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
 
-    mock_client.describe_security_groups.side_effect = ClientError(
+    mock_client.get_paginator.return_value.paginate.side_effect = ClientError(
         {"Error": {"Code": "UnauthorizedOperation"}}, "DescribeSecurityGroups"
     )
 
-    result = catalog_security_groups(mock_session, "us-east-1")
+    result = list(catalog_security_groups(mock_session, "us-east-1"))
 
     assert result == []
 
@@ -67,8 +70,9 @@ def test_cleanup_security_group_actual() -> None:
     mock_client.delete_security_group.assert_called_once_with(GroupId="sg-123", DryRun=False)
 
 
-def test_cleanup_security_group_fails() -> None:
-    """Test cleanup when deletion fails."""
+def test_cleanup_security_group_fails(monkeypatch) -> None:
+    """Test cleanup when deletion keeps failing with a soft blocker."""
+    monkeypatch.setattr("costcutter.services.common.time.sleep", lambda s: None)
     mock_session = MagicMock()
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
@@ -77,9 +81,10 @@ def test_cleanup_security_group_fails() -> None:
         {"Error": {"Code": "DependencyViolation"}}, "DeleteSecurityGroup"
     )
 
-    cleanup_security_group(mock_session, "us-east-1", "sg-123", dry_run=False)
+    assert cleanup_security_group(mock_session, "us-east-1", "sg-123", dry_run=False) is True
 
-    mock_client.delete_security_group.assert_called_once()
+    # Initial attempt plus three soft-blocker retries
+    assert mock_client.delete_security_group.call_count == 4
 
 
 def test_cleanup_security_groups() -> None:
@@ -88,13 +93,68 @@ def test_cleanup_security_groups() -> None:
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
 
-    mock_client.describe_security_groups.return_value = {
-        "SecurityGroups": [
-            {"GroupId": "sg-123", "GroupName": "custom-sg"},
-            {"GroupId": "sg-789", "GroupName": "another-sg"},
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "SecurityGroups": [
+                {"GroupId": "sg-123", "GroupName": "custom-sg"},
+                {"GroupId": "sg-789", "GroupName": "another-sg"},
+            ]
+        }
+    ]
 
     cleanup_security_groups(mock_session, "us-east-1", dry_run=True, max_workers=2)
 
     assert mock_client.delete_security_group.call_count == 2
+
+
+def test_soft_blocker_retry_is_deferred_on_the_pool(monkeypatch) -> None:
+    """Inside the execution pool, soft-blocker retries park the call instead of sleeping."""
+    from costcutter.core.execution import ExecutionPool
+    from costcutter.services.ec2 import security_groups
+
+    def fail_on_sleep(seconds):
+        raise AssertionError("worker thread slept")
+
+    monkeypatch.setattr("costcutter.services.common.time.sleep", fail_on_sleep)
+    monkeypatch.setattr("costcutter.services.common.run_later", lambda delay, fn: run_later(delay / 100, fn))
+    mock_client = MagicMock()
+    mock_client.delete_security_group.side_effect = [
+        ClientError({"Error": {"Code": "DependencyViolation"}}, "DeleteSecurityGroup"),
+        {},
+    ]
+
+    pool = ExecutionPool(1)
+    try:
+        pool.map("us-east-1", lambda gid: security_groups._delete_security_group(mock_client, gid, False), ["sg-1"])
+    finally:
+        pool.shutdown()
+
+    assert mock_client.delete_security_group.call_count == 2
+
+
+def test_deferred_retry_reports_the_group_once(monkeypatch) -> None:
+    """Only the failed call is retried, so the executing event is recorded once."""
+    from costcutter.core.execution import ExecutionPool
+    from costcutter.services.ec2 import security_groups
+
+    monkeypatch.setattr("costcutter.services.common.run_later", lambda delay, fn: run_later(delay / 100, fn))
+    statuses: list[str] = []
+    mock_reporter = MagicMock()
+    mock_reporter.record.side_effect = lambda *a, **k: statuses.append(k["meta"]["status"])
+    monkeypatch.setattr(security_groups, "get_reporter", lambda: mock_reporter)
+    monkeypatch.setattr(security_groups, "_get_account_id", lambda session: "123")
+    mock_session = MagicMock()
+    mock_client = MagicMock()
+    mock_session.client.return_value = mock_client
+    mock_client.delete_security_group.side_effect = [
+        ClientError({"Error": {"Code": "DependencyViolation"}}, "DeleteSecurityGroup"),
+        {},
+    ]
+
+    pool = ExecutionPool(1)
+    try:
+        pool.map("us-east-1", lambda gid: cleanup_security_group(mock_session, "us-east-1", gid, False), ["sg-1"])
+    finally:
+        pool.shutdown()
+
+    assert statuses == ["executing", "deleted"]
@@ -13,17 +13,22 @@ def test_catalog_snapshots() -> None:
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
 
-    mock_client.describe_snapshots.return_value = {
-        "Snapshots": [
-            {"SnapshotId": "snap-123"},
-            {"SnapshotId": "snap-456"},
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Snapshots": [
+                {"SnapshotId": "snap-123"},
+                {"SnapshotId": "snap-456"},
+            ]
+        }
+    ]
 
-    result = catalog_snapshots(mock_session, "us-east-1")
+    result = list(catalog_snapshots(mock_session, "us-east-1"))
 
     assert result == ["snap-123", "snap-456"]
-    mock_client.describe_snapshots.assert_called_once_with(OwnerIds=["self"])
+    mock_client.get_paginator.assert_called_once_with("describe_snapshots")
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={"PageSize": 500}, OwnerIds=["self"]
+    )
 
 
 def test_catalog_snapshots_client_error() -> None:
@@ -32,11 +37,11 @@ def test_catalog_snapshots_client_error() -> None:
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
 
-    mock_client.describe_snapshots.side_effect = ClientError(
+    mock_client.get_paginator.return_value.paginate.side_effect = ClientError(
         {"Error": {"Code": "UnauthorizedOperation"}}, "DescribeSnapshots"
     )
 
-    result = catalog_snapshots(mock_session, "us-east-1")
+    result = list(catalog_snapshots(mock_session, "us-east-1"))
 
     assert result == []
 
@@ -84,13 +89,39 @@ def test_cleanup_snapshots() -> None:
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
 
-    mock_client.describe_snapshots.return_value = {
-        "Snapshots": [
-            {"SnapshotId": "snap-123"},
-            {"SnapshotId": "snap-456"},
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Snapshots": [
+                {"SnapshotId": "snap-123"},
+                {"SnapshotId": "snap-456"},
+            ]
+        }
+    ]
 
     cleanup_snapshots(mock_session, "us-east-1", dry_run=True, max_workers=2)
 
     assert mock_client.delete_snapshot.call_count == 2
+
+
+def test_catalog_snapshots_reads_every_page() -> None:
+    """Snapshots beyond the first page are cataloged, with the configured page size."""
+    from costcutter.services.common import DEFAULT_PAGE_SIZE, configure_page_size
+
+    mock_session = MagicMock()
+    mock_client = MagicMock()
+    mock_session.client.return_value = mock_client
+    mock_client.get_paginator.return_value.paginate.return_value = iter([
+        {"Snapshots": [{"SnapshotId": f"snap-{page}-{n}"} for n in range(3)]} for page in range(3)
+    ])
+
+    configure_page_size(3)
+    try:
+        result = list(catalog_snapshots(mock_session, "us-east-1"))
+    finally:
+        configure_page_size(DEFAULT_PAGE_SIZE)
+
+    assert len(result) == 9
+    assert result[-1] == "snap-2-2"
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={"PageSize": 3}, OwnerIds=["self"]
+    )
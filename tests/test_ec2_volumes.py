@@ -13,17 +13,21 @@ def test_catalog_volumes() -> None:
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
 
-    mock_client.describe_volumes.return_value = {
-        "Volumes": [
-            {"VolumeId": "vol-123"},
-            {"VolumeId": "vol-456"},
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Volumes": [
+                {"VolumeId": "vol-123"},
+                {"VolumeId": "vol-456"},
+            ]
+        }
+    ]
 
-    result = catalog_volumes(mock_session, "us-east-1")
+    result = list(catalog_volumes(mock_session, "us-east-1"))
 
     assert result == ["vol-123", "vol-456"]
-    mock_client.describe_volumes.assert_called_once_with(Filters=[{"Name": "status", "Values": ["available"]}])
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={"PageSize": 500}, Filters=[{"Name": "status", "Values": ["available"]}]
+    )
 
 
 def test_catalog_volumes_client_error() -> None:
@@ -32,11 +36,11 @@ def test_catalog_volumes_client_error() -> None:
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
 
-    mock_client.describe_volumes.side_effect = ClientError(
+    mock_client.get_paginator.return_value.paginate.side_effect = ClientError(
         {"Error": {"Code": "UnauthorizedOperation"}}, "DescribeVolumes"
     )
 
-    result = catalog_volumes(mock_session, "us-east-1")
+    result = list(catalog_volumes(mock_session, "us-east-1"))
 
     assert result == []
 
@@ -82,13 +86,41 @@ def test_cleanup_volumes() -> None:
     mock_client = MagicMock()
     mock_session.client.return_value = mock_client
 
-    mock_client.describe_volumes.return_value = {
-        "Volumes": [
-            {"VolumeId": "vol-123"},
-            {"VolumeId": "vol-456"},
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Volumes": [
+                {"VolumeId": "vol-123"},
+                {"VolumeId": "vol-456"},
+            ]
+        }
+    ]
 
     cleanup_volumes(mock_session, "us-east-1", dry_run=True, max_workers=2)
 
     assert mock_client.delete_volume.call_count == 2
+
+
+def test_cleanup_volumes_returns_transient_failures(monkeypatch) -> None:
+    """Only volumes that failed with transient errors are returned for retry."""
+    from costcutter.services.ec2 import volumes
+
+    # Skip the soft-blocker backoff; the handler-level result is what is under test
+    monkeypatch.setattr(volumes, "_delete_volume", volumes._delete_volume.__wrapped__)
+    mock_session = MagicMock()
+    mock_client = MagicMock()
+    mock_session.client.return_value = mock_client
+
+    def delete_volume(**kwargs):
+        if kwargs["VolumeId"] == "vol-busy":
+            raise ClientError({"Error": {"Code": "VolumeInUse"}}, "DeleteVolume")
+        if kwargs["VolumeId"] == "vol-denied":
+            raise ClientError({"Error": {"Code": "UnauthorizedOperation"}}, "DeleteVolume")
+
+    mock_client.delete_volume.side_effect = delete_volume
+
+    retry = cleanup_volumes(
+        mock_session, "us-east-1", dry_run=False, max_workers=2, resource_ids=["vol-ok", "vol-busy", "vol-denied"]
+    )
+
+    assert retry == ["vol-busy"]
+    mock_client.describe_volumes.assert_not_called()
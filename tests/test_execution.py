@@ -0,0 +1,270 @@
+"""Tests for costcutter.core.execution"""
+
+import threading
+import time
+
+import pytest
+
+from costcutter.core.concurrency import AdaptiveConcurrency
+from costcutter.core.execution import (
+    ExecutionPool,
+    RetryLater,
+    configure_execution_pool,
+    current_attempt,
+    get_execution_pool,
+    in_worker,
+    run_later,
+)
+
+
+def test_map_returns_results_in_order():
+    pool = ExecutionPool(3)
+    try:
+        assert pool.map("us-east-1", lambda x: x * 2, [3, 1, 2]) == [6, 2, 4]
+        assert pool.map("us-east-1", lambda x: x, []) == []
+    finally:
+        pool.shutdown()
+
+
+def test_map_propagates_exceptions_after_all_items_finish():
+    pool = ExecutionPool(2)
+    seen: list[int] = []
+
+    def fn(x):
+        seen.append(x)
+        if x == 1:
+            raise RuntimeError("boom")
+        return x
+
+    try:
+        with pytest.raises(RuntimeError):
+            pool.map("r", fn, [0, 1, 2, 3])
+        assert sorted(seen) == [0, 1, 2, 3]
+    finally:
+        pool.shutdown()
+
+
+def test_map_respects_max_in_flight():
+    pool = ExecutionPool(8)
+    lock = threading.Lock()
+    current = 0
+    peak = 0
+
+    def fn(_):
+        nonlocal current, peak
+        with lock:
+            current += 1
+            peak = max(peak, current)
+        time.sleep(0.01)
+        with lock:
+            current -= 1
+
+    try:
+        pool.map("r", fn, range(20), max_in_flight=2)
+        assert peak <= 2
+    finally:
+        pool.shutdown()
+
+
+def test_total_concurrency_bounded_by_pool_size():
+    pool = ExecutionPool(3)
+    lock = threading.Lock()
+    current = 0
+    peak = 0
+
+    def leaf(_):
+        nonlocal current, peak
+        with lock:
+            current += 1
+            peak = max(peak, current)
+        time.sleep(0.005)
+        with lock:
+            current -= 1
+
+    def task(region):
+        # Nested fan-out from inside a worker must neither deadlock nor exceed the budget
+        pool.map(region, leaf, range(10))
+        return region
+
+    try:
+        futures = [pool.submit(r, task, r) for r in ("us-east-1", "eu-west-1", "ap-south-1", "sa-east-1")]
+        assert sorted(f.result(timeout=10) for f in futures) == ["ap-south-1", "eu-west-1", "sa-east-1", "us-east-1"]
+        assert peak <= 3
+    finally:
+        pool.shutdown()
+
+
+def test_regions_are_served_round_robin():
+    pool = ExecutionPool(1)
+    gate = threading.Event()
+    order: list[str] = []
+
+    try:
+        # Occupy the single worker so both lanes are queued before dispatch starts
+        blocker = pool.submit("x", gate.wait)
+        a = threading.Thread(target=pool.map, args=("busy", order.append, ["busy"] * 4))
+        a.start()
+        time.sleep(0.05)
+        b = threading.Thread(target=pool.map, args=("quiet", order.append, ["quiet"]))
+        b.start()
+        time.sleep(0.05)
+        gate.set()
+        blocker.result(timeout=5)
+        a.join(timeout=5)
+        b.join(timeout=5)
+        # The quiet region is served before the busy region's backlog drains
+        assert order.index("quiet") < 3
+    finally:
+        pool.shutdown()
+
+
+def test_configure_execution_pool_replaces_singleton():
+    pool = configure_execution_pool(2)
+    assert get_execution_pool() is pool
+    assert pool.max_workers == 2
+    with pytest.raises(ValueError):
+        ExecutionPool(0)
+
+
+def test_retry_later_parks_item_and_frees_worker():
+    pool = ExecutionPool(1)
+    order: list[str] = []
+
+    def flaky(name):
+        if name == "slow" and current_attempt() == 0:
+            order.append("deferred")
+            raise RetryLater(0.05)
+        order.append(f"{name}@{current_attempt()}")
+        return name
+
+    try:
+        assert pool.map("r", flaky, ["slow", "fast"]) == ["slow", "fast"]
+    finally:
+        pool.shutdown()
+
+    # The single worker ran "fast" while "slow" waited on the timer heap
+    assert order == ["deferred", "fast@0", "slow@1"]
+    assert not in_worker()
+
+
+def test_imap_yields_in_order_and_bounds_buffered_items():
+    pool = ExecutionPool(4)
+    produced = 0
+    max_ahead = 0
+    consumed = 0
+
+    def source():
+        nonlocal produced, max_ahead
+        for i in range(50):
+            produced += 1
+            max_ahead = max(max_ahead, produced - consumed)
+            yield i
+
+    def fn(x):
+        time.sleep(0.001)
+        return x * 10
+
+    try:
+        results = []
+        for result in pool.imap("r", fn, source(), max_in_flight=2, window=3):
+            consumed += 1
+            results.append(result)
+        assert results == [x * 10 for x in range(50)]
+        # The producer never ran more than the window ahead of the consumer
+        assert max_ahead <= 4
+        assert list(pool.imap("r", fn, [])) == []
+    finally:
+        pool.shutdown()
+
+
+def test_imap_overlaps_production_with_running_items():
+    pool = ExecutionPool(2)
+    started = threading.Event()
+
+    def source():
+        yield 0
+        # The first item runs on a worker while the next one is being produced
+        assert started.wait(timeout=5)
+        yield 1
+
+    def fn(x):
+        started.set()
+        return x
+
+    try:
+        assert list(pool.imap("r", fn, source(), max_in_flight=1)) == [0, 1]
+    finally:
+        pool.shutdown()
+
+
+def test_expand_processes_follow_ups_and_bounds_running_items():
+    pool = ExecutionPool(4)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fn(item):
+        nonlocal running, peak
+        name, page = item
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.001)
+        with lock:
+            running -= 1
+        # Every seed has three pages
+        return [f"{name}{page}"], [(name, page + 1)] if page < 2 else []
+
+    try:
+        results = list(pool.expand("r", fn, [("a", 0), ("b", 0), ("c", 0)], max_in_flight=2))
+        assert sorted(results) == ["a0", "a1", "a2", "b0", "b1", "b2", "c0", "c1", "c2"]
+        assert peak <= 2
+        # Inside a worker the caller helps run its own lane
+        assert pool.submit("r", lambda: sorted(pool.expand("r", fn, [("d", 1)]))).result(timeout=5) == ["d1", "d2"]
+    finally:
+        pool.shutdown()
+
+
+def test_nested_work_on_a_gate_at_limit_one_does_not_deadlock():
+    gate = AdaptiveConcurrency(initial=1, maximum=1)
+    pool = ExecutionPool(2)
+
+    def outer(x):
+        # Nested work on the gate the outer item holds
+        return sum(pool.imap("r", lambda y: x * y, [1, 2, 3], gate=gate))
+
+    try:
+        result = pool.submit("r", lambda: pool.map("r", outer, [1, 2], gate=gate)).result(timeout=5)
+        assert result == [6, 12]
+        assert gate.in_flight == 0
+    finally:
+        # Do not join the workers: they would hang forever if the nested work deadlocked
+        pool.shutdown(wait=False)
+
+
+def test_run_later_parks_only_the_call_and_keeps_the_pool_busy():
+    pool = ExecutionPool(1)
+    order: list[str] = []
+
+    def item(name):
+        if name == "waits":
+            order.append("parked")
+            order.append(run_later(0.05, lambda: "call@" + str(current_attempt())))
+        else:
+            order.append(name)
+        return name
+
+    try:
+        assert pool.map("r", item, ["waits", "other"]) == ["waits", "other"]
+        # The stand-in worker leaves once the waiting item resumed
+        deadline = time.monotonic() + 1
+        while len(pool._threads) > 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(pool._threads) == 1
+    finally:
+        pool.shutdown()
+
+    # A stand-in ran "other" while the call waited; the item was not re-run
+    assert order == ["parked", "other", "call@0"]
+    with pytest.raises(RuntimeError):
+        run_later(0, lambda: None)
@@ -1,5 +1,7 @@
 """Tests for costcutter.orchestrator"""
 
+import threading
+
 import pytest
 
 from costcutter.orchestrator import _process_single_resource, _service_supported_in_region, orchestrate_services
@@ -160,3 +162,178 @@ def test_orchestrate_services_skipped_and_processed_counts(monkeypatch):
     assert isinstance(summary, dict)
     assert "processed" in summary
     assert "stages" in summary
+
+
+def test_execute_streams_dependents_without_stage_barrier(monkeypatch):
+    """A slow region must not hold back dependents in other regions."""
+    import threading
+
+    from costcutter.orchestrator import _execute_with_topological_sort
+
+    fast_volumes_done = threading.Event()
+    order: list[str] = []
+
+    def fake_process(session, service, resource_type, region, dry_run, resource_max_workers=10):
+        if (resource_type, region) == ("instances", "ap-south-1"):
+            # Block until the fast region's dependent task has run
+            assert fast_volumes_done.wait(timeout=5)
+        if (resource_type, region) == ("volumes", "us-east-1"):
+            fast_volumes_done.set()
+        order.append(f"{region}/{resource_type}")
+        return {"status": "succeeded"}
+
+    monkeypatch.setattr("costcutter.orchestrator._process_single_resource", fake_process)
+    monkeypatch.setattr("costcutter.orchestrator.get_reporter", lambda: type("R", (), {"to_dicts": lambda self: []})())
+
+    summary = _execute_with_topological_sort(
+        session=object(),  # type: ignore[arg-type]
+        selected_resources={("ec2", "instances"), ("ec2", "volumes")},
+        regions=["us-east-1", "ap-south-1"],
+        available_regions_map={},
+        dry_run=True,
+        max_workers=2,
+    )
+
+    assert summary["processed"] == 4
+    assert order.index("us-east-1/volumes") < order.index("ap-south-1/instances")
+    assert order.index("ap-south-1/instances") < order.index("ap-south-1/volumes")
+
+
+def test_execute_skips_dependencies_outside_selection(monkeypatch):
+    """Dependencies on unselected resources are satisfied without running a handler."""
+    from costcutter.orchestrator import _execute_with_topological_sort
+
+    ran: list[tuple[str, str]] = []
+
+    def fake_process(session, service, resource_type, region, dry_run, resource_max_workers=10):
+        ran.append((service, resource_type))
+        return {"status": "succeeded"}
+
+    monkeypatch.setattr("costcutter.orchestrator._process_single_resource", fake_process)
+    monkeypatch.setattr("costcutter.orchestrator.get_reporter", lambda: type("R", (), {"to_dicts": lambda self: []})())
+
+    summary = _execute_with_topological_sort(
+        session=object(),  # type: ignore[arg-type]
+        selected_resources={("ec2", "security_groups")},
+        regions=["us-east-1"],
+        available_regions_map={},
+        dry_run=True,
+        max_workers=1,
+    )
+
+    assert ran == [("ec2", "security_groups")]
+    assert summary["stages"][0]["succeeded"] == 1
+
+
+def test_execute_retries_only_transient_failures_after_backoff(monkeypatch):
+    """Transient failures are re-attempted by ID without re-running the whole task."""
+    from costcutter.config import ResourceRetrySettings
+    from costcutter.orchestrator import _execute_with_topological_sort
+
+    calls: list[tuple[str, list | None]] = []
+
+    def fake_process(session, service, resource_type, region, dry_run, resource_max_workers=10, resource_ids=None):
+        calls.append((resource_type, resource_ids))
+        if resource_type == "volumes" and resource_ids is None:
+            return {"status": "succeeded", "retry": ["vol-1"]}
+        return {"status": "succeeded", "retry": []}
+
+    monkeypatch.setattr("costcutter.orchestrator._process_single_resource", fake_process)
+    monkeypatch.setattr("costcutter.orchestrator.get_reporter", lambda: type("R", (), {"to_dicts": lambda self: []})())
+
+    summary = _execute_with_topological_sort(
+        session=object(),  # type: ignore[arg-type]
+        selected_resources={("ec2", "instances"), ("ec2", "volumes")},
+        regions=["us-east-1"],
+        available_regions_map={},
+        dry_run=False,
+        max_workers=2,
+        retry_settings=ResourceRetrySettings(base_delay=0.01, max_delay=0.01, deadline=5),
+    )
+
+    assert calls == [("instances", None), ("volumes", None), ("volumes", ["vol-1"])]
+    assert summary["processed"] == 2
+    assert summary["failed"] == 0
+    retry_stage = summary["stages"][1]
+    assert retry_stage["stage"] == "retry"
+    assert retry_stage["tasks"][0]["attempt"] == 1
+
+
+def test_execute_gives_up_on_retries_at_deadline(monkeypatch):
+    from costcutter.config import ResourceRetrySettings
+    from costcutter.orchestrator import _execute_with_topological_sort
+
+    attempts: list[list | None] = []
+
+    def fake_process(session, service, resource_type, region, dry_run, resource_max_workers=10, resource_ids=None):
+        attempts.append(resource_ids)
+        return {"status": "succeeded", "retry": ["sg-1"]}
+
+    monkeypatch.setattr("costcutter.orchestrator._process_single_resource", fake_process)
+    monkeypatch.setattr("costcutter.orchestrator.get_reporter", lambda: type("R", (), {"to_dicts": lambda self: []})())
+
+    summary = _execute_with_topological_sort(
+        session=object(),  # type: ignore[arg-type]
+        selected_resources={("ec2", "security_groups")},
+        regions=["us-east-1"],
+        available_regions_map={},
+        dry_run=False,
+        max_workers=1,
+        retry_settings=ResourceRetrySettings(base_delay=0.05, max_delay=0.05, deadline=0),
+    )
+
+    assert attempts == [None]
+    assert summary["processed"] == 0
+    assert summary["failed"] == 1
+
+
+def test_execute_holds_dependents_until_deletions_converge(monkeypatch):
+    """Volumes start only after the terminated instances have disappeared."""
+    from concurrent.futures import Future
+
+    from costcutter.orchestrator import _execute_with_topological_sort
+
+    converged: Future = Future()
+    order: list[str] = []
+
+    class PollerStub:
+        def watch(self, region, kind):
+            return converged if kind == "instance" else None
+
+    def fake_process(session, service, resource_type, region, dry_run, resource_max_workers=10):
+        if resource_type == "instances":
+            threading.Timer(0.05, lambda: (order.append("converged"), converged.set_result([]))).start()
+        order.append(resource_type)
+        return {"status": "succeeded"}
+
+    monkeypatch.setattr("costcutter.orchestrator._process_single_resource", fake_process)
+    monkeypatch.setattr("costcutter.orchestrator.get_convergence_poller", lambda: PollerStub())
+    monkeypatch.setattr("costcutter.orchestrator.get_reporter", lambda: type("R", (), {"to_dicts": lambda self: []})())
+
+    summary = _execute_with_topological_sort(
+        session=object(),  # type: ignore[arg-type]
+        selected_resources={("ec2", "instances"), ("ec2", "volumes")},
+        regions=["us-east-1"],
+        available_regions_map={},
+        dry_run=False,
+        max_workers=2,
+    )
+
+    assert order == ["instances", "converged", "volumes"]
+    instances_entry = summary["stages"][0]["tasks"][0]
+    assert instances_entry["converging"] is True
+    assert instances_entry["converged_after"] >= 0
+
+
+def test_global_resources_get_a_single_task():
+    """S3 buckets are scheduled once for all regions, regional resources once per region."""
+    from costcutter.dependencies import GLOBAL_REGION
+    from costcutter.orchestrator import _build_dependency_graph
+
+    graph = _build_dependency_graph({("s3", "buckets"), ("ec2", "instances")}, ["us-east-1", "eu-west-1"])
+
+    assert set(graph) == {
+        ("s3", "buckets", GLOBAL_REGION),
+        ("ec2", "instances", "us-east-1"),
+        ("ec2", "instances", "eu-west-1"),
+    }
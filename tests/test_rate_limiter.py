@@ -0,0 +1,102 @@
+"""Tests for costcutter.core.rate_limiter"""
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from costcutter.core.rate_limiter import RateLimiter, TokenBucket, classify_action, request_cost
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_classify_action_follows_ec2_categories():
+    assert classify_action("ec2", "TerminateInstances") == "resource_intensive"
+    assert classify_action("ec2", "DeleteSnapshot") == "mutating"
+    assert classify_action("ec2", "DescribeInstances") == "unfiltered_non_mutating"
+    assert classify_action("ec2", "DescribeInstances", {"MaxResults": 100}) == "non_mutating"
+    assert classify_action("ec2", "DescribeVolumes", {"Filters": [{"Name": "status"}]}) == "non_mutating"
+    assert classify_action("ec2", "DescribeVolumes", {"VolumeIds": ["vol-1"]}) == "non_mutating"
+    assert classify_action("s3", "ListObjectVersions") == "non_mutating"
+    assert classify_action("s3", "DeleteObjects") == "mutating"
+
+
+def test_request_cost_counts_s3_batch_keys():
+    params = {"Bucket": "b", "Delete": {"Objects": [{"Key": "a"}, {"Key": "b"}, {"Key": "c"}]}}
+    assert request_cost("s3", "DeleteObjects", params) == 3
+    assert request_cost("ec2", "DeleteVolume", {"VolumeId": "vol-1"}) == 1
+
+
+def test_token_bucket_allows_burst_then_waits_for_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=5, capacity=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.2)
+    assert bucket.acquire() == pytest.approx(0.2)
+    assert clock.slept == [pytest.approx(0.2), pytest.approx(0.2)]
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+
+
+def test_rate_limiter_scales_published_buckets_and_keys_by_region():
+    clock = FakeClock()
+    limiter = RateLimiter(account_id="123", share=0.5, clock=clock, sleep=clock.sleep)
+
+    bucket = limiter.bucket("us-east-1", "ec2", "TerminateInstances")
+    assert bucket is not None
+    assert (bucket.rate, bucket.capacity) == (2.5, 25)
+    assert limiter.bucket("us-east-1", "ec2", "TerminateInstances") is bucket
+    assert limiter.bucket("eu-west-1", "ec2", "TerminateInstances") is not bucket
+    # Unknown services are not limited
+    assert limiter.bucket("us-east-1", "sts", "GetCallerIdentity") is None
+
+
+def test_rate_limiter_overrides_and_stats():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        share=0.5,
+        overrides={"ec2:DeleteSnapshot": (1.0, 1.0), "ec2:mutating": (2.0, 4.0)},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    snap = limiter.bucket("r", "ec2", "DeleteSnapshot")
+    vol = limiter.bucket("r", "ec2", "DeleteVolume")
+    assert snap is not None and (snap.rate, snap.capacity) == (1.0, 1.0)
+    assert vol is not None and (vol.rate, vol.capacity) == (2.0, 4.0)
+
+    limiter.acquire("r", "ec2", "DeleteSnapshot")
+    limiter.acquire("r", "ec2", "DeleteSnapshot")
+    assert limiter.stats() == {"r/ec2/DeleteSnapshot": 1.0}
+
+    with pytest.raises(ValueError):
+        RateLimiter(share=0)
+
+
+def test_attached_client_waits_for_token_before_each_call():
+    clock = FakeClock()
+    limiter = RateLimiter(overrides={"ec2:DeleteVolume": (1.0, 1.0)}, clock=clock, sleep=clock.sleep)
+    client = boto3.client("ec2", region_name="us-east-1", aws_access_key_id="testing", aws_secret_access_key="testing")
+    limiter.attach(client)
+
+    with Stubber(client) as stubber:
+        stubber.add_response("delete_volume", {}, {"VolumeId": "vol-1"})
+        stubber.add_response("delete_volume", {}, {"VolumeId": "vol-2"})
+        client.delete_volume(VolumeId="vol-1")
+        client.delete_volume(VolumeId="vol-2")
+
+    assert clock.slept == [pytest.approx(1.0)]
+    assert "us-east-1/ec2/DeleteVolume" in limiter.stats()
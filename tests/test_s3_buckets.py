@@ -1,5 +1,6 @@
 """Tests for costcutter.services.s3.buckets"""
 
+from functools import partial
 from types import SimpleNamespace
 
 import pytest
@@ -59,7 +60,7 @@ def test_cleanup_objects_records_and_calls(monkeypatch):
     class DummyClient:
         def delete_objects(self, **kwargs):
             last.update(kwargs)
-            return {"Deleted": kwargs["Delete"]["Objects"]}
+            return {}
 
     monkeypatch.setattr("costcutter.services.s3.buckets.get_reporter", lambda: DummyReporter())
     client = DummyClient()
@@ -69,13 +70,20 @@ def test_cleanup_objects_records_and_calls(monkeypatch):
         client=client, bucket_name="buck", objects_iter=iter(objs), region="r", reporter=buckets.get_reporter()
     )
 
-    # reporter recorded two events
-    assert len(recorded) == 2
+    # one per-bucket event carries the counts instead of one event per object
+    assert len(recorded) == 1
+    assert recorded[0][1]["meta"] == {
+        "status": "deleted",
+        "objects": 2,
+        "versions": 1,
+        "bytes": 0,
+        "failed": 0,
+    }
     # client.delete_objects invoked with Objects; the second entry should omit VersionId when None
     assert last["Bucket"] == "buck"
     assert isinstance(last["Delete"], dict)
     expected = [{"Key": "a.txt", "VersionId": "1"}, {"Key": "b.txt"}]
-    assert last["Delete"]["Objects"] == expected
+    assert last["Delete"] == {"Objects": expected, "Quiet": True}
 
 
 def test_delete_errors_are_recorded(monkeypatch):
@@ -91,7 +99,7 @@ def test_delete_errors_are_recorded(monkeypatch):
     class DummyClient:
         def delete_objects(self, **kwargs):
             last.update(kwargs)
-            return {"Deleted": [], "Errors": [{"Key": "x.txt", "Code": "AccessDenied", "Message": "denied"}]}
+            return {"Errors": [{"Key": "x.txt", "Code": "AccessDenied", "Message": "denied"}]}
 
     monkeypatch.setattr("costcutter.services.s3.buckets.get_reporter", lambda: DummyReporter())
     client = DummyClient()
@@ -101,12 +109,33 @@ def test_delete_errors_are_recorded(monkeypatch):
         client=client, bucket_name="buck", objects_iter=iter(objs), region="r", reporter=buckets.get_reporter()
     )
 
-    # Should have recorded the initial delete record and then a failure record
-    assert len(recorded) >= 2
+    # Only the failing key is recorded individually, followed by the bucket's counts
+    assert [k["meta"]["status"] for a, k in recorded] == ["failed", "failed"]
+    assert recorded[0][1]["meta"]["key"] == "x.txt"
+    assert recorded[1][1]["meta"]["objects"] == 0
+    assert recorded[1][1]["meta"]["failed"] == 1
     # last delete payload should include the object (without VersionId)
     assert last["Delete"]["Objects"] == [{"Key": "x.txt"}]
 
 
+def test_failed_delete_call_records_every_key():
+    class Client:
+        def delete_objects(self, Bucket, Delete):  # noqa: N803
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "DeleteObjects")
+
+    recorded = []
+    reporter = SimpleNamespace(record=lambda *a, **k: recorded.append(k["meta"]))
+    objs = [{"Key": "a", "VersionId": "v1"}, {"Key": "b"}]
+
+    counts = buckets.cleanup_objects(Client(), "buck", iter(objs), "r", reporter)
+
+    assert counts == {"objects": 0, "versions": 0, "bytes": 0, "failed": 2}
+    assert recorded[:2] == [
+        {"status": "failed", "key": "a", "error_code": "AccessDenied", "error_message": "denied", "version_id": "v1"},
+        {"status": "failed", "key": "b", "error_code": "AccessDenied", "error_message": "denied"},
+    ]
+
+
 def test_catalog_buckets_and_cleanup_buckets(monkeypatch):
     # Dummy session to return client with list_buckets
     class DummySession:
@@ -194,7 +223,7 @@ def test_abort_multipart_uploads_handles_uploads_and_errors():
 
     client = DummyClient()
     aborted = buckets.abort_multipart_uploads(client=client, bucket_name="buck", region="r")
-    assert aborted == 1
+    assert aborted == {"uploads": 1, "bytes": 0}
     assert called == [("buck", "good.txt", "u1")]
 
 
@@ -262,6 +291,9 @@ def test_cleanup_bucket_non_dry_run_success(monkeypatch):
             # no-op
             return None
 
+        def get_object_lock_configuration(self, Bucket):  # noqa: N803
+            raise ClientError({"Error": {"Code": "ObjectLockConfigurationNotFoundError"}}, "GetObjectLockConfiguration")
+
         def delete_objects(self, **kwargs):
             # record payload and return Deleted list
             self.deleted_payload = kwargs
@@ -296,3 +328,225 @@ def test_cleanup_buckets_propagates_exceptions(monkeypatch):
 
     with pytest.raises(RuntimeError):
         buckets.cleanup_buckets(session=object(), region="r", dry_run=True, max_workers=1)  # type: ignore[arg-type]
+
+
+def test_global_cleanup_buckets_runs_largest_first_in_each_bucket_region(monkeypatch):
+    from costcutter.dependencies import GLOBAL_REGION
+
+    index = {"small": "us-east-1", "huge": "eu-west-1", "medium": "us-east-1", "elsewhere": "sa-east-1"}
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.get_bucket_region_index",
+        lambda session: SimpleNamespace(regions=lambda: dict(index)),
+    )
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.estimate_object_counts",
+        lambda session, targets: {"small": 10.0, "huge": 10_000_000.0, "medium": 5_000.0},
+    )
+    started: list[tuple[str, str]] = []
+
+    def fake_cleanup_bucket(session, region, bucket_name, dry_run=True):
+        started.append((bucket_name, region))
+        return bucket_name == "medium"
+
+    monkeypatch.setattr("costcutter.services.s3.buckets.cleanup_bucket", fake_cleanup_bucket)
+
+    retry = buckets.cleanup_buckets(
+        session=object(),  # type: ignore[arg-type]
+        region=GLOBAL_REGION,
+        dry_run=False,
+        max_workers=1,
+        regions=["us-east-1", "eu-west-1"],
+    )
+
+    assert started == [("huge", "eu-west-1"), ("medium", "us-east-1"), ("small", "us-east-1")]
+    assert retry == ["medium"]
+
+
+def test_buckets_above_threshold_are_expired_and_deleted_once_empty(monkeypatch):
+    from costcutter.config import S3Settings
+    from costcutter.services.s3.expiration import EXPIRE_RULE_ID
+    from costcutter.services.s3.settings import configure_s3_settings
+
+    class Client:
+        def __init__(self):
+            self.rules = None
+            self.versions = [{"Key": "k", "VersionId": "1"}]
+
+        def get_bucket_lifecycle_configuration(self, Bucket):  # noqa: N803
+            if self.rules is None:
+                raise ClientError(
+                    {"Error": {"Code": "NoSuchLifecycleConfiguration"}}, "GetBucketLifecycleConfiguration"
+                )
+            return {"Rules": self.rules}
+
+        def put_bucket_lifecycle_configuration(self, Bucket, LifecycleConfiguration):  # noqa: N803
+            self.rules = LifecycleConfiguration["Rules"]
+
+        def list_object_versions(self, Bucket, MaxKeys):  # noqa: N803
+            return {"Versions": self.versions[:MaxKeys]}
+
+    client = Client()
+    recorded = []
+    deleted = []
+    monkeypatch.setattr("costcutter.services.s3.buckets.get_client", lambda *a, **k: client)
+    monkeypatch.setattr("costcutter.services.s3.buckets.catalog_buckets", lambda session, region: ["huge", "small"])
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.estimate_object_counts",
+        lambda session, targets: {"huge": 5_000_000_000.0, "small": 10.0},
+    )
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.get_reporter",
+        lambda: SimpleNamespace(record=lambda *a, **k: recorded.append((a[3], k["meta"]["status"]))),
+    )
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.cleanup_bucket",
+        lambda session, region, bucket_name, dry_run=True: deleted.append(bucket_name) or False,
+    )
+    configure_s3_settings(S3Settings(expire_above_objects=1_000_000))
+    try:
+        run = partial(buckets.cleanup_buckets, session=object(), region="r", dry_run=False, max_workers=1)
+
+        assert run() == []
+        assert client.rules[0]["ID"] == EXPIRE_RULE_ID
+        assert deleted == ["small"]
+        assert recorded == [("expire", "expiring")]
+
+        # Still expiring: nothing is deleted and no rule is rewritten
+        client.rules = [*client.rules, {"ID": "marker"}]
+        run()
+        assert deleted == ["small", "small"]
+        assert client.rules[-1] == {"ID": "marker"}
+
+        # Emptied by S3: the bucket is deleted
+        client.versions = []
+        run()
+        assert deleted == ["small", "small", "huge", "small"]
+    finally:
+        configure_s3_settings(None)
+
+
+def test_cleanup_objects_pipelines_concurrent_batches():
+    import threading
+    import time
+
+    lock = threading.Lock()
+    current = 0
+    peak = 0
+    deleted: list[str] = []
+
+    class Client:
+        def delete_objects(self, Bucket, Delete):  # noqa: N803
+            nonlocal current, peak
+            with lock:
+                current += 1
+                peak = max(peak, current)
+            time.sleep(0.02)
+            with lock:
+                current -= 1
+                deleted.extend(o["Key"] for o in Delete["Objects"])
+            return {"Deleted": Delete["Objects"]}
+
+    objs = ({"Key": f"k{i}", "VersionId": None} for i in range(buckets.DELETE_OBJECTS_BATCH_SIZE * 6 + 5))
+    buckets.cleanup_objects(
+        client=Client(),
+        bucket_name="buck",
+        objects_iter=objs,
+        region="r",
+        reporter=SimpleNamespace(record=lambda *a, **k: None),
+        max_in_flight=3,
+    )
+
+    assert len(deleted) == buckets.DELETE_OBJECTS_BATCH_SIZE * 6 + 5
+    assert 1 < peak <= 3
+
+
+def test_cleanup_objects_counts_bytes_and_keeps_per_object_events_opt_in():
+    from costcutter.config import S3Settings
+    from costcutter.services.s3.settings import configure_s3_settings
+
+    class Client:
+        def delete_objects(self, Bucket, Delete):  # noqa: N803
+            return {"Errors": [{"Key": "b", "VersionId": "2", "Code": "AccessDenied", "Message": "no"}]}
+
+    objs = [{"Key": "a", "VersionId": "1", "Size": 100}, {"Key": "b", "VersionId": "2", "Size": 50}, {"Key": "c"}]
+
+    def run():
+        recorded = []
+        reporter = SimpleNamespace(record=lambda *a, **k: recorded.append(k["meta"]))
+        counts = buckets.cleanup_objects(Client(), "buck", iter(objs), "r", reporter)
+        return counts, recorded
+
+    counts, recorded = run()
+    assert counts == {"objects": 2, "versions": 1, "bytes": 100, "failed": 1}
+    assert [m["status"] for m in recorded] == ["failed", "failed"]
+
+    configure_s3_settings(S3Settings(object_events=True))
+    try:
+        _, recorded = run()
+    finally:
+        configure_s3_settings(None)
+    assert [m["status"] for m in recorded] == ["executing"] * 3 + ["failed", "failed"]
+
+
+def test_cleanup_objects_retries_only_errored_keys_within_budget():
+    from costcutter.config import S3Settings
+    from costcutter.services.s3.settings import configure_s3_settings
+
+    calls: list[list[str]] = []
+
+    class Client:
+        def delete_objects(self, Bucket, Delete):  # noqa: N803
+            keys = [o["Key"] for o in Delete["Objects"]]
+            calls.append(keys)
+            errors = [{"Key": "stuck", "Code": "InternalError", "Message": "try again"}] if "stuck" in keys else []
+            if "slow" in keys and len(calls) < 3:
+                errors.append({"Key": "slow", "Code": "SlowDown", "Message": "reduce your request rate"})
+            return {"Errors": errors}
+
+    recorded = []
+    reporter = SimpleNamespace(record=lambda *a, **k: recorded.append(k["meta"]))
+    objs = [{"Key": "a", "Size": 1}, {"Key": "slow", "Size": 2}, {"Key": "stuck", "Size": 4}]
+    configure_s3_settings(S3Settings(key_retry_attempts=3, key_retry_base_delay=0.01))
+    try:
+        counts = buckets.cleanup_objects(Client(), "buck", iter(objs), "r", reporter)
+    finally:
+        configure_s3_settings(None)
+
+    assert counts == {"objects": 2, "versions": 0, "bytes": 3, "failed": 1}
+    # Only the errored keys are sent again; the stuck key is given up after three attempts
+    assert [sorted(c) for c in calls] == [["a", "slow", "stuck"], ["slow", "stuck"], ["slow", "stuck"]]
+    assert [m["key"] for m in recorded if "key" in m] == ["stuck"]
+
+
+def test_abort_multipart_uploads_runs_concurrently_and_counts_bytes():
+    import threading
+    import time
+
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class Client:
+        def get_paginator(self, name):
+            class P:
+                def paginate(self, Bucket, Key=None, UploadId=None):  # noqa: N803
+                    if name == "list_multipart_uploads":
+                        yield {"Uploads": [{"Key": f"k{n}", "UploadId": f"u{n}"} for n in range(6)]}
+                    else:
+                        yield {"Parts": [{"PartNumber": 1, "Size": 5}, {"PartNumber": 2, "Size": 3}]}
+
+            return P()
+
+        def abort_multipart_upload(self, **kwargs):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+    aborted = buckets.abort_multipart_uploads(Client(), "buck", "r", max_in_flight=3)
+
+    assert aborted == {"uploads": 6, "bytes": 48}
+    assert 1 < peak <= 3
@@ -0,0 +1,102 @@
+"""Tests for costcutter.services.s3.checkpoints"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from botocore.exceptions import ClientError
+
+from costcutter.config import S3Settings
+from costcutter.services.s3 import buckets
+from costcutter.services.s3.checkpoints import ListCheckpoints
+from costcutter.services.s3.settings import configure_s3_settings
+
+
+class Client:
+    """S3 client double listing versions two per page and honouring KeyMarker."""
+
+    def __init__(self, keys, interrupt_at=None):
+        self.keys = keys
+        self.interrupt_at = interrupt_at
+        self.listed_from: list = []
+        self.deleted: list[str] = []
+        self.bucket_deleted = False
+
+    def get_paginator(self, operation):
+        client = self
+
+        class Paginator:
+            def paginate(self, Bucket, KeyMarker=None, **kwargs):  # noqa: N803
+                if operation != "list_object_versions":
+                    return
+                client.listed_from.append(KeyMarker)
+                remaining = [k for k in client.keys if KeyMarker is None or k > KeyMarker]
+                for start in range(0, len(remaining), 2):
+                    page = remaining[start : start + 2]
+                    truncated = start + 2 < len(remaining)
+                    yield {
+                        "Versions": [{"Key": k, "VersionId": "v"} for k in page],
+                        "IsTruncated": truncated,
+                        **({"NextKeyMarker": page[-1], "NextVersionIdMarker": "v"} if truncated else {}),
+                    }
+
+        return Paginator()
+
+    def delete_objects(self, Bucket, Delete):  # noqa: N803
+        keys = [o["Key"] for o in Delete["Objects"]]
+        if self.interrupt_at in keys:
+            raise KeyboardInterrupt
+        self.deleted.extend(keys)
+        return {}
+
+    def delete_bucket(self, Bucket):  # noqa: N803
+        self.bucket_deleted = True
+
+    def get_object_lock_configuration(self, Bucket):  # noqa: N803
+        raise ClientError({"Error": {"Code": "ObjectLockConfigurationNotFoundError"}}, "GetObjectLockConfiguration")
+
+
+class Session:
+    def __init__(self, client):
+        self._client = client
+
+    def client(self, service_name=None, region_name=None, **kwargs):
+        return self._client
+
+
+def test_checkpoints_round_trip(tmp_path):
+    path = tmp_path / "state" / "markers.json"
+    store = ListCheckpoints(path)
+    assert store.get("b") is None
+
+    store.update("b", {"KeyMarker": "k", "VersionIdMarker": "v"})
+    assert json.loads(path.read_text()) == {"b": {"KeyMarker": "k", "VersionIdMarker": "v"}}
+    assert ListCheckpoints(path).get("b") == {"KeyMarker": "k", "VersionIdMarker": "v"}
+
+    store.clear("b")
+    assert ListCheckpoints(path).get("b") is None
+
+
+def test_interrupted_bucket_wipe_resumes_from_checkpoint(monkeypatch, tmp_path):
+    monkeypatch.setattr(buckets, "DELETE_OBJECTS_BATCH_SIZE", 2)
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.get_reporter", lambda: SimpleNamespace(record=lambda *a, **k: None)
+    )
+    path = tmp_path / "markers.json"
+    configure_s3_settings(S3Settings(list_checkpoint_enabled=True, list_checkpoint_path=str(path), delete_workers=1))
+    keys = [f"k{n}" for n in range(6)]
+    try:
+        first = Client(keys, interrupt_at="k4")
+        with pytest.raises(KeyboardInterrupt):
+            buckets.cleanup_bucket(Session(first), "r", "buck", dry_run=False)  # type: ignore[arg-type]
+        assert first.deleted == ["k0", "k1", "k2", "k3"]
+        assert ListCheckpoints(path).get("buck") == {"KeyMarker": "k3", "VersionIdMarker": "v"}
+
+        second = Client(keys)
+        buckets.cleanup_bucket(Session(second), "r", "buck", dry_run=False)  # type: ignore[arg-type]
+        assert second.listed_from == ["k3"]
+        assert second.deleted == ["k4", "k5"]
+        assert second.bucket_deleted
+        assert ListCheckpoints(path).get("buck") is None
+    finally:
+        configure_s3_settings(None)
@@ -0,0 +1,48 @@
+"""Tests for costcutter.services.s3.estimates"""
+
+from botocore.exceptions import ClientError
+
+from costcutter.services.s3 import estimates
+
+
+class CloudWatch:
+    def __init__(self, region, fail=False):
+        self.region = region
+        self.fail = fail
+        self.queries: list[int] = []
+
+    def get_paginator(self, operation):
+        client = self
+
+        class Paginator:
+            def paginate(self, MetricDataQueries, StartTime, EndTime):  # noqa: N803
+                if client.fail:
+                    raise ClientError({"Error": {"Code": "AccessDenied", "Message": "no"}}, "GetMetricData")
+                client.queries.append(len(MetricDataQueries))
+                yield {
+                    "MetricDataResults": [
+                        {"Id": q["Id"], "Values": [float(i + 1) * 100, 1.0]} for i, q in enumerate(MetricDataQueries)
+                    ]
+                }
+
+        return Paginator()
+
+
+def test_object_counts_are_fetched_per_region_in_batches(monkeypatch):
+    clients = {"us-east-1": CloudWatch("us-east-1"), "eu-west-1": CloudWatch("eu-west-1", fail=True)}
+    monkeypatch.setattr(estimates, "get_client", lambda session, service, region: clients[region])
+    buckets = {f"b{i}": "us-east-1" for i in range(estimates.METRIC_QUERIES_PER_CALL + 2)}
+    buckets["denied"] = "eu-west-1"
+
+    counts = estimates.estimate_object_counts(object(), buckets)  # type: ignore[arg-type]
+
+    assert clients["us-east-1"].queries == [estimates.METRIC_QUERIES_PER_CALL, 2]
+    # Newest datapoint wins; regions without metrics fall back to 0
+    assert counts["b0"] == 100.0
+    assert counts["b1"] == 200.0
+    assert counts["denied"] == 0.0
+
+
+def test_largest_first_keeps_listing_order_for_ties():
+    order = estimates.largest_first({"a": "r", "b": "r", "c": "r"}, {"b": 5.0})
+    assert order == ["b", "a", "c"]
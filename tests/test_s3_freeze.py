@@ -0,0 +1,95 @@
+"""Tests for costcutter.services.s3.freeze"""
+
+import json
+from types import SimpleNamespace
+
+from botocore.exceptions import ClientError
+
+from costcutter.config import S3Settings
+from costcutter.services.s3 import buckets
+from costcutter.services.s3.freeze import FREEZE_SID, freeze_writes, thaw_writes
+from costcutter.services.s3.settings import configure_s3_settings
+
+OWN_STATEMENT = {"Sid": "ReadOnly", "Effect": "Allow", "Principal": "*", "Action": "s3:GetObject", "Resource": "*"}
+
+
+class Client:
+    """S3 client double holding a bucket policy and versioning status."""
+
+    def __init__(self, policy=None, versioning="Enabled"):
+        self.policy = json.dumps(policy) if policy else None
+        self.versioning = versioning
+        self.deleted = False
+
+    def get_bucket_policy(self, Bucket):  # noqa: N803
+        if self.policy is None:
+            raise ClientError({"Error": {"Code": "NoSuchBucketPolicy"}}, "GetBucketPolicy")
+        return {"Policy": self.policy}
+
+    def put_bucket_policy(self, Bucket, Policy):  # noqa: N803
+        self.policy = Policy
+
+    def delete_bucket_policy(self, Bucket):  # noqa: N803
+        self.policy = None
+
+    def get_bucket_versioning(self, Bucket):  # noqa: N803
+        return {"Status": self.versioning} if self.versioning else {}
+
+    def put_bucket_versioning(self, Bucket, VersioningConfiguration):  # noqa: N803
+        self.versioning = VersioningConfiguration["Status"]
+
+    def get_paginator(self, operation):
+        return SimpleNamespace(paginate=lambda **kwargs: iter([]))
+
+    def delete_bucket(self, Bucket):  # noqa: N803
+        raise ClientError({"Error": {"Code": "BucketNotEmpty", "Message": "producers"}}, "DeleteBucket")
+
+    def get_object_lock_configuration(self, Bucket):  # noqa: N803
+        raise ClientError({"Error": {"Code": "ObjectLockConfigurationNotFoundError"}}, "GetObjectLockConfiguration")
+
+
+def _sids(client):
+    return [s["Sid"] for s in json.loads(client.policy)["Statement"]]
+
+
+def test_freeze_and_thaw_restore_policy_and_versioning():
+    client = Client({"Version": "2012-10-17", "Statement": [OWN_STATEMENT]})
+
+    saved = freeze_writes(client, "b", "r")
+
+    assert _sids(client) == ["ReadOnly", FREEZE_SID]
+    assert client.versioning == "Suspended"
+    # A freeze left behind by an earlier run is not taken for the original policy
+    assert freeze_writes(client, "b", "r")["policy"] == saved["policy"]
+    assert _sids(client) == ["ReadOnly", FREEZE_SID]
+
+    thaw_writes(client, "b", saved, "r")
+    assert _sids(client) == ["ReadOnly"]
+    assert client.versioning == "Enabled"
+
+    unversioned = Client(versioning=None)
+    thaw_writes(unversioned, "b", freeze_writes(unversioned, "b", "r"), "r")
+    assert unversioned.policy is None
+    assert unversioned.versioning is None
+
+
+def test_aborted_cleanup_thaws_the_bucket(monkeypatch):
+    client = Client({"Version": "2012-10-17", "Statement": [OWN_STATEMENT]})
+    frozen_while_deleting = []
+    monkeypatch.setattr("costcutter.services.s3.buckets.get_client", lambda *a, **k: client)
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.get_reporter", lambda: SimpleNamespace(record=lambda *a, **k: None)
+    )
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.cleanup_objects",
+        lambda **kwargs: frozen_while_deleting.append(_sids(client)),
+    )
+    configure_s3_settings(S3Settings(freeze_writes=True))
+    try:
+        buckets.cleanup_bucket(object(), "r", "b", dry_run=False)  # type: ignore[arg-type]
+    finally:
+        configure_s3_settings(None)
+
+    assert frozen_while_deleting == [["ReadOnly", FREEZE_SID]]
+    assert _sids(client) == ["ReadOnly"]
+    assert client.versioning == "Enabled"
@@ -0,0 +1,165 @@
+"""Tests for costcutter.services.s3.listing"""
+
+from types import SimpleNamespace
+
+from botocore.exceptions import ClientError
+
+from costcutter.config import S3Settings
+from costcutter.services.s3 import buckets
+from costcutter.services.s3.listing import DISCOVERY_PAGES, Shard, discover_shards, sharded_catalog_objects
+from costcutter.services.s3.settings import configure_s3_settings
+
+KEYS = ["root.txt", "a/1", "a/2", "a/x/1", "b/1", "c/deep/1", "c/deep/2", "c/deep/3"]
+
+
+class Client:
+    """S3 client double serving ``list_object_versions`` for KEYS, two entries per page."""
+
+    def __init__(self, keys=KEYS):
+        self.keys = sorted(keys)
+        self.calls: list[dict] = []
+
+    def _entries(self, Prefix="", Delimiter=None, KeyMarker=None):  # noqa: N803
+        # Keys and rolled-up prefixes, in listing order
+        entries: list[str] = []
+        for key in self.keys:
+            if not key.startswith(Prefix):
+                continue
+            rest = key[len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                key = Prefix + rest.split(Delimiter)[0] + Delimiter
+            if (KeyMarker is None or key > KeyMarker) and key not in entries:
+                entries.append(key)
+        return entries
+
+    def list_object_versions(self, Bucket, Prefix="", Delimiter=None, KeyMarker=None, **kwargs):  # noqa: N803
+        self.calls.append({"Prefix": Prefix, "Delimiter": Delimiter, "KeyMarker": KeyMarker})
+        entries = self._entries(Prefix, Delimiter, KeyMarker)
+        page_entries = entries[:2]
+        rolled = [e for e in page_entries if Delimiter and e.endswith(Delimiter)]
+        page = {
+            "Versions": [{"Key": k, "VersionId": "v1"} for k in page_entries if k not in rolled],
+            "CommonPrefixes": [{"Prefix": p} for p in rolled],
+        }
+        if len(entries) > 2:
+            page.update(IsTruncated=True, NextKeyMarker=page_entries[-1], NextVersionIdMarker="v1")
+        return page
+
+    def get_paginator(self, operation):
+        client = self
+
+        class Paginator:
+            def paginate(self, **kwargs):
+                while True:
+                    page = client.list_object_versions(**kwargs)
+                    yield page
+                    if not page.get("IsTruncated"):
+                        return
+                    kwargs["KeyMarker"] = page["NextKeyMarker"]
+
+        return Paginator()
+
+
+def test_discover_shards_expands_prefixes_until_target():
+    assert discover_shards(Client(), "b", "r", 1) == [Shard("")]
+    assert discover_shards(Client(), "b", "r", 3) == [Shard("a/"), Shard("b/"), Shard("c/"), Shard("", "/")]
+    assert discover_shards(Client(), "b", "r", 6) == [
+        Shard("a/x/"),
+        Shard("c/deep/"),
+        Shard("b/"),
+        Shard("", "/"),
+        Shard("a/", "/"),
+        Shard("c/", "/"),
+    ]
+    # Keyspaces without a hierarchy cannot be split
+    assert discover_shards(Client(["k1", "k2"]), "b", "r", 8) == [Shard("")]
+
+
+def test_discovery_reads_a_few_pages_of_a_flat_bucket():
+    client = Client([f"k{n:03d}" for n in range(200)])
+
+    listed = list(sharded_catalog_objects(client, "b", "us-east-1", shards=8))
+
+    assert len(listed) == 200
+    discovery = [call for call in client.calls if call["Delimiter"]]
+    # Discovery stops after a few pages instead of walking the bucket before it is listed
+    assert len(discovery) == DISCOVERY_PAGES
+    assert len(client.calls) == DISCOVERY_PAGES + 100
+
+
+def test_discovery_does_not_expand_prefixes_it_could_not_fully_list():
+    # More top-level entries than discovery reads: the root stays one full shard
+    keys = [f"p{n:02d}/k" for n in range(2 * DISCOVERY_PAGES + 1)]
+    assert discover_shards(Client(keys), "b", "r", 4) == [Shard("")]
+
+
+def test_sharded_listing_yields_every_version_once():
+    client = Client()
+
+    listed = list(sharded_catalog_objects(client, "b", "us-east-1", shards=6, max_in_flight=3))
+
+    assert sorted(o["Key"] for o in listed) == sorted(KEYS)
+    assert all(o["VersionId"] == "v1" for o in listed)
+    # Long shards are paged with KeyMarker
+    assert {"Prefix": "c/deep/", "Delimiter": None, "KeyMarker": "c/deep/2"} in client.calls
+
+
+def test_failed_pages_are_retried_or_recorded(monkeypatch):
+    errors = {("c/deep/", "c/deep/2"): ["SlowDown", "InternalError"], ("b/", None): ["AccessDenied"] * 9}
+
+    class Failing(Client):
+        def list_object_versions(self, Bucket, Prefix="", Delimiter=None, KeyMarker=None, **kwargs):  # noqa: N803
+            pending = errors.get((Prefix, KeyMarker))
+            if pending and Delimiter is None:
+                self.calls.append({"Prefix": Prefix, "Delimiter": Delimiter, "KeyMarker": KeyMarker})
+                raise ClientError({"Error": {"Code": pending.pop(0), "Message": "nope"}}, "ListObjectVersions")
+            return super().list_object_versions(Bucket, Prefix, Delimiter, KeyMarker, **kwargs)
+
+    events = []
+    monkeypatch.setattr("costcutter.services.s3.listing.PAGE_RETRY_BASE_DELAY", 0.01)
+    monkeypatch.setattr(
+        "costcutter.services.s3.listing.get_reporter", lambda: SimpleNamespace(record=lambda *a, **k: events.append(k))
+    )
+    client = Failing()
+
+    listed = list(sharded_catalog_objects(client, "b", "us-east-1", shards=6, max_in_flight=3))
+
+    # The throttled page is listed again; the denied shard is reported once
+    assert sorted(o["Key"] for o in listed) == sorted(k for k in KEYS if not k.startswith("b/"))
+    assert client.calls.count({"Prefix": "c/deep/", "Delimiter": None, "KeyMarker": "c/deep/2"}) == 3
+    assert client.calls.count({"Prefix": "b/", "Delimiter": None, "KeyMarker": None}) == 1
+    assert events == [
+        {
+            "arn": "arn:aws:s3:::b/b/*",
+            "meta": {"status": "failed", "prefix": "b/", "error_code": "AccessDenied", "error_message": "nope"},
+        }
+    ]
+
+
+def test_bucket_cleanup_lists_configured_shards(monkeypatch):
+    class Bucket(Client):
+        def delete_objects(self, Bucket, Delete):  # noqa: N803
+            gone = {o["Key"] for o in Delete["Objects"]}
+            self.keys = [k for k in self.keys if k not in gone]
+            return {}
+
+        def delete_bucket(self, Bucket):  # noqa: N803
+            self.deleted = not self.keys
+
+        def get_object_lock_configuration(self, Bucket):  # noqa: N803
+            raise ClientError({"Error": {"Code": "ObjectLockConfigurationNotFoundError"}}, "GetObjectLockConfiguration")
+
+    client = Bucket()
+    monkeypatch.setattr("costcutter.services.s3.buckets.get_client", lambda *a, **k: client)
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.get_reporter", lambda: SimpleNamespace(record=lambda *a, **k: None)
+    )
+    configure_s3_settings(S3Settings(list_shards=4))
+    try:
+        buckets.cleanup_bucket(SimpleNamespace(), "r", "b", dry_run=False)  # type: ignore[arg-type]
+    finally:
+        configure_s3_settings(None)
+
+    assert client.deleted
+    # Each discovered prefix is listed as a shard of its own
+    assert {c["Prefix"] for c in client.calls if c["Delimiter"] is None} >= {"a/", "b/", "c/"}
@@ -0,0 +1,96 @@
+"""Tests for costcutter.services.s3.manifest"""
+
+import gzip
+from types import SimpleNamespace
+
+import pytest
+from botocore.exceptions import ClientError
+
+from costcutter.config import S3Settings
+from costcutter.services.s3 import buckets
+from costcutter.services.s3.manifest import find_manifest, read_manifest
+from costcutter.services.s3.settings import configure_s3_settings
+
+
+def test_plain_and_inventory_manifests_are_read(tmp_path):
+    plain = tmp_path / "buck.csv"
+    plain.write_text('Key,VersionId\na.txt,v1\n"b,c.txt"\nkey,v2\n\n')
+    headerless = tmp_path / "keys.csv"
+    headerless.write_text("buck,v1\nkey\n")
+    inventory = tmp_path / "inv.csv.gz"
+    with gzip.open(inventory, "wt") as fh:
+        fh.write('"buck","dir/my+file.txt","v9","true","false","12"\n"buck","x%2By","","true","false","1"\n')
+    (tmp_path / "empty.csv").write_bytes(b"")
+    schema = ["Bucket", "Key", "VersionId", "IsLatest", "IsDeleteMarker", "Size"]
+
+    assert list(read_manifest(plain)) == [
+        {"Key": "a.txt", "VersionId": "v1"},
+        {"Key": "b,c.txt", "VersionId": None},
+        {"Key": "key", "VersionId": "v2"},
+    ]
+    # Neither a key equal to the bucket name nor a key named "key" is taken for a header
+    assert list(read_manifest(headerless)) == [
+        {"Key": "buck", "VersionId": "v1"},
+        {"Key": "key", "VersionId": None},
+    ]
+    assert list(read_manifest(inventory, schema)) == [
+        {"Key": "dir/my file.txt", "VersionId": "v9"},
+        {"Key": "x+y", "VersionId": None},
+    ]
+    assert list(read_manifest(tmp_path / "empty.csv")) == []
+    assert find_manifest(tmp_path, "buck") == plain
+    assert find_manifest(tmp_path, "other") is None
+    assert find_manifest(None, "buck") is None
+
+
+def test_current_version_inventory_has_no_version_ids(tmp_path):
+    inventory = tmp_path / "inv.csv"
+    inventory.write_text("Bucket,Key,Size,ETag\nbuck,a%2Fb,12,abc\n")
+
+    assert list(read_manifest(inventory)) == [{"Key": "a/b", "VersionId": None}]
+    with pytest.raises(ValueError, match="no Key column"):
+        list(read_manifest(inventory, ["Bucket", "Size"]))
+
+
+def test_manifest_keys_are_deleted_before_one_verification_listing(monkeypatch, tmp_path):
+    (tmp_path / "buck.csv").write_text("".join(f"k{n}\n" for n in range(5)))
+    deleted: list[list[str]] = []
+    listings = []
+
+    class Client:
+        def get_object_lock_configuration(self, Bucket):  # noqa: N803
+            raise ClientError({"Error": {"Code": "ObjectLockConfigurationNotFoundError"}}, "GetObjectLockConfiguration")
+
+        def get_paginator(self, operation):
+            def paginate(**kwargs):
+                listings.append(operation)
+                if operation == "list_object_versions":
+                    # Written after the inventory was taken
+                    yield {"Versions": [{"Key": "late", "VersionId": "v"}]}
+
+            return SimpleNamespace(paginate=paginate)
+
+        def delete_objects(self, Bucket, Delete):  # noqa: N803
+            deleted.append([o["Key"] for o in Delete["Objects"]])
+            return {}
+
+        def delete_bucket(self, Bucket):  # noqa: N803
+            pass
+
+    monkeypatch.setattr("costcutter.services.s3.buckets.get_client", lambda *a, **k: Client())
+    events = []
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.get_reporter",
+        lambda: SimpleNamespace(record=lambda *a, **k: events.append((a, k))),
+    )
+    configure_s3_settings(S3Settings(manifest_dir=str(tmp_path)))
+    try:
+        buckets.cleanup_bucket(SimpleNamespace(), "r", "buck", dry_run=False)  # type: ignore[arg-type]
+    finally:
+        configure_s3_settings(None)
+
+    assert deleted == [["k0", "k1", "k2", "k3", "k4"], ["late"]]
+    assert listings.count("list_object_versions") == 1
+    # Manifest and verification listing share one summary
+    summaries = [k["meta"] for a, k in events if k.get("arn") == "arn:aws:s3:::buck/*"]
+    assert summaries == [{"status": "deleted", "objects": 6, "versions": 1, "bytes": 0, "failed": 0}]
@@ -0,0 +1,138 @@
+"""Tests for costcutter.services.s3.object_lock"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+from botocore.exceptions import ClientError
+
+from costcutter.services.s3 import buckets
+from costcutter.services.s3.object_lock import DELETABLE, LOCKED, PARTIAL, assess_object_lock
+
+
+def _missing(operation):
+    return ClientError({"Error": {"Code": "NoSuchObjectLockConfiguration"}}, operation)
+
+
+class Client:
+    """S3 client double with an Object Lock configuration and per-version locks."""
+
+    def __init__(self, config=None, retained=(), held=(), keys=("a", "b", "c"), denied=()):
+        self.config = config
+        self.retained = set(retained)
+        self.held = set(held)
+        self.keys = sorted(keys)
+        # Keys DeleteObjects refuses with AccessDenied
+        self.denied = set(denied)
+        self.listed = False
+        self.sent: list[str] = []
+
+    def get_object_lock_configuration(self, Bucket):  # noqa: N803
+        if self.config is None:
+            raise ClientError({"Error": {"Code": "ObjectLockConfigurationNotFoundError"}}, "GetObjectLockConfiguration")
+        return {"ObjectLockConfiguration": self.config}
+
+    def list_object_versions(self, Bucket, Prefix="", Delimiter=None, MaxKeys=1000, **kwargs):  # noqa: N803
+        keys = [k for k in self.keys if k.startswith(Prefix)]
+        prefixes = []
+        if Delimiter:
+            prefixes = sorted({
+                Prefix + k[len(Prefix) :].split(Delimiter)[0] + Delimiter for k in keys if Delimiter in k[len(Prefix) :]
+            })
+            keys = [k for k in keys if Delimiter not in k[len(Prefix) :]]
+        return {
+            "Versions": [{"Key": k, "VersionId": "v"} for k in keys][:MaxKeys],
+            "CommonPrefixes": [{"Prefix": p} for p in prefixes],
+        }
+
+    def get_object_retention(self, Bucket, Key, VersionId):  # noqa: N803
+        if Key not in self.retained:
+            raise _missing("GetObjectRetention")
+        return {"Retention": {"Mode": "GOVERNANCE", "RetainUntilDate": datetime.now(UTC) + timedelta(days=1)}}
+
+    def get_object_legal_hold(self, Bucket, Key, VersionId):  # noqa: N803
+        if Key not in self.held:
+            raise _missing("GetObjectLegalHold")
+        return {"LegalHold": {"Status": "ON"}}
+
+    def get_paginator(self, operation):
+        def paginate(**kwargs):
+            if operation == "list_object_versions" and kwargs.get("Delimiter"):
+                # Shard discovery
+                return iter([self.list_object_versions(**kwargs)])
+            self.listed = True
+            return iter([self.list_object_versions(**kwargs)] if operation == "list_object_versions" else [])
+
+        return SimpleNamespace(paginate=paginate)
+
+    def delete_objects(self, Bucket, Delete):  # noqa: N803
+        self.sent += [entry["Key"] for entry in Delete["Objects"]]
+        denied = [entry for entry in Delete["Objects"] if entry["Key"] in self.denied]
+        return {"Errors": [{**entry, "Code": "AccessDenied", "Message": "locked"} for entry in denied]}
+
+
+ENABLED = {"ObjectLockEnabled": "Enabled"}
+COMPLIANCE = {**ENABLED, "Rule": {"DefaultRetention": {"Mode": "COMPLIANCE", "Days": 30}}}
+
+
+def test_buckets_are_classified_from_configuration_and_sampled_versions():
+    assert assess_object_lock(Client(), "b", "r").status == DELETABLE
+    assert assess_object_lock(Client(ENABLED), "b", "r").status == DELETABLE
+    assert assess_object_lock(Client(ENABLED, retained={"a"}, held={"b"}, keys=("a", "b")), "b", "r").status == LOCKED
+    partial = assess_object_lock(Client(ENABLED, held={"c"}), "b", "r")
+    assert partial.status == PARTIAL
+    assert partial.reason == "1 of 3 sampled versions under retention or legal hold"
+
+
+def test_default_compliance_retention_alone_does_not_lock_the_bucket():
+    # The default only applies to new uploads; the existing versions may be past it
+    assert assess_object_lock(Client(COMPLIANCE), "b", "r").status == DELETABLE
+    assert assess_object_lock(Client(COMPLIANCE, retained={"a", "b", "c"}), "b", "r").status == LOCKED
+
+
+def test_locked_versions_late_in_the_key_space_are_sampled():
+    keys = [f"data/{n:03d}" for n in range(100)] + ["logs/1", "vault/1", "vault/2"]
+    assessment = assess_object_lock(Client(ENABLED, retained={"vault/1", "vault/2"}, keys=keys), "b", "r")
+
+    assert assessment.status == PARTIAL
+    assert assessment.locked_prefixes == ("vault/",)
+
+
+def test_locked_bucket_is_skipped_before_listing(monkeypatch):
+    client = Client(COMPLIANCE, retained={"a", "b", "c"})
+    recorded = []
+    monkeypatch.setattr("costcutter.services.s3.buckets.get_client", lambda *a, **k: client)
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.get_reporter",
+        lambda: SimpleNamespace(record=lambda *a, **k: recorded.append(k)),
+    )
+
+    assert buckets.cleanup_bucket(object(), "r", "b", dry_run=False) is False  # type: ignore[arg-type]
+
+    assert client.listed is False
+    assert recorded[-1]["meta"]["status"] == "skipped"
+
+
+def test_partial_bucket_leaves_locked_versions_out_of_the_deletion(monkeypatch):
+    data = [f"data/{n:02d}" for n in range(20)]
+    # data/15 is held too, but the probe only sampled the first half of its prefix
+    client = Client(
+        ENABLED,
+        retained={"vault/1"},
+        held={"data/15"},
+        keys=[*data, "vault/1", "vault/2"],
+        denied={"data/15", "vault/1"},
+    )
+    recorded = []
+    monkeypatch.setattr("costcutter.services.s3.buckets.get_client", lambda *a, **k: client)
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.get_reporter",
+        lambda: SimpleNamespace(record=lambda *a, **k: recorded.append((a, k))),
+    )
+
+    assert buckets.cleanup_bucket(object(), "r", "b", dry_run=False) is False  # type: ignore[arg-type]
+
+    assert client.sent == data
+    assert not [k for a, k in recorded if a[2] == "object" and k["meta"].get("key")]
+    (summary,) = [k["meta"] for a, k in recorded if a[2] == "object"]
+    assert (summary["objects"], summary["failed"], summary["locked"]) == (19, 0, 1)
+    assert recorded[-1][1]["meta"]["status"] == "partial"
@@ -0,0 +1,98 @@
+"""Tests for costcutter.services.s3.regions"""
+
+import json
+
+from botocore.exceptions import ClientError
+
+from costcutter.services.s3 import buckets
+from costcutter.services.s3.regions import BucketRegionIndex, configure_bucket_region_index
+
+
+class Client:
+    """S3 client double: paginated ListBuckets with some regions missing."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def can_paginate(self, operation):
+        return operation == "list_buckets"
+
+    def get_paginator(self, operation):
+        client = self
+
+        class Paginator:
+            def paginate(self, PaginationConfig):  # noqa: N803
+                client.calls.append("list_buckets")
+                yield {"Buckets": [{"Name": "listed", "BucketRegion": "eu-west-1"}, {"Name": "moved"}]}
+                yield {"Buckets": [{"Name": "legacy"}, {"Name": "broken"}]}
+
+        return Paginator()
+
+    def head_bucket(self, Bucket):  # noqa: N803
+        self.calls.append(f"head_bucket:{Bucket}")
+        if Bucket == "moved":
+            # Buckets in another region answer with a redirect carrying their region
+            raise ClientError(
+                {
+                    "Error": {"Code": "301", "Message": "Moved Permanently"},
+                    "ResponseMetadata": {"HTTPHeaders": {"x-amz-bucket-region": "ap-south-1"}},
+                },
+                "HeadBucket",
+            )
+        raise ClientError({"Error": {"Code": "403", "Message": "Forbidden"}}, "HeadBucket")
+
+    def get_bucket_location(self, Bucket):  # noqa: N803
+        self.calls.append(f"get_bucket_location:{Bucket}")
+        if Bucket == "broken":
+            raise ClientError({"Error": {"Code": "AccessDenied", "Message": "no"}}, "GetBucketLocation")
+        return {"LocationConstraint": None}
+
+
+class Session:
+    def __init__(self, client):
+        self._client = client
+
+    def client(self, service_name=None, region_name=None, **kwargs):
+        return self._client
+
+
+def test_index_is_built_once_for_all_regions(monkeypatch):
+    client = Client()
+    session = Session(client)
+    configure_bucket_region_index(session)
+
+    found = {region: buckets.catalog_buckets(session, region) for region in ["eu-west-1", "ap-south-1", "us-east-1"]}
+
+    assert found == {"eu-west-1": ["listed"], "ap-south-1": ["moved"], "us-east-1": ["legacy"]}
+    assert client.calls.count("list_buckets") == 1
+    # Only buckets without a listed region are looked up, GetBucketLocation only after HeadBucket failed
+    assert sorted(c for c in client.calls if c != "list_buckets") == [
+        "get_bucket_location:broken",
+        "get_bucket_location:legacy",
+        "head_bucket:broken",
+        "head_bucket:legacy",
+        "head_bucket:moved",
+    ]
+
+
+def test_index_is_persisted_and_reused_until_ttl(monkeypatch, tmp_path):
+    monkeypatch.setattr("costcutter.services.s3.regions._get_account_id", lambda session: "123456789012")
+    cache = tmp_path / "regions.json"
+
+    first = BucketRegionIndex(Session(Client()), cache_path=cache, cache_ttl=60)
+    assert first.buckets_in("eu-west-1") == ["listed"]
+    first.discard("legacy")
+    first.save()
+    stored = json.loads(cache.read_text())["123456789012"]["regions"]
+    assert stored == {"listed": "eu-west-1", "moved": "ap-south-1"}
+
+    client = Client()
+    second = BucketRegionIndex(Session(client), cache_path=cache, cache_ttl=60)
+    assert second.buckets_in("ap-south-1") == ["moved"]
+    assert client.calls == []
+    assert second.stats["cache_hit"] == 1
+
+    expired = BucketRegionIndex(Session(client), cache_path=cache, cache_ttl=60)
+    monkeypatch.setattr("costcutter.services.s3.regions.time.time", lambda: 10**12)
+    assert expired.buckets_in("us-east-1") == ["legacy"]
+    assert client.calls.count("list_buckets") == 1
@@ -0,0 +1,159 @@
+"""Tests for costcutter.services.s3.sampling"""
+
+import bisect
+import random
+from types import SimpleNamespace
+
+from costcutter.config import S3Settings
+from costcutter.services.s3 import buckets
+from costcutter.services.s3.sampling import END_PROBES, SHARD_PAGES, estimate_bucket
+from costcutter.services.s3.settings import configure_s3_settings
+
+
+class Bucket:
+    """Sorted keys served through ListObjectVersions with Prefix/Delimiter/KeyMarker/MaxKeys semantics."""
+
+    def __init__(self, keys):
+        self.keys = sorted(set(keys))
+        self.calls = 0
+
+    def list_object_versions(
+        self,
+        Bucket,  # noqa: N803
+        Prefix="",  # noqa: N803
+        Delimiter=None,  # noqa: N803
+        KeyMarker=None,  # noqa: N803
+        VersionIdMarker=None,  # noqa: N803
+        MaxKeys=1000,  # noqa: N803
+    ):
+        self.calls += 1
+        i = bisect.bisect_right(self.keys, KeyMarker) if KeyMarker else bisect.bisect_left(self.keys, Prefix)
+        versions, prefixes, last = [], [], None
+        while i < len(self.keys) and self.keys[i].startswith(Prefix):
+            if len(versions) + len(prefixes) == MaxKeys:
+                return {
+                    "Versions": versions,
+                    "CommonPrefixes": prefixes,
+                    "IsTruncated": True,
+                    "NextKeyMarker": last,
+                    "NextVersionIdMarker": "v",
+                }
+            rest = self.keys[i][len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                # Roll the keys under the next delimiter up into one common prefix
+                last = Prefix + rest[: rest.index(Delimiter) + 1]
+                prefixes.append({"Prefix": last})
+                i = bisect.bisect_left(self.keys, last + "\U0010ffff")
+            else:
+                last = self.keys[i]
+                versions.append({"Key": last, "VersionId": "v", "IsLatest": True, "Size": 10})
+                i += 1
+        return {"Versions": versions, "CommonPrefixes": prefixes}
+
+    def get_paginator(self, operation):
+        def paginate(**kwargs):
+            while True:
+                page = self.list_object_versions(**kwargs)
+                yield page
+                if not page.get("IsTruncated"):
+                    return
+                kwargs["KeyMarker"] = page["NextKeyMarker"]
+
+        return SimpleNamespace(paginate=paginate)
+
+
+def _date_partitioned(files_per_day):
+    return [
+        f"logs/2024/{month:02d}/{day:02d}/file-{n}.gz"
+        for month in range(1, 13)
+        for day in range(1, 29)
+        for n in range(files_per_day())
+    ]
+
+
+def test_small_bucket_is_counted_exactly():
+    client = Bucket(f"k{n}" for n in range(1500))
+
+    estimate = estimate_bucket(client, "buck", "r", delete_workers=2)
+
+    assert estimate == {"objects": 1500, "versions": 1500, "bytes": 15000, "exact": True, "projected_seconds": 0.8}
+    assert client.calls == 2
+
+
+def test_bucket_whose_shards_fit_their_pages_is_counted_exactly():
+    keys = _date_partitioned(lambda: 10)
+    client = Bucket(keys)
+
+    estimate = estimate_bucket(client, "buck", "r", positions=16)
+
+    assert estimate["exact"]
+    assert estimate["versions"] == len(keys)
+    # Two pages, the shard discovery, then the 12 month shards, each in one page
+    assert client.calls <= 2 + 6 + 12
+
+
+def test_partitioned_buckets_are_estimated_closely():
+    rng = random.Random(7)
+    layouts = {
+        "date partitioned": _date_partitioned(lambda: rng.randint(250, 350)),
+        "tables": [
+            f"warehouse/{table}/dt=2024-{month:02d}-{day:02d}/part-{n:05d}.parquet"
+            for table in ("clicks", "orders", "sessions", "users")
+            for month in range(1, 13)
+            for day in range(1, 29)
+            for n in range(rng.randint(40, 80))
+        ],
+        "tenants": [
+            f"tenants/{tenant:04d}/{kind}/{n}.json"
+            for tenant in range(300)
+            for kind in ("docs", "images")
+            for n in range(rng.randint(100, 300))
+        ],
+    }
+    for name, keys in layouts.items():
+        client = Bucket(keys)
+        estimate = estimate_bucket(client, "buck", "r")
+
+        actual = len(client.keys)
+        assert not estimate["exact"], name
+        assert 0.8 * actual < estimate["versions"] < 1.2 * actual, name
+        assert abs(estimate["bytes"] - estimate["versions"] * 10) <= 10
+        # Two pages and the shard discovery, then at most the sampling budget of each of the 8 shards
+        assert client.calls <= 2 + 6 + 8 * (2 + END_PROBES + SHARD_PAGES), name
+
+
+def test_flat_buckets_are_estimated_within_the_probe_budget():
+    rng = random.Random(7)
+    layouts = {
+        "one prefix": [f"logs/2024/{rng.randrange(10**9):09d}.gz" for _ in range(100_000)],
+        "two prefixes": [f"a/{n}" for n in range(40_000)] + [f"z/{n}" for n in range(40_000)],
+        "hex": [f"{n:08x}" for n in range(120_000)],
+        "uuid": [f"{rng.getrandbits(128):032x}" for _ in range(150_000)],
+    }
+    for name, keys in layouts.items():
+        client = Bucket(keys)
+        estimate = estimate_bucket(client, "buck", "r", positions=4)
+
+        actual = len(client.keys)
+        assert not estimate["exact"], name
+        assert actual / 2 < estimate["versions"] < actual * 2, name
+        assert client.calls <= 2 + 6 + 4 * (2 + END_PROBES + SHARD_PAGES), name
+
+
+def test_dry_run_records_an_estimate(monkeypatch):
+    records = []
+    monkeypatch.setattr("costcutter.services.s3.buckets.get_client", lambda *a, **k: Bucket(["a", "b"]))
+    monkeypatch.setattr(
+        "costcutter.services.s3.buckets.get_reporter",
+        lambda: SimpleNamespace(record=lambda *a, **k: records.append((a, k))),
+    )
+    configure_s3_settings(S3Settings(dry_run_estimate=True))
+    try:
+        assert buckets.cleanup_bucket(SimpleNamespace(), "r", "buck", dry_run=True) is False  # type: ignore[arg-type]
+    finally:
+        configure_s3_settings(None)
+
+    (args, kwargs) = records[-1]
+    assert args[3] == "estimate"
+    assert kwargs["meta"]["versions"] == 2
+    assert kwargs["meta"]["exact"] is True
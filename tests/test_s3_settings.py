@@ -0,0 +1,108 @@
+"""Tests for costcutter.services.s3.settings, through a full run configured from a file"""
+
+from pathlib import Path
+
+from botocore.exceptions import ClientError
+
+from costcutter import orchestrator
+from costcutter.config import load_config
+from costcutter.reporter import get_reporter
+from costcutter.services.s3 import buckets
+from costcutter.services.s3.settings import configure_s3_settings, get_s3_settings
+
+
+def _error(code, operation):
+    return ClientError({"Error": {"Code": code}}, operation)
+
+
+class Account:
+    """In-memory S3 account in us-east-1 behind the calls of the S3 handler (one client for every service)."""
+
+    def __init__(self, contents):
+        self.buckets = {name: sorted(keys) for name, keys in contents.items()}
+
+    def client(self, service_name, **kwargs):
+        return self
+
+    def get_available_regions(self, service_name):
+        return ["us-east-1"]
+
+    def get_caller_identity(self):
+        return {"Account": "123456789012"}
+
+    def list_buckets(self):
+        return {"Buckets": [{"Name": name, "BucketRegion": "us-east-1"} for name in self.buckets]}
+
+    def list_object_versions(self, Bucket, **kwargs):  # noqa: N803
+        return {"Versions": [{"Key": k, "VersionId": "v1", "Size": 1} for k in self.buckets[Bucket]]}
+
+    def get_paginator(self, operation):
+        account = self
+
+        class Paginator:
+            def paginate(self, **kwargs):
+                if operation == "list_object_versions":
+                    yield account.list_object_versions(**kwargs)
+                elif operation == "get_metric_data":
+                    yield account._metric_data(kwargs["MetricDataQueries"])
+                else:
+                    # list_objects_v2, list_multipart_uploads: nothing beyond the versions
+                    yield {}
+
+        return Paginator()
+
+    def _metric_data(self, queries):
+        results = []
+        for query in queries:
+            name = query["MetricStat"]["Metric"]["Dimensions"][0]["Value"]
+            count = len(self.buckets.get(name, []))
+            results.append({"Id": query["Id"], "Values": [float(count)]})
+        return {"MetricDataResults": results}
+
+    def delete_objects(self, Bucket, Delete):  # noqa: N803
+        gone = {entry["Key"] for entry in Delete["Objects"]}
+        self.buckets[Bucket] = [k for k in self.buckets[Bucket] if k not in gone]
+        return {}
+
+    def delete_bucket(self, Bucket):  # noqa: N803
+        if self.buckets[Bucket]:
+            raise _error("BucketNotEmpty", "DeleteBucket")
+        del self.buckets[Bucket]
+
+    def get_object_lock_configuration(self, Bucket):  # noqa: N803
+        raise _error("ObjectLockConfigurationNotFoundError", "GetObjectLockConfiguration")
+
+
+def _run(monkeypatch, tmp_path: Path, account: Account, s3: str, dry_run: bool = False) -> dict:
+    """Run the S3 service end to end with ``aws.s3`` read from a config file."""
+    config_file = tmp_path / "costcutter.yaml"
+    config_file.write_text(
+        f"aws:\n  services: [s3]\n  region: [us-east-1]\n  s3:\n{s3}",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(orchestrator, "load_config", lambda: load_config(config_file=config_file))
+    monkeypatch.setattr(orchestrator, "create_aws_session", lambda config: account)
+    get_reporter().clear()
+    try:
+        return orchestrator.orchestrate_services(dry_run=dry_run)
+    finally:
+        configure_s3_settings(None)
+
+
+def test_configured_settings_reach_the_bucket_handler(monkeypatch, tmp_path):
+    seen = []
+    cleanup_buckets = buckets.cleanup_buckets
+
+    def spy(**kwargs):
+        seen.append(get_s3_settings())
+        return cleanup_buckets(**kwargs)
+
+    monkeypatch.setitem(orchestrator.RESOURCE_HANDLER_GETTERS, "s3", lambda resource_type: spy)
+    account = Account({"logs": [f"k{n}" for n in range(5)]})
+
+    _run(monkeypatch, tmp_path, account, "    delete_workers: 7\n    list_shards: 3\n    object_lock_check: false\n")
+
+    assert [(s.delete_workers, s.list_shards, s.object_lock_check) for s in seen] == [(7, 3, False)]
+    assert "logs" not in account.buckets
+    # The run's settings do not outlive it
+    assert get_s3_settings().delete_workers == 4
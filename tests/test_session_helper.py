@@ -111,3 +111,27 @@ def test_create_session_when_config_missing_aws(monkeypatch: pytest.MonkeyPatch)
 
     assert isinstance(sess, DummySession)
     assert "region" not in captured["kwargs"]
+
+
+def test_build_client_config_uses_aws_settings():
+    cfg = Config({
+        "aws": {
+            "resource_max_workers": 40,
+            "connect_timeout": 3,
+            "read_timeout": 20,
+            "retry_mode": "adaptive",
+            "max_attempts": 7,
+        }
+    })
+
+    client_config = session_helper.build_client_config(cfg)
+
+    assert client_config.max_pool_connections == 40
+    assert client_config.connect_timeout == 3
+    assert client_config.read_timeout == 20
+    assert client_config.retries == {"mode": "adaptive", "max_attempts": 7}
+
+
+def test_build_client_config_keeps_botocore_minimum_pool_size():
+    cfg = Config({"aws": {"resource_max_workers": 2}})
+    assert session_helper.build_client_config(cfg).max_pool_connections == 10